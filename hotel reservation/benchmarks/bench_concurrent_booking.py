@@ -0,0 +1,83 @@
+"""
+Test obciążeniowy rezerwacji z wielu wątków.
+
+Każdy wątek rezerwuje własną pulę terminów, a dodatkowo wszystkie wątki
+próbują zarezerwować te same, konfliktujące terminy. Po zakończeniu
+sprawdzana jest spójność: brak zdublowanych numerów rezerwacji i dokładnie
+jedna udana rezerwacja dla każdego konfliktującego klucza.
+
+Uruchomienie (z katalogu "hotel reservation"):
+    python -m benchmarks.bench_concurrent_booking --threads 8 --bookings 5000
+"""
+
+import argparse
+import threading
+import time
+from datetime import date as Date, timedelta
+
+from src.locking import ConcurrentReservationManagement
+
+
+def run(threads: int, bookings: int):
+    """
+    Uruchamia test obciążeniowy.
+
+    Args:
+        threads (int): Liczba wątków
+        bookings (int): Liczba rezerwacji wykonywanych przez każdy wątek
+
+    Returns:
+        dict: Wyniki testu
+    """
+    manager = ConcurrentReservationManagement()
+    start_day = Date(2026, 1, 1)
+    dates = [(start_day + timedelta(days=day)).isoformat() for day in range(365)]
+    conflicts = [0] * threads
+    barrier = threading.Barrier(threads)
+
+    def worker(index: int):
+        user_id = index + 1
+        barrier.wait()
+        for i in range(bookings):
+            manager.booking(user_id, f"user{user_id}", (start_day + timedelta(days=i)).isoformat(), 1)
+            try:
+                manager.booking(1_000_000, "shared", dates[i % len(dates)], 1)
+            except ValueError:
+                conflicts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    reservations = manager.reservations
+    numbers = [reservation.reservation_number for reservation in reservations]
+    shared = manager.userReservation(1_000_000)
+    expected_shared = min(bookings, len(dates))
+    return {
+        "threads": threads,
+        "operations": threads * bookings * 2,
+        "seconds": elapsed,
+        "operations_per_second": threads * bookings * 2 / elapsed,
+        "reservations": len(reservations),
+        "unique_numbers": len(set(numbers)) == len(numbers),
+        "shared_bookings_ok": len(shared) == expected_shared,
+        "rejected_conflicts": sum(conflicts),
+    }
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--bookings", type=int, default=2000)
+    args = parser.parse_args()
+    for key, value in run(args.threads, args.bookings).items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
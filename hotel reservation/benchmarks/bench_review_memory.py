@@ -0,0 +1,116 @@
+"""
+Pomiar pamięci zajmowanej przez recenzje z komentarzami zwykłymi i skompresowanymi.
+
+Uruchomienie (z katalogu "hotel reservation"):
+    python -m benchmarks.bench_review_memory --reviews 100000
+"""
+
+import argparse
+import random
+import tracemalloc
+
+from src.compression import CommentArena, build_dictionary
+from src.reviews import CompressedReview, Review, Reviews
+
+PHRASES = [
+    "the room was clean", "friendly staff", "breakfast was great", "noisy street at night",
+    "comfortable bed", "excellent location near the beach", "parking was expensive",
+    "wifi did not work", "would stay again", "the pool was closed", "quiet and cozy",
+    "great value for money", "small bathroom", "amazing view from the balcony",
+]
+
+
+def comments(count: int, seed: int):
+    """Generuje komentarze złożone z typowych fraz."""
+    generator = random.Random(seed)
+    return [
+        ", ".join(generator.sample(PHRASES, generator.randint(2, 6))).capitalize() + "."
+        for _ in range(count)
+    ]
+
+
+class DictReview:
+    """Recenzja z atrybutami w słowniku instancji, jak przed wprowadzeniem __slots__."""
+
+    def __init__(self, id: int, stars: int, comment: str):
+        self.id = id
+        self.stars = stars
+        self.comment = comment
+
+
+def measure_records(encoded, factory):
+    """
+    Mierzy pamięć samych rekordów recenzji (bez indeksów systemu recenzji).
+
+    Args:
+        encoded (list): Komentarze zakodowane w UTF-8
+        factory (callable): Funkcja tworząca rekord z (id, ocena, komentarz)
+
+    Returns:
+        int: Liczba bajtów na recenzję
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = {
+        review_id: factory(review_id, review_id % 5 + 1, raw.decode("utf-8"))
+        for review_id, raw in enumerate(encoded, start=1)
+    }
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del records
+    return used // len(encoded)
+
+
+def measure(encoded, compress: bool, dictionary: bytes = b""):
+    """
+    Mierzy pamięć zaalokowaną podczas wypełniania systemu recenzji.
+
+    Komentarze są dekodowane w trakcie pomiaru, tak jak teksty przychodzące
+    z żądań, więc w trybie zwykłym ich kopie są wliczane do wyniku. Pomiar
+    obejmuje także indeksy wyszukiwania i sortowania, które są takie same
+    w obu trybach.
+
+    Args:
+        encoded (list): Komentarze zakodowane w UTF-8
+        compress (bool): Czy kompresować komentarze
+        dictionary (bytes): Słownik kompresji
+
+    Returns:
+        int: Liczba bajtów na recenzję
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    manager = Reviews(compress_comments=compress, dictionary=dictionary)
+    for review_id, raw in enumerate(encoded, start=1):
+        manager.add_review(review_id, review_id % 5 + 1, raw.decode("utf-8"))
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used // len(encoded)
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reviews", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    texts = comments(args.reviews, args.seed)
+    encoded = [text.encode("utf-8") for text in texts]
+    dictionary = build_dictionary(texts[:1000])
+    print(f"reviews: {args.reviews}")
+    print(f"average_comment_length: {sum(map(len, encoded)) // len(encoded)}")
+    arena = CommentArena(dictionary)
+    print("records (bytes per review):")
+    print(f"  dict_attributes: {measure_records(encoded, DictReview)}")
+    print(f"  slotted: {measure_records(encoded, Review)}")
+    print(f"  slotted_compressed: "
+          f"{measure_records(encoded, lambda *row: CompressedReview(*row, arena))}")
+    print("reviews manager with indexes (bytes per review):")
+    print(f"  plain: {measure(encoded, False)}")
+    print(f"  compressed: {measure(encoded, True)}")
+    print(f"  compressed_with_dictionary: {measure(encoded, True, dictionary)}")
+
+
+if __name__ == "__main__":
+    main()
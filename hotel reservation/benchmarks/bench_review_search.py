@@ -0,0 +1,84 @@
+"""
+Porównanie wyszukiwania w komentarzach: indeks odwrócony a pełne przeszukanie.
+
+Uruchomienie (z katalogu "hotel reservation"):
+    python -m benchmarks.bench_review_search --reviews 100000
+"""
+
+import argparse
+import random
+import time
+
+from src.reviews import Reviews
+from src.search import tokenize
+
+WORDS = [
+    "breakfast", "noisy", "quiet", "clean", "dirty", "friendly", "staff", "room",
+    "pool", "view", "parking", "wifi", "bed", "comfortable", "location", "price",
+    "dinner", "spa", "beach", "old", "new", "small", "large", "cold", "warm",
+]
+
+
+def naive_search(manager: Reviews, query: str):
+    """Wyszukuje recenzje przez przejrzenie wszystkich komentarzy (tryb AND)."""
+    tokens = tokenize(query)
+    matches = [
+        review for review in manager.reviews_list.values()
+        if tokens <= tokenize(review.comment)
+    ]
+    return sorted(matches, key=lambda review: (-review.stars, review.id))
+
+
+def run(reviews: int, queries: int, seed: int):
+    """
+    Uruchamia porównanie.
+
+    Args:
+        reviews (int): Liczba recenzji
+        queries (int): Liczba zapytań
+        seed (int): Ziarno generatora liczb losowych
+
+    Returns:
+        dict: Czasy obu metod w sekundach
+    """
+    generator = random.Random(seed)
+    manager = Reviews()
+    started = time.perf_counter()
+    for review_id in range(1, reviews + 1):
+        comment = " ".join(generator.choices(WORDS, k=8))
+        manager.add_review(review_id, generator.randint(1, 5), comment)
+    build = time.perf_counter() - started
+
+    workload = [" ".join(generator.sample(WORDS, 2)) for _ in range(queries)]
+    started = time.perf_counter()
+    indexed = [manager.search(query) for query in workload]
+    indexed_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    naive = [naive_search(manager, query) for query in workload]
+    naive_time = time.perf_counter() - started
+
+    assert [[r.id for r in page] for page in indexed] == [[r.id for r in page] for page in naive]
+    return {
+        "reviews": reviews,
+        "queries": queries,
+        "build_seconds": build,
+        "indexed_seconds": indexed_time,
+        "naive_seconds": naive_time,
+        "speedup": naive_time / indexed_time if indexed_time else float("inf"),
+    }
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reviews", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for key, value in run(args.reviews, args.queries, args.seed).items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
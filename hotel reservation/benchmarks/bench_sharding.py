@@ -0,0 +1,68 @@
+"""
+Skalowanie przepustowości rezerwacji z liczbą procesów roboczych.
+
+Rezerwacje są wysyłane partiami przez ShardedReservationManagement.bookMany
+dla rosnącej liczby shardów; dla porównania mierzony jest też pojedynczy
+ReservationManagement w bieżącym procesie. Skalowanie jest ograniczone
+liczbą rdzeni maszyny oraz kosztem serializacji w procesie routera.
+
+Uruchomienie (z katalogu "hotel reservation"):
+    python -m benchmarks.bench_sharding --bookings 200000 --shards 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.datagen import generate
+from src.reservation import ReservationManagement
+from src.sharding import ShardedReservationManagement
+
+
+def batches(rows, size: int):
+    """Dzieli wiersze na partie o podanym rozmiarze."""
+    return [rows[start:start + size] for start in range(0, len(rows), size)]
+
+
+def run_in_process(rows, batch: int):
+    """Mierzy przepustowość pojedynczego menedżera w bieżącym procesie."""
+    manager = ReservationManagement()
+    started = time.perf_counter()
+    for part in batches(rows, batch):
+        manager.bookMany(part)
+    return len(rows) / (time.perf_counter() - started)
+
+
+def run_sharded(rows, batch: int, shards: int):
+    """Mierzy przepustowość routera z podaną liczbą shardów."""
+    with ShardedReservationManagement(shards=shards) as manager:
+        started = time.perf_counter()
+        for part in batches(rows, batch):
+            manager.bookMany(part)
+        return len(rows) / (time.perf_counter() - started)
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bookings", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = generate(args.users, args.bookings, 0, seed=args.seed).bookings
+    print(f"cpu_count: {os.cpu_count()}")
+    baseline = run_in_process(rows, args.batch)
+    print(f"in_process_bookings_per_second: {baseline:.0f}")
+    single = None
+    for shards in args.shards:
+        throughput = run_sharded(rows, args.batch, shards)
+        single = single or throughput
+        print(f"shards_{shards}_bookings_per_second: {throughput:.0f} "
+              f"(x{throughput / single:.2f} vs 1 shard)")
+
+
+if __name__ == "__main__":
+    main()
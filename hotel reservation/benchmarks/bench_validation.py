@@ -0,0 +1,77 @@
+"""
+Mikrobenchmark walidacji danych rezerwacji.
+
+Porównuje dawną ścieżkę (re.match z wzorcami podawanymi jako tekst, osobne
+parsowanie daty przy każdym użyciu) z modułem src.validation (wzorce
+skompilowane raz, data zamieniana na numer dnia raz i zapamiętywana w LRU).
+
+Uruchomienie (z katalogu "hotel reservation"):
+    python -m benchmarks.bench_validation --rows 100000
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import date as Date, timedelta
+
+from src.validation import validate_booking
+
+
+def legacy_validate(id, user, date, beds, nights):
+    """Walidacja w postaci sprzed wprowadzenia src.validation."""
+    if id is None or not isinstance(id, int) or id <= 0:
+        raise ValueError("User ID must be a valid integer.")
+    if not isinstance(user, str) or not user:
+        raise ValueError("User name must be a valid string.")
+    if not re.match(r"^[a-zA-Z0-9]+$", user):
+        raise ValueError("User name must contain only letters and numbers.")
+    if not isinstance(date, str) or not date:
+        raise ValueError("Date must be a valid string in 'YYYY-MM-DD' format.")
+    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+        raise ValueError("Date must be a valid string in 'YYYY-MM-DD' format.")
+    if beds is None or not isinstance(beds, int) or beds <= 0:
+        raise ValueError("Number of beds must be a valid integer.")
+    if nights is None or not isinstance(nights, int) or nights <= 0:
+        raise ValueError("Number of nights must be a valid integer.")
+    # indeksy i licznik łóżek parsowały datę ponownie przy każdym użyciu
+    return Date.fromisoformat(date).toordinal()
+
+
+def measure(function, rows, repeat: int):
+    """Zwraca najlepszy czas walidacji wszystkich wierszy w sekundach."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            function(*row)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    first = Date(2026, 1, 1)
+    dates = [(first + timedelta(days=day)).isoformat() for day in range(args.days)]
+    rows = [
+        (n % 1000 + 1, f"user{n % 1000 + 1}", generator.choice(dates), 2, 1)
+        for n in range(args.rows)
+    ]
+    legacy = measure(legacy_validate, rows, args.repeat)
+    current = measure(validate_booking, rows, args.repeat)
+    print(f"rows: {args.rows}")
+    print(f"legacy_ns_per_row: {legacy / args.rows * 1e9:.0f}")
+    print(f"validation_ns_per_row: {current / args.rows * 1e9:.0f}")
+    print(f"speedup: {legacy / current:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Generator syntetycznych danych dla benchmarków systemu hotelowego.
+
+Dane są w pełni wyznaczone przez parametry i ziarno, więc kolejne
+uruchomienia benchmarków pracują na identycznym zbiorze.
+"""
+
+import random
+from datetime import date as Date, timedelta
+
+WORDS = [
+    "room", "clean", "quiet", "noisy", "breakfast", "staff", "friendly", "pool",
+    "view", "parking", "wifi", "bed", "comfortable", "location", "price", "beach",
+]
+
+
+class Dataset:
+    """
+    Zbiór syntetycznych danych wejściowych.
+
+    Attributes:
+        users (list): Krotki (email, hasło) dla UserManagement.addUser
+        bookings (list): Krotki (id, user, date, beds, nights) dla ReservationManagement.booking
+        reviews (list): Krotki (id, stars, comment) dla Reviews.add_review
+        dates (list): Daty, na które rozkładane są rezerwacje
+    """
+
+    def __init__(self, users, bookings, reviews, dates):
+        """
+        Inicjalizuje zbiór danych.
+
+        Args:
+            users (list): Krotki (email, hasło)
+            bookings (list): Krotki (id, user, date, beds, nights)
+            reviews (list): Krotki (id, stars, comment)
+            dates (list): Daty rezerwacji w formacie 'YYYY-MM-DD'
+        """
+        self.users = users
+        self.bookings = bookings
+        self.reviews = reviews
+        self.dates = dates
+
+
+def generate(users: int, bookings: int, reviews: int, days: int = 365, seed: int = 0,
+             start: str = "2026-01-01"):
+    """
+    Generuje zbiór danych.
+
+    Każdy użytkownik ma co najwyżej jedną rezerwację na datę, więc wszystkie
+    rezerwacje są poprawne i nie są w konflikcie.
+
+    Args:
+        users (int): Liczba użytkowników
+        bookings (int): Liczba rezerwacji
+        reviews (int): Liczba recenzji
+        days (int): Liczba kolejnych dni, na które rozkładane są rezerwacje
+        seed (int): Ziarno generatora liczb losowych
+        start (str): Pierwsza data w formacie 'YYYY-MM-DD'
+
+    Returns:
+        Dataset: Wygenerowany zbiór danych
+
+    Raises:
+        ValueError: Gdy liczba rezerwacji przekracza liczbę par (użytkownik, dzień)
+    """
+    if users <= 0 or days <= 0 or bookings > users * days:
+        raise ValueError("Not enough users and days for the requested number of bookings.")
+    generator = random.Random(seed)
+    first = Date.fromisoformat(start)
+    dates = [(first + timedelta(days=day)).isoformat() for day in range(days)]
+
+    user_rows = [(f"user{n}@example.com", f"password{n:08d}") for n in range(1, users + 1)]
+    booking_rows = []
+    for n in range(bookings):
+        # kolejne rezerwacje użytkownika trafiają na kolejne dni, więc klucze się nie powtarzają
+        user_id = n % users + 1
+        day = (n // users + user_id) % days
+        booking_rows.append(
+            (user_id, f"user{user_id}", dates[day], generator.randint(1, 4), generator.randint(1, 3))
+        )
+    review_rows = [
+        (n, generator.randint(1, 5), " ".join(generator.choices(WORDS, k=generator.randint(3, 12))))
+        for n in range(1, reviews + 1)
+    ]
+    return Dataset(user_rows, booking_rows, review_rows, dates)
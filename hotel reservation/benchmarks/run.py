@@ -0,0 +1,277 @@
+"""
+Zestaw benchmarków menedżerów rezerwacji, użytkowników i recenzji.
+
+Każdy scenariusz jest mierzony dla podanych skal (liczby rezerwacji
+i recenzji); wyniki są zapisywane jako JSON. Podanie wyników bazowych
+(--baseline) porównuje przepustowość i kończy program kodem 1, gdy
+którykolwiek scenariusz jest wolniejszy o więcej niż --threshold.
+
+Uruchomienie (z katalogu "hotel reservation"):
+    python -m benchmarks.run --scales 1000 10000 100000 --output results.json
+    python -m benchmarks.run --scales 1000 10000 --baseline results.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from benchmarks.datagen import generate
+from src.reservation import ReservationManagement
+from src.reviews import Reviews
+from src.users import UserManagement
+
+SCENARIOS = {}
+
+
+def scenario(function):
+    """
+    Rejestruje scenariusz benchmarku.
+
+    Scenariusz przygotowuje stan poza pomiarem czasu i zwraca funkcję
+    wykonującą mierzone operacje oraz liczbę tych operacji.
+    """
+    SCENARIOS[function.__name__] = function
+    return function
+
+
+def _filled_reservations(data, **options):
+    """Zwraca menedżer rezerwacji zawierający wszystkie rezerwacje ze zbioru danych."""
+    manager = ReservationManagement(**options)
+    for row in data.bookings:
+        manager.booking(*row)
+    return manager
+
+
+def _filled_reviews(data):
+    """Zwraca system recenzji zawierający wszystkie recenzje ze zbioru danych."""
+    manager = Reviews()
+    for row in data.reviews:
+        manager.add_review(*row)
+    return manager
+
+
+@scenario
+def booking(data):
+    """Rezerwacje dodawane pojedynczo."""
+    manager = ReservationManagement()
+    return lambda: [manager.booking(*row) for row in data.bookings], len(data.bookings)
+
+
+@scenario
+def booking_columnar(data):
+    """Rezerwacje dodawane pojedynczo do magazynu kolumnowego."""
+    manager = ReservationManagement(columnar=True)
+    return lambda: [manager.booking(*row) for row in data.bookings], len(data.bookings)
+
+
+@scenario
+def booking_with_capacity(data):
+    """Rezerwacje dodawane pojedynczo z kontrolą liczby wolnych łóżek."""
+    manager = ReservationManagement(total_beds=len(data.bookings) * 4)
+    return lambda: [manager.booking(*row) for row in data.bookings], len(data.bookings)
+
+
+@scenario
+def book_many(data):
+    """Rezerwacje dodawane jednym wywołaniem bookMany."""
+    manager = ReservationManagement()
+    return lambda: manager.bookMany(data.bookings), len(data.bookings)
+
+
+@scenario
+def cancellation(data):
+    """Anulowanie wszystkich rezerwacji każdego użytkownika."""
+    manager = _filled_reservations(data)
+    ids = range(1, len(data.users) + 1)
+    return lambda: [manager.cancelBooking(id) for id in ids], len(ids)
+
+
+@scenario
+def user_reservation_lookup(data):
+    """Pobieranie rezerwacji każdego użytkownika."""
+    manager = _filled_reservations(data)
+    ids = range(1, len(data.users) + 1)
+    return lambda: [manager.userReservation(id) for id in ids], len(ids)
+
+
+@scenario
+def free_beds(data):
+    """Liczba wolnych łóżek w tygodniowych przedziałach."""
+    manager = _filled_reservations(data, total_beds=len(data.bookings) * 4)
+    ranges = list(zip(data.dates, data.dates[7:]))
+    return lambda: [manager.freeBeds(*dates) for dates in ranges], len(ranges)
+
+
+@scenario
+def available_dates(data):
+    """Daty przyjazdu z wolnymi łóżkami w kolejnych 90 dniach."""
+    manager = _filled_reservations(data, total_beds=len(data.bookings) * 4)
+    starts = data.dates[:-90]
+    return lambda: [manager.availableDates(start, 90, 2, 3) for start in starts], len(starts)
+
+
+@scenario
+def add_user(data):
+    """Dodawanie użytkowników."""
+    manager = UserManagement()
+    return lambda: [manager.addUser(*row) for row in data.users], len(data.users)
+
+
+@scenario
+def get_user(data):
+    """Pobieranie użytkowników według identyfikatora."""
+    manager = UserManagement()
+    ids = [manager.addUser(*row) for row in data.users]
+    return lambda: [manager.getUser(id) for id in ids], len(ids)
+
+
+@scenario
+def get_user_by_email(data):
+    """Pobieranie użytkowników według adresu email."""
+    manager = UserManagement()
+    for row in data.users:
+        manager.addUser(*row)
+    emails = [email.upper() for email, _ in data.users]
+    return lambda: [manager.getUserByEmail(email) for email in emails], len(emails)
+
+
+@scenario
+def review_add(data):
+    """Dodawanie recenzji."""
+    manager = Reviews()
+    return lambda: [manager.add_review(*row) for row in data.reviews], len(data.reviews)
+
+
+@scenario
+def review_get(data):
+    """Pobieranie recenzji."""
+    manager = _filled_reviews(data)
+    ids = [row[0] for row in data.reviews]
+    return lambda: [manager.get_review(id) for id in ids], len(ids)
+
+
+@scenario
+def review_edit(data):
+    """Edycja recenzji."""
+    manager = _filled_reviews(data)
+    rows = [(id, stars % 5 + 1, comment + " again") for id, stars, comment in data.reviews]
+    return lambda: [manager.edit_review(*row) for row in rows], len(rows)
+
+
+@scenario
+def review_delete(data):
+    """Usuwanie recenzji."""
+    manager = _filled_reviews(data)
+    ids = [row[0] for row in data.reviews]
+    return lambda: [manager.delete_review(id) for id in ids], len(ids)
+
+
+def measure(name: str, data, repeat: int):
+    """
+    Mierzy scenariusz; każde powtórzenie zaczyna od świeżo przygotowanego stanu.
+
+    Args:
+        name (str): Nazwa scenariusza
+        data (Dataset): Zbiór danych
+        repeat (int): Liczba powtórzeń
+
+    Returns:
+        dict: Liczba operacji, najlepszy czas i przepustowość
+    """
+    times = []
+    for _ in range(repeat):
+        run, operations = SCENARIOS[name](data)
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    best = min(times)
+    return {
+        "operations": operations,
+        "best_seconds": best,
+        "operations_per_second": operations / best if best else float("inf"),
+    }
+
+
+def run(scales, names, repeat: int, seed: int):
+    """
+    Uruchamia scenariusze dla wszystkich skal.
+
+    Args:
+        scales (list): Liczby rezerwacji i recenzji (użytkowników jest 4 razy mniej)
+        names (list): Nazwy scenariuszy
+        repeat (int): Liczba powtórzeń każdego scenariusza
+        seed (int): Ziarno generatora danych
+
+    Returns:
+        dict: Wyniki wraz z opisem środowiska
+    """
+    results = {}
+    for scale in scales:
+        data = generate(users=max(scale // 4, 1), bookings=scale, reviews=scale, seed=seed)
+        results[str(scale)] = {name: measure(name, data, repeat) for name in names}
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float):
+    """
+    Porównuje wyniki z wynikami bazowymi.
+
+    Args:
+        current (dict): Bieżące wyniki
+        baseline (dict): Wyniki bazowe
+        threshold (float): Dopuszczalny względny spadek przepustowości
+
+    Returns:
+        list: Opisy regresji (pusta lista, gdy ich nie ma)
+    """
+    regressions = []
+    for scale, scenarios in current["results"].items():
+        for name, result in scenarios.items():
+            previous = baseline["results"].get(scale, {}).get(name)
+            if previous is None:
+                continue
+            ratio = result["operations_per_second"] / previous["operations_per_second"]
+            if ratio < 1 - threshold:
+                regressions.append(f"{name} at scale {scale}: {ratio:.2f}x of baseline throughput")
+    return regressions
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń, uruchamia benchmarki i zapisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file for the results (default: stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run(args.scales, args.scenarios, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import asyncio
+
+from src.reservation import ReservationManagement
+from src.reviews import Reviews
+from src.users import UserManagement
+
+
+class _BatchingFacade:
+    """
+    Asynchroniczna nakładka na menedżer, grupująca współbieżne wywołania.
+
+    Wywołania trafiają do ograniczonej kolejki; gdy kolejka jest pełna,
+    wywołujący czeka (back-pressure). Jedno zadanie robocze pobiera z kolejki
+    do max_batch żądań naraz i wykonuje je na menedżerze bez przełączania
+    kontekstu pętli zdarzeń między nimi.
+
+    Attributes:
+        manager: Opakowywany menedżer
+        max_batch (int): Największa liczba żądań wykonywanych w jednej partii
+        max_pending (int): Pojemność kolejki żądań
+    """
+
+    def __init__(self, manager, max_batch: int = 256, max_pending: int = 4096):
+        """
+        Inicjalizuje nakładkę.
+
+        Args:
+            manager: Opakowywany menedżer
+            max_batch (int): Największa liczba żądań wykonywanych w jednej partii
+            max_pending (int): Pojemność kolejki żądań
+
+        Raises:
+            ValueError: Gdy rozmiar partii lub kolejki jest nieprawidłowy
+        """
+        if not isinstance(max_batch, int) or max_batch <= 0:
+            raise ValueError("Batch size must be a valid integer.")
+        if not isinstance(max_pending, int) or max_pending <= 0:
+            raise ValueError("Queue size must be a valid integer.")
+        self.manager = manager
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self._queue = None
+        self._worker = None
+
+    async def _submit(self, method: str, *args, **kwargs):
+        """
+        Umieszcza żądanie w kolejce i czeka na jego wynik.
+
+        Args:
+            method (str): Nazwa metody menedżera
+
+        Returns:
+            Wynik wywołania metody menedżera
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_pending)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._work())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((method, args, kwargs, future))
+        return await future
+
+    async def _work(self):
+        """Pobiera żądania z kolejki i wykonuje je partiami."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                self._run_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            await asyncio.sleep(0)
+
+    def _run_batch(self, batch):
+        """
+        Wykonuje partię żądań na menedżerze.
+
+        Args:
+            batch (list): Krotki (method, args, kwargs, future)
+        """
+        for method, args, kwargs, future in batch:
+            self._resolve(future, getattr(self.manager, method), args, kwargs)
+
+    @staticmethod
+    def _resolve(future, function, args, kwargs):
+        """Wywołuje funkcję i przekazuje wynik lub wyjątek do future."""
+        if future.cancelled():
+            return
+        try:
+            future.set_result(function(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+
+    async def join(self):
+        """Czeka na wykonanie wszystkich oczekujących żądań."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self):
+        """Wykonuje oczekujące żądania i zatrzymuje zadanie robocze."""
+        await self.join()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+
+class AsyncReservationManagement(_BatchingFacade):
+    """
+    Asynchroniczna nakładka na ReservationManagement.
+
+    Kolejne rezerwacje z jednej partii są łączone w jedno wywołanie bookMany.
+    """
+
+    def __init__(self, manager: ReservationManagement = None, max_batch: int = 256,
+                 max_pending: int = 4096):
+        """
+        Inicjalizuje nakładkę.
+
+        Args:
+            manager (ReservationManagement, optional): Opakowywany menedżer
+            max_batch (int): Największa liczba żądań wykonywanych w jednej partii
+            max_pending (int): Pojemność kolejki żądań
+        """
+        super().__init__(manager if manager is not None else ReservationManagement(),
+                         max_batch, max_pending)
+
+    def _run_batch(self, batch):
+        """
+        Wykonuje partię żądań, łącząc kolejne rezerwacje w wywołanie bookMany.
+
+        Args:
+            batch (list): Krotki (method, args, kwargs, future)
+        """
+        rows, futures = [], []
+        for method, args, kwargs, future in batch:
+            if method == "booking" and len(args) == 4 and set(kwargs) <= {"nights"}:
+                rows.append((*args, kwargs.get("nights", 1)))
+                futures.append(future)
+                continue
+            self._flush_bookings(rows, futures)
+            self._resolve(future, getattr(self.manager, method), args, kwargs)
+        self._flush_bookings(rows, futures)
+
+    def _flush_bookings(self, rows, futures):
+        """Wykonuje zebrane rezerwacje jednym wywołaniem bookMany."""
+        if not rows:
+            return
+        try:
+            results = self.manager.bookMany(rows)
+        except Exception as error:
+            # nieoczekiwany błąd całej partii trafia do każdego oczekującego
+            results = [error] * len(futures)
+        for future, result in zip(futures, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(None)
+        rows.clear()
+        futures.clear()
+
+    async def booking(self, id: int, user: str, date: str, beds: int, nights: int = 1):
+        """Asynchronicznie dodaje nową rezerwację (patrz ReservationManagement.booking)."""
+        return await self._submit("booking", id, user, date, beds, nights=nights)
+
+    async def bookMany(self, rows):
+        """Asynchronicznie dodaje wiele rezerwacji (patrz ReservationManagement.bookMany)."""
+        return await self._submit("bookMany", list(rows))
+
+    async def cancelBooking(self, id):
+        """Asynchronicznie anuluje rezerwacje użytkownika (patrz ReservationManagement.cancelBooking)."""
+        return await self._submit("cancelBooking", id)
+
+    async def userReservation(self, id: int):
+        """Asynchronicznie zwraca rezerwacje użytkownika (patrz ReservationManagement.userReservation)."""
+        return await self._submit("userReservation", id)
+
+
+class AsyncUserManagement(_BatchingFacade):
+    """Asynchroniczna nakładka na UserManagement."""
+
+    def __init__(self, manager: UserManagement = None, max_batch: int = 256,
+                 max_pending: int = 4096):
+        """
+        Inicjalizuje nakładkę.
+
+        Args:
+            manager (UserManagement, optional): Opakowywany menedżer
+            max_batch (int): Największa liczba żądań wykonywanych w jednej partii
+            max_pending (int): Pojemność kolejki żądań
+        """
+        super().__init__(manager if manager is not None else UserManagement(),
+                         max_batch, max_pending)
+
+    async def addUser(self, email: str, password: str):
+        """Asynchronicznie dodaje użytkownika (patrz UserManagement.addUser)."""
+        return await self._submit("addUser", email, password)
+
+    async def updateUser(self, id: int, email: str, password: str):
+        """Asynchronicznie aktualizuje użytkownika (patrz UserManagement.updateUser)."""
+        return await self._submit("updateUser", id, email, password)
+
+    async def deleteUser(self, id: int):
+        """Asynchronicznie usuwa użytkownika (patrz UserManagement.deleteUser)."""
+        return await self._submit("deleteUser", id)
+
+    async def getUser(self, id: int):
+        """Asynchronicznie pobiera użytkownika (patrz UserManagement.getUser)."""
+        return await self._submit("getUser", id)
+
+
+class AsyncReviews(_BatchingFacade):
+    """Asynchroniczna nakładka na Reviews."""
+
+    def __init__(self, manager: Reviews = None, max_batch: int = 256, max_pending: int = 4096):
+        """
+        Inicjalizuje nakładkę.
+
+        Args:
+            manager (Reviews, optional): Opakowywany menedżer
+            max_batch (int): Największa liczba żądań wykonywanych w jednej partii
+            max_pending (int): Pojemność kolejki żądań
+        """
+        super().__init__(manager if manager is not None else Reviews(), max_batch, max_pending)
+
+    async def add_review(self, id: int, stars: int, comment: str):
+        """Asynchronicznie dodaje recenzję (patrz Reviews.add_review)."""
+        return await self._submit("add_review", id, stars, comment)
+
+    async def edit_review(self, id: int, stars: int, comment: str):
+        """Asynchronicznie modyfikuje recenzję (patrz Reviews.edit_review)."""
+        return await self._submit("edit_review", id, stars, comment)
+
+    async def delete_review(self, id: int):
+        """Asynchronicznie usuwa recenzję (patrz Reviews.delete_review)."""
+        return await self._submit("delete_review", id)
+
+    async def get_review(self, id: int):
+        """Asynchronicznie pobiera recenzję (patrz Reviews.get_review)."""
+        return await self._submit("get_review", id)
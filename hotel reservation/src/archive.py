@@ -0,0 +1,144 @@
+import gzip
+import json
+import os
+import threading
+
+from src.reservation import Reservation
+from src.validation import parse_date
+
+PARTITION_SUFFIX = ".jsonl.gz"
+
+
+class ReservationArchive:
+    """
+    Zimne archiwum rezerwacji na dysku, podzielone na miesiące.
+
+    Każdy miesiąc daty przyjazdu ma własny plik 'YYYY-MM.jsonl.gz'
+    z jedną rezerwacją (tablicą JSON) na linię. Kolejne archiwizacje
+    dopisują do pliku nowy człon gzip, więc zapis nie wymaga odczytu
+    ani przepisywania danych. Zapytania czytają tylko miesiące
+    z zadanego przedziału dat, ale zawsze dekompresują całe partycje -
+    to wolniejsza ścieżka dla danych historycznych.
+
+    Attributes:
+        directory (str): Katalog z plikami partycji
+        level (int): Poziom kompresji gzip (0-9)
+    """
+
+    def __init__(self, directory: str, level: int = 6):
+        """
+        Otwiera archiwum w katalogu, tworząc go w razie potrzeby.
+
+        Args:
+            directory (str): Katalog z plikami partycji
+            level (int): Poziom kompresji gzip (0-9)
+
+        Raises:
+            ValueError: Gdy katalog lub poziom kompresji są nieprawidłowe
+        """
+        if not isinstance(directory, str) or not directory:
+            raise ValueError("Archive directory must be a valid string.")
+        if not isinstance(level, int) or not 0 <= level <= 9:
+            raise ValueError("Compression level must be a valid integer between 0 and 9.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.level = level
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Zwraca stan obiektu bez blokady, która nie daje się serializować."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Odtwarza stan obiektu i tworzy nową blokadę."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, month: str):
+        """Zwraca ścieżkę pliku partycji miesiąca 'YYYY-MM'."""
+        return os.path.join(self.directory, month + PARTITION_SUFFIX)
+
+    def months(self):
+        """
+        Zwraca miesiące, dla których istnieją partycje.
+
+        Returns:
+            list: Rosnące miesiące w formacie 'YYYY-MM'
+        """
+        return sorted(
+            name[:-len(PARTITION_SUFFIX)] for name in os.listdir(self.directory)
+            if name.endswith(PARTITION_SUFFIX)
+        )
+
+    def write(self, reservations):
+        """
+        Dopisuje rezerwacje do partycji według miesiąca daty przyjazdu.
+
+        Args:
+            reservations (iterable): Rezerwacje (Reservation lub ReservationView)
+
+        Returns:
+            int: Liczba zapisanych rezerwacji
+        """
+        partitions = {}
+        for reservation in reservations:
+            partitions.setdefault(reservation.date[:7], []).append(json.dumps([
+                reservation.reservation_number, reservation.id, reservation.user,
+                reservation.date, reservation.beds, reservation.nights,
+            ]))
+        with self._lock:
+            for month, lines in partitions.items():
+                with gzip.open(self._path(month), "at", encoding="utf-8",
+                               compresslevel=self.level) as file:
+                    file.write("\n".join(lines) + "\n")
+        return sum(len(lines) for lines in partitions.values())
+
+    def find(self, id: int = None, start: str = None, end: str = None):
+        """
+        Wyszukuje zarchiwizowane rezerwacje.
+
+        Args:
+            id (int, optional): Identyfikator użytkownika (domyślnie wszyscy)
+            start (str, optional): Najwcześniejsza data przyjazdu w formacie 'YYYY-MM-DD'
+            end (str, optional): Data przyjazdu, przed którą kończy się przedział
+
+        Returns:
+            list: Rezerwacje w kolejności numerów rezerwacji
+
+        Raises:
+            ValueError: Gdy identyfikator lub daty są nieprawidłowe
+        """
+        if id is not None and not isinstance(id, int):
+            raise ValueError("User ID must be a valid integer.")
+        low = parse_date(start) if start is not None else None
+        high = parse_date(end) if end is not None else None
+
+        found = []
+        with self._lock:
+            for month in self.months():
+                # partycje spoza przedziału dat nie są otwierane
+                if (start is not None and month < start[:7]) or (end is not None and month > end[:7]):
+                    continue
+                with gzip.open(self._path(month), "rt", encoding="utf-8") as file:
+                    for line in file:
+                        number, user_id, user, date, beds, nights = json.loads(line)
+                        if id is not None and user_id != id:
+                            continue
+                        if low is not None or high is not None:
+                            ordinal = parse_date(date)
+                            if (low is not None and ordinal < low) or (high is not None and ordinal >= high):
+                                continue
+                        found.append(Reservation(user_id, number, beds, user, date, nights))
+        found.sort(key=lambda reservation: reservation.reservation_number)
+        return found
+
+    def stored_bytes(self):
+        """
+        Zwraca łączny rozmiar plików partycji.
+
+        Returns:
+            int: Liczba bajtów na dysku
+        """
+        return sum(os.path.getsize(self._path(month)) for month in self.months())
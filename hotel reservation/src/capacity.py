@@ -0,0 +1,173 @@
+from src.occupancy import OccupancyCalendar
+from src.validation import parse_date
+
+
+class RoomCapacity:
+    """
+    Klasa pilnująca łącznej liczby łóżek dostępnych w hotelu.
+
+    Pobyty są przechowywane jako przedziały [check_in, check_out) dodawane
+    do kalendarza zajętości (rzadkiego zbioru drzew przedziałowych
+    indeksowanych numerem dnia). Rezerwacja, zwolnienie i zapytania
+    o przedział nocy mają koszt O(log n), niezależnie od liczby rezerwacji.
+
+    Attributes:
+        total_beds (int): Łączna liczba łóżek w hotelu
+        calendar (OccupancyCalendar): Liczba zajętych łóżek dla każdej nocy
+    """
+
+    def __init__(self, total_beds: int):
+        """
+        Inicjalizuje nowy licznik pojemności.
+
+        Args:
+            total_beds (int): Łączna liczba łóżek w hotelu
+
+        Raises:
+            ValueError: Gdy liczba łóżek jest nieprawidłowa
+        """
+        if total_beds is None or not isinstance(total_beds, int) or total_beds <= 0:
+            raise ValueError("Number of beds must be a valid integer.")
+        self.total_beds = total_beds
+        self.calendar = OccupancyCalendar()
+
+    def _range(self, check_in: str, check_out: str):
+        """
+        Zwraca zakres numerów nocy pobytu.
+
+        Args:
+            check_in (str): Data przyjazdu
+            check_out (str): Data wyjazdu
+
+        Returns:
+            range: Numery kolejnych nocy pobytu
+
+        Raises:
+            ValueError: Gdy daty są nieprawidłowe lub wyjazd nie następuje po przyjeździe
+        """
+        start = parse_date(check_in)
+        end = parse_date(check_out)
+        if end <= start:
+            raise ValueError("Check-out date must be after check-in date.")
+        return range(start, end)
+
+    def occupied(self, check_in: str, check_out: str):
+        """
+        Zwraca największą liczbę zajętych łóżek w danym przedziale.
+
+        Args:
+            check_in (str): Data przyjazdu
+            check_out (str): Data wyjazdu
+
+        Returns:
+            int: Maksymalna liczba zajętych łóżek w przedziale
+        """
+        stay = self._range(check_in, check_out)
+        return self.calendar.maximum(stay.start, stay.stop)
+
+    def free_beds(self, check_in: str, check_out: str):
+        """
+        Zwraca liczbę łóżek wolnych przez cały pobyt.
+
+        Args:
+            check_in (str): Data przyjazdu
+            check_out (str): Data wyjazdu
+
+        Returns:
+            int: Liczba łóżek wolnych w każdej nocy przedziału
+        """
+        return self.total_beds - self.occupied(check_in, check_out)
+
+    def booked_nights(self, check_in: str, check_out: str):
+        """
+        Zwraca liczbę zajętych łóżkonocy w danym przedziale.
+
+        Args:
+            check_in (str): Data przyjazdu
+            check_out (str): Data wyjazdu
+
+        Returns:
+            int: Suma zajętych łóżek po wszystkich nocach przedziału
+        """
+        stay = self._range(check_in, check_out)
+        return self.calendar.total(stay.start, stay.stop)
+
+    def available_starts(self, start: int, end: int, beds: int, nights: int = 1):
+        """
+        Zwraca dni przyjazdu z przedziału [start, end), w których pobyt się mieści.
+
+        Args:
+            start (int): Numer pierwszego sprawdzanego dnia przyjazdu (ordinal)
+            end (int): Numer dnia po ostatnim sprawdzanym dniu przyjazdu (ordinal)
+            beds (int): Liczba potrzebnych łóżek
+            nights (int): Liczba nocy pobytu
+
+        Returns:
+            list: Rosnące numery dni, od których przez wszystkie noce pobytu
+                  wolnych jest co najmniej beds łóżek
+        """
+        free = self.calendar.at_most(start, end + nights - 1, self.total_beds - beds)
+        if nights == 1:
+            return free
+        # dzień przyjazdu pasuje, gdy kolejne noce pobytu są wolne
+        starts, run, previous = [], 0, None
+        for night in free:
+            run = run + 1 if night - 1 == previous else 1
+            previous = night
+            if run >= nights:
+                starts.append(night - nights + 1)
+        return starts
+
+    def reserve(self, check_in: str, check_out: str, beds: int):
+        """
+        Zajmuje łóżka na cały pobyt.
+
+        Args:
+            check_in (str): Data przyjazdu
+            check_out (str): Data wyjazdu
+            beds (int): Liczba łóżek
+
+        Raises:
+            ValueError: Gdy w którejkolwiek nocy zabrakłoby łóżek
+        """
+        stay = self._range(check_in, check_out)
+        self.reserve_nights(stay.start, stay.stop, beds)
+
+    def reserve_nights(self, start: int, end: int, beds: int):
+        """
+        Zajmuje łóżka w nocach o numerach z przedziału [start, end).
+
+        Args:
+            start (int): Numer dnia przyjazdu (ordinal)
+            end (int): Numer dnia wyjazdu (ordinal)
+            beds (int): Liczba łóżek
+
+        Raises:
+            ValueError: Gdy w którejkolwiek nocy zabrakłoby łóżek
+        """
+        if self.calendar.maximum(start, end) > self.total_beds - beds:
+            raise ValueError("Not enough free beds on this date.")
+        self.calendar.add(start, end, beds)
+
+    def release(self, check_in: str, check_out: str, beds: int):
+        """
+        Zwalnia łóżka zajęte przez pobyt.
+
+        Args:
+            check_in (str): Data przyjazdu
+            check_out (str): Data wyjazdu
+            beds (int): Liczba łóżek
+        """
+        stay = self._range(check_in, check_out)
+        self.release_nights(stay.start, stay.stop, beds)
+
+    def release_nights(self, start: int, end: int, beds: int):
+        """
+        Zwalnia łóżka zajęte w nocach o numerach z przedziału [start, end).
+
+        Args:
+            start (int): Numer dnia przyjazdu (ordinal)
+            end (int): Numer dnia wyjazdu (ordinal)
+            beds (int): Liczba łóżek
+        """
+        self.calendar.add(start, end, -beds)
@@ -0,0 +1,194 @@
+import zlib
+from array import array
+from collections import Counter
+
+from src.search import TOKEN_PATTERN
+
+RAW = b"\x00"
+DEFLATED = b"\x01"
+
+
+def build_dictionary(samples, size: int = 4096):
+    """
+    Buduje słownik kompresji z przykładowych tekstów.
+
+    Słownik zawiera najczęstsze słowa próbek; najczęstsze trafiają na koniec,
+    ponieważ zlib najtaniej koduje odwołania do najbliższych bajtów słownika.
+
+    Args:
+        samples (iterable): Przykładowe teksty
+        size (int): Największy rozmiar słownika w bajtach
+
+    Returns:
+        bytes: Słownik dla zlib (zdict)
+    """
+    counts = Counter()
+    for text in samples:
+        counts.update(TOKEN_PATTERN.findall(text))
+    words, length = [], 0
+    for word, _ in counts.most_common():
+        encoded = word.encode("utf-8") + b" "
+        if length + len(encoded) > size:
+            break
+        words.append(encoded)
+        length += len(encoded)
+    return b"".join(reversed(words))
+
+
+class CommentArena:
+    """
+    Magazyn skompresowanych tekstów identyfikowanych liczbowym odnośnikiem.
+
+    Teksty są zapisywane jeden za drugim we wspólnym buforze, a ich położenie
+    w tablicach przesunięć i długości, więc pojedynczy tekst nie wymaga
+    osobnego obiektu. Każdy tekst jest kompresowany osobno (zlib ze wspólnym
+    słownikiem), więc odczyt jednego tekstu nie wymaga rozpakowania
+    pozostałych; teksty, których kompresja nie zmniejsza, są zapisywane bez
+    kompresji. Krótkie teksty (np. "Great stay!") są internowane: identyczne
+    teksty są przechowywane raz i zliczane. Bufor jest kompaktowany, gdy co
+    najmniej połowa jego bajtów należy do zwolnionych tekstów.
+
+    Attributes:
+        dictionary (bytes): Słownik kompresji (zdict)
+        level (int): Poziom kompresji zlib
+        intern_limit (int): Największa długość internowanego tekstu w bajtach
+    """
+
+    def __init__(self, dictionary: bytes = b"", level: int = 6, intern_limit: int = 32):
+        """
+        Inicjalizuje pusty magazyn.
+
+        Args:
+            dictionary (bytes): Słownik kompresji (np. z build_dictionary)
+            level (int): Poziom kompresji zlib (0-9)
+            intern_limit (int): Największa długość internowanego tekstu w bajtach
+
+        Raises:
+            ValueError: Gdy którykolwiek z parametrów jest nieprawidłowy
+        """
+        if not isinstance(dictionary, bytes):
+            raise ValueError("Dictionary must be bytes.")
+        if not isinstance(level, int) or not 0 <= level <= 9:
+            raise ValueError("Compression level must be a valid integer between 0 and 9.")
+        if not isinstance(intern_limit, int) or intern_limit < 0:
+            raise ValueError("Intern limit must be a valid integer.")
+        self.dictionary = dictionary
+        self.level = level
+        self.intern_limit = intern_limit
+        self._data = bytearray()
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._refcounts = array("I")
+        self._free = []
+        self._interned = {}
+        self._dead = 0
+
+    def __len__(self):
+        """Zwraca liczbę różnych przechowywanych tekstów."""
+        return len(self._refcounts) - len(self._free)
+
+    def _compress(self, raw: bytes):
+        """Koduje tekst do postaci zapisywanej w magazynie."""
+        if self.dictionary:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                          zdict=self.dictionary)
+        else:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        deflated = compressor.compress(raw) + compressor.flush()
+        if len(deflated) < len(raw):
+            return DEFLATED + deflated
+        return RAW + raw
+
+    def store(self, text: str):
+        """
+        Zapisuje tekst i zwraca jego odnośnik.
+
+        Args:
+            text (str): Tekst do zapisania
+
+        Returns:
+            int: Odnośnik do tekstu
+        """
+        raw = text.encode("utf-8")
+        interned = len(raw) <= self.intern_limit
+        if interned:
+            ref = self._interned.get(text)
+            if ref is not None:
+                self._refcounts[ref] += 1
+                return ref
+        blob = self._compress(raw)
+        if self._free:
+            ref = self._free.pop()
+            self._offsets[ref] = len(self._data)
+            self._lengths[ref] = len(blob)
+            self._refcounts[ref] = 1
+        else:
+            ref = len(self._refcounts)
+            self._offsets.append(len(self._data))
+            self._lengths.append(len(blob))
+            self._refcounts.append(1)
+        self._data += blob
+        if interned:
+            self._interned[text] = ref
+        return ref
+
+    def load(self, ref: int):
+        """
+        Odczytuje i rozpakowuje tekst.
+
+        Args:
+            ref (int): Odnośnik do tekstu
+
+        Returns:
+            str: Tekst
+        """
+        offset = self._offsets[ref]
+        blob = self._data[offset:offset + self._lengths[ref]]
+        if blob[:1] == RAW:
+            return blob[1:].decode("utf-8")
+        if self.dictionary:
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=self.dictionary)
+        else:
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return (decompressor.decompress(blob[1:]) + decompressor.flush()).decode("utf-8")
+
+    def release(self, ref: int):
+        """
+        Zwalnia jedno użycie tekstu; tekst jest usuwany po zwolnieniu ostatniego użycia.
+
+        Args:
+            ref (int): Odnośnik do tekstu
+        """
+        self._refcounts[ref] -= 1
+        if self._refcounts[ref]:
+            return
+        if self._lengths[ref] <= self.intern_limit + 1:  # tylko krótkie teksty mogą być internowane
+            text = self.load(ref)
+            if self._interned.get(text) == ref:
+                del self._interned[text]
+        self._dead += self._lengths[ref]
+        self._lengths[ref] = 0
+        self._free.append(ref)
+        if self._dead * 2 >= len(self._data):
+            self.compact()
+
+    def compact(self):
+        """Usuwa z bufora bajty zwolnionych tekstów i przelicza przesunięcia."""
+        data = bytearray()
+        for ref, length in enumerate(self._lengths):
+            if not self._refcounts[ref]:
+                continue
+            offset = self._offsets[ref]
+            self._offsets[ref] = len(data)
+            data += self._data[offset:offset + length]
+        self._data = data
+        self._dead = 0
+
+    def stored_bytes(self):
+        """
+        Zwraca łączny rozmiar przechowywanych danych.
+
+        Returns:
+            int: Liczba bajtów zajmowanych przez zakodowane teksty
+        """
+        return len(self._data) - self._dead
@@ -0,0 +1,230 @@
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+ALGORITHM = "pbkdf2_sha256"
+# losowy klucz procesu dla kluczy pamięci podręcznej; bez niego zapamiętane
+# skróty pozwalałyby szybko sprawdzać hasła z pominięciem kosztu PBKDF2
+_CACHE_SECRET = os.urandom(32)
+
+
+def _derive(password: str, salt: bytes, iterations: int):
+    """
+    Wylicza klucz PBKDF2-HMAC-SHA256 dla hasła.
+
+    Funkcja jest na poziomie modułu, aby mogła być wykonywana w puli procesów.
+
+    Args:
+        password (str): Hasło
+        salt (bytes): Sól
+        iterations (int): Liczba iteracji
+
+    Returns:
+        bytes: Wyliczony klucz
+    """
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def _check(password: str, encoded: str):
+    """
+    Sprawdza hasło względem zakodowanego skrótu.
+
+    Args:
+        password (str): Hasło do sprawdzenia
+        encoded (str): Skrót w formacie 'pbkdf2_sha256$iteracje$sól$klucz'
+
+    Returns:
+        bool: True jeśli hasło jest poprawne
+    """
+    try:
+        algorithm, iterations, salt, expected = encoded.split("$")
+        if algorithm != ALGORITHM:
+            return False
+        derived = _derive(password, bytes.fromhex(salt), int(iterations))
+    except (AttributeError, ValueError):
+        return False
+    return hmac.compare_digest(derived.hex(), expected)
+
+
+def _check_pair(pair):
+    """Wersja _check przyjmująca krotkę (hasło, skrót), używana przez pulę procesów."""
+    return _check(*pair)
+
+
+class PasswordHasher:
+    """
+    Klasa wyliczająca i weryfikująca skróty haseł (PBKDF2-HMAC-SHA256).
+
+    Wyliczanie kluczy może być przeniesione do puli procesów, a ostatnio
+    poprawnie zweryfikowane pary (hasło, skrót) są zapamiętywane na czas
+    cache_ttl sekund, więc powtarzane logowania nie wyliczają klucza ponownie.
+    Pamięć podręczna przechowuje jedynie HMAC-SHA256 pary z losowym kluczem
+    procesu, nie samo hasło.
+
+    Attributes:
+        iterations (int): Liczba iteracji PBKDF2
+        workers (int): Liczba procesów puli (0 oznacza obliczenia w bieżącym procesie)
+        cache_size (int): Największa liczba zapamiętanych weryfikacji
+        cache_ttl (float): Czas ważności zapamiętanej weryfikacji w sekundach
+    """
+
+    def __init__(self, iterations: int = 200_000, workers: int = 0, cache_size: int = 1024,
+                 cache_ttl: float = 300.0, clock=time.monotonic):
+        """
+        Inicjalizuje obiekt.
+
+        Args:
+            iterations (int): Liczba iteracji PBKDF2
+            workers (int): Liczba procesów puli (0 oznacza obliczenia w bieżącym procesie)
+            cache_size (int): Największa liczba zapamiętanych weryfikacji
+            cache_ttl (float): Czas ważności zapamiętanej weryfikacji w sekundach
+            clock (callable): Źródło czasu (do testów)
+
+        Raises:
+            ValueError: Gdy którykolwiek z parametrów jest nieprawidłowy
+        """
+        if not isinstance(iterations, int) or iterations <= 0:
+            raise ValueError("Number of iterations must be a valid integer.")
+        if not isinstance(workers, int) or workers < 0:
+            raise ValueError("Number of workers must be a valid integer.")
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise ValueError("Cache size must be a valid integer.")
+        self.iterations = iterations
+        self.workers = workers
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        self._cache = OrderedDict()
+        self._pool = None
+
+    def __getstate__(self):
+        """Zwraca stan obiektu bez puli procesów i pamięci podręcznej."""
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_cache"] = OrderedDict()
+        return state
+
+    def _executor(self):
+        """Zwraca pulę procesów, tworząc ją przy pierwszym użyciu."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _encode(self, salt: bytes, derived: bytes):
+        """Zwraca skrót w formacie 'pbkdf2_sha256$iteracje$sól$klucz'."""
+        return f"{ALGORITHM}${self.iterations}${salt.hex()}${derived.hex()}"
+
+    def hash(self, password: str):
+        """
+        Wylicza skrót hasła z losową solą.
+
+        Args:
+            password (str): Hasło
+
+        Returns:
+            str: Zakodowany skrót hasła
+        """
+        return self.hash_many([password])[0]
+
+    def hash_many(self, passwords):
+        """
+        Wylicza skróty wielu haseł, w puli procesów jeśli jest skonfigurowana.
+
+        Args:
+            passwords (iterable): Hasła
+
+        Returns:
+            list: Zakodowane skróty w kolejności haseł
+        """
+        passwords = list(passwords)
+        salts = [os.urandom(16) for _ in passwords]
+        iterations = [self.iterations] * len(passwords)
+        if self.workers and len(passwords) > 1:
+            derived = self._executor().map(_derive, passwords, salts, iterations)
+        else:
+            derived = map(_derive, passwords, salts, iterations)
+        return [self._encode(salt, key) for salt, key in zip(salts, derived)]
+
+    def _cache_key(self, password: str, encoded: str):
+        """Zwraca klucz pamięci podręcznej dla pary (hasło, skrót)."""
+        message = f"{encoded}\0{password}".encode("utf-8")
+        return hmac.new(_CACHE_SECRET, message, hashlib.sha256).digest()
+
+    def _cached(self, key: bytes):
+        """Sprawdza, czy para została niedawno poprawnie zweryfikowana."""
+        expires = self._cache.get(key)
+        if expires is None:
+            return False
+        if expires <= self._clock():
+            del self._cache[key]
+            return False
+        self._cache.move_to_end(key)
+        return True
+
+    def _remember(self, key: bytes):
+        """Zapamiętuje poprawną weryfikację i usuwa najstarsze wpisy ponad limit."""
+        if not self.cache_size:
+            return
+        self._cache[key] = self._clock() + self.cache_ttl
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def verify(self, password: str, encoded: str):
+        """
+        Sprawdza hasło względem skrótu.
+
+        Args:
+            password (str): Hasło do sprawdzenia
+            encoded (str): Zakodowany skrót hasła
+
+        Returns:
+            bool: True jeśli hasło jest poprawne
+        """
+        return self.verify_many([(password, encoded)])[0]
+
+    def verify_many(self, pairs):
+        """
+        Sprawdza wiele par (hasło, skrót) naraz.
+
+        Pary obecne w pamięci podręcznej nie są ponownie liczone; pozostałe
+        są weryfikowane w puli procesów, jeśli jest skonfigurowana.
+
+        Args:
+            pairs (iterable): Krotki (hasło, skrót)
+
+        Returns:
+            list: Wyniki weryfikacji w kolejności par
+        """
+        pairs = list(pairs)
+        results = [False] * len(pairs)
+        pending, keys = [], []
+        for index, (password, encoded) in enumerate(pairs):
+            if not isinstance(password, str) or not isinstance(encoded, str):
+                continue
+            key = self._cache_key(password, encoded)
+            if self._cached(key):
+                results[index] = True
+            else:
+                pending.append(index)
+                keys.append(key)
+
+        to_check = [pairs[index] for index in pending]
+        if self.workers and len(to_check) > 1:
+            checked = self._executor().map(_check_pair, to_check)
+        else:
+            checked = map(_check_pair, to_check)
+        for index, key, valid in zip(pending, keys, checked):
+            results[index] = valid
+            if valid:
+                self._remember(key)
+        return results
+
+    def close(self):
+        """Zamyka pulę procesów."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
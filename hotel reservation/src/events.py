@@ -0,0 +1,134 @@
+import threading
+
+
+class ChangeEvent:
+    """
+    Pojedyncza zmiana danych zgłoszona przez menedżer.
+
+    Attributes:
+        seq (int): Numer kolejny zdarzenia (rosnący, bez przerw)
+        entity (str): Rodzaj obiektu: "reservation", "user" lub "review"
+        action (str): Rodzaj zmiany: "create", "update", "delete" lub "archive"
+        key (int): Identyfikator obiektu (numer rezerwacji, ID użytkownika lub recenzji)
+        data (dict or None): Nowe wartości pól (None przy usunięciu)
+    """
+    __slots__ = ("seq", "entity", "action", "key", "data")
+
+    def __init__(self, seq: int, entity: str, action: str, key: int, data=None):
+        """
+        Inicjalizuje zdarzenie.
+
+        Args:
+            seq (int): Numer kolejny zdarzenia
+            entity (str): Rodzaj obiektu
+            action (str): Rodzaj zmiany
+            key (int): Identyfikator obiektu
+            data (dict, optional): Nowe wartości pól
+        """
+        self.seq = seq
+        self.entity = entity
+        self.action = action
+        self.key = key
+        self.data = data
+
+    def as_dict(self):
+        """
+        Zwraca zdarzenie jako słownik (np. do serializacji JSON).
+
+        Returns:
+            dict: Pola zdarzenia
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class ChangeLog:
+    """
+    Ograniczony bufor cykliczny zdarzeń zmian (change data capture).
+
+    Menedżery dopisują zdarzenia po każdej udanej zmianie, a odbiorcy
+    odczytują tylko zdarzenia nowsze niż ostatnio przetworzony numer.
+    Bufor przechowuje capacity ostatnich zdarzeń; dopisanie i odczyt
+    zdarzenia o danym numerze mają koszt O(1). Odbiorca, który nie nadążył
+    i stracił zdarzenia, dostaje błąd i powinien ponownie pobrać pełny stan.
+
+    Attributes:
+        capacity (int): Największa liczba przechowywanych zdarzeń
+        last_seq (int): Numer ostatniego zdarzenia (0, gdy nie było zdarzeń)
+    """
+
+    def __init__(self, capacity: int = 65536):
+        """
+        Inicjalizuje pusty bufor.
+
+        Args:
+            capacity (int): Największa liczba przechowywanych zdarzeń
+
+        Raises:
+            ValueError: Gdy pojemność jest nieprawidłowa
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Capacity must be a valid integer.")
+        self.capacity = capacity
+        self.last_seq = 0
+        self._events = [None] * capacity
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Zwraca stan obiektu bez blokady, która nie daje się serializować."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Odtwarza stan obiektu i tworzy nową blokadę."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def first_seq(self):
+        """Numer najstarszego dostępnego zdarzenia."""
+        return max(self.last_seq - self.capacity, 0) + 1
+
+    def emit(self, entity: str, action: str, key: int, data=None):
+        """
+        Dopisuje zdarzenie, zastępując najstarsze, gdy bufor jest pełny.
+
+        Args:
+            entity (str): Rodzaj obiektu
+            action (str): Rodzaj zmiany
+            key (int): Identyfikator obiektu
+            data (dict, optional): Nowe wartości pól
+
+        Returns:
+            int: Numer dopisanego zdarzenia
+        """
+        with self._lock:
+            seq = self.last_seq + 1
+            self._events[seq % self.capacity] = ChangeEvent(seq, entity, action, key, data)
+            self.last_seq = seq
+            return seq
+
+    def read(self, after: int = 0, limit: int = None):
+        """
+        Zwraca zdarzenia o numerach większych niż after.
+
+        Args:
+            after (int): Numer ostatniego przetworzonego zdarzenia (0 - od początku)
+            limit (int, optional): Największa liczba zwracanych zdarzeń
+
+        Returns:
+            list: Zdarzenia w kolejności numerów
+
+        Raises:
+            ValueError: Gdy numer jest nieprawidłowy lub część żądanych zdarzeń
+                       została już nadpisana
+        """
+        if not isinstance(after, int) or after < 0:
+            raise ValueError("Sequence number must be a valid integer.")
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            raise ValueError("Limit must be a valid integer.")
+        with self._lock:
+            if after + 1 < self.first_seq:
+                raise ValueError("Requested events are no longer available.")
+            end = self.last_seq if limit is None else min(self.last_seq, after + limit)
+            return [self._events[seq % self.capacity] for seq in range(after + 1, end + 1)]
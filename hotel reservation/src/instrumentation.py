@@ -0,0 +1,219 @@
+import threading
+import time
+from bisect import bisect_left
+from functools import partial, wraps
+
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+SIZE_ATTRIBUTES = ("store", "users", "reviews_list")
+
+
+class MethodStats:
+    """
+    Statystyki wywołań jednej metody.
+
+    Attributes:
+        calls (int): Liczba wywołań
+        errors (int): Liczba wywołań zakończonych wyjątkiem
+        total (float): Łączny czas wywołań w sekundach
+        buckets (list): Liczba wywołań w każdym przedziale histogramu (ostatni to +Inf)
+    """
+    __slots__ = ("calls", "errors", "total", "buckets")
+
+    def __init__(self, bucket_count: int):
+        """
+        Inicjalizuje puste statystyki.
+
+        Args:
+            bucket_count (int): Liczba granic przedziałów histogramu
+        """
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * (bucket_count + 1)
+
+
+class Metrics:
+    """
+    Opcjonalne pomiary wywołań metod menedżerów.
+
+    Metody są opakowywane tylko na instancjach przekazanych do instrument,
+    więc menedżery bez instrumentacji działają bez żadnego narzutu. Dla każdej
+    metody zliczane są wywołania, błędy oraz histogram czasu wykonania;
+    rozmiary kolekcji menedżerów są odczytywane w chwili eksportu.
+
+    Opakowane metody są atrybutami instancji, które nie dają się serializować,
+    dlatego przed zapisem migawki należy wywołać uninstrument.
+
+    Attributes:
+        buckets (tuple): Rosnące granice przedziałów histogramu w sekundach
+        stats (dict): Statystyki według pary (komponent, metoda)
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, clock=time.perf_counter):
+        """
+        Inicjalizuje pomiary.
+
+        Args:
+            buckets (iterable): Rosnące granice przedziałów histogramu w sekundach
+            clock (callable): Źródło czasu (do testów)
+
+        Raises:
+            ValueError: Gdy granice przedziałów są nieprawidłowe
+        """
+        buckets = tuple(buckets)
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("Buckets must be a non-empty increasing sequence.")
+        self.buckets = buckets
+        self.stats = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self._wrapped = {}
+
+    def instrument(self, manager, component: str, methods=None, size=None):
+        """
+        Włącza pomiary dla metod menedżera.
+
+        Args:
+            manager: Menedżer (np. ReservationManagement)
+            component (str): Nazwa komponentu w eksportowanych danych
+            methods (iterable, optional): Nazwy mierzonych metod (domyślnie wszystkie publiczne)
+            size (callable, optional): Funkcja zwracająca rozmiar kolekcji menedżera
+
+        Returns:
+            Menedżer przekazany jako argument
+
+        Raises:
+            ValueError: Gdy menedżer ma już włączone pomiary
+        """
+        if id(manager) in self._wrapped:
+            raise ValueError("Manager is already instrumented.")
+        if methods is None:
+            methods = [
+                name for name in dir(type(manager))
+                if not name.startswith("_") and callable(getattr(type(manager), name))
+            ]
+        methods = list(methods)
+        for name in methods:
+            setattr(manager, name, self._wrap(component, name, getattr(manager, name)))
+        self._wrapped[id(manager)] = methods
+
+        if size is None:
+            for attribute in SIZE_ATTRIBUTES:
+                if hasattr(manager, attribute):
+                    size = partial(len, getattr(manager, attribute))
+                    break
+        if size is not None:
+            self._sizes[component] = size
+        return manager
+
+    def uninstrument(self, manager):
+        """
+        Wyłącza pomiary dla menedżera (zebrane statystyki pozostają).
+
+        Args:
+            manager: Menedżer, dla którego włączono pomiary
+        """
+        for name in self._wrapped.pop(id(manager), ()):
+            manager.__dict__.pop(name, None)
+
+    def _wrap(self, component: str, method: str, function):
+        """Zwraca funkcję mierzącą wywołania podanej metody."""
+        stats = self.stats.setdefault((component, method), MethodStats(len(self.buckets)))
+        clock, buckets, lock = self._clock, self.buckets, self._lock
+
+        @wraps(function)
+        def measured(*args, **kwargs):
+            failed = True
+            started = clock()
+            try:
+                result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = clock() - started
+                with lock:
+                    stats.calls += 1
+                    stats.errors += failed
+                    stats.total += elapsed
+                    stats.buckets[bisect_left(buckets, elapsed)] += 1
+
+        return measured
+
+    def sizes(self):
+        """
+        Zwraca bieżące rozmiary kolekcji menedżerów.
+
+        Returns:
+            dict: Rozmiar kolekcji według nazwy komponentu
+        """
+        return {component: size() for component, size in self._sizes.items()}
+
+    def as_dict(self):
+        """
+        Zwraca zebrane dane jako słownik.
+
+        Returns:
+            dict: Statystyki metod (methods: komponent -> metoda -> statystyki)
+                  oraz rozmiary kolekcji (sizes)
+        """
+        methods = {}
+        with self._lock:
+            for (component, method), stats in self.stats.items():
+                cumulative, histogram = 0, {}
+                for bound, count in zip(self.buckets + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    histogram[bound] = cumulative
+                methods.setdefault(component, {})[method] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "total_seconds": stats.total,
+                    "average_seconds": stats.total / stats.calls if stats.calls else None,
+                    "histogram": histogram,
+                }
+        return {"methods": methods, "sizes": self.sizes()}
+
+    def prometheus(self, prefix: str = "hotel"):
+        """
+        Zwraca zebrane dane w formacie tekstowym Prometheusa.
+
+        Args:
+            prefix (str): Przedrostek nazw metryk
+
+        Returns:
+            str: Metryki w formacie tekstowym Prometheusa
+        """
+        data = self.as_dict()
+        calls = [
+            f"# HELP {prefix}_method_calls_total Number of manager method calls.",
+            f"# TYPE {prefix}_method_calls_total counter",
+        ]
+        errors = [
+            f"# HELP {prefix}_method_errors_total Number of manager method calls that raised.",
+            f"# TYPE {prefix}_method_errors_total counter",
+        ]
+        durations = [
+            f"# HELP {prefix}_method_duration_seconds Manager method call duration.",
+            f"# TYPE {prefix}_method_duration_seconds histogram",
+        ]
+        for component, methods in sorted(data["methods"].items()):
+            for method, stats in sorted(methods.items()):
+                labels = f'component="{component}",method="{method}"'
+                calls.append(f"{prefix}_method_calls_total{{{labels}}} {stats['calls']}")
+                errors.append(f"{prefix}_method_errors_total{{{labels}}} {stats['errors']}")
+                for bound, count in stats["histogram"].items():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    durations.append(
+                        f'{prefix}_method_duration_seconds_bucket{{{labels},le="{le}"}} {count}'
+                    )
+                durations.append(
+                    f"{prefix}_method_duration_seconds_sum{{{labels}}} {stats['total_seconds']!r}"
+                )
+                durations.append(f"{prefix}_method_duration_seconds_count{{{labels}}} {stats['calls']}")
+        sizes = [
+            f"# HELP {prefix}_collection_size Number of items held by a manager.",
+            f"# TYPE {prefix}_collection_size gauge",
+        ]
+        for component, size in sorted(data["sizes"].items()):
+            sizes.append(f'{prefix}_collection_size{{component="{component}"}} {size}')
+        return "\n".join(calls + errors + durations + sizes) + "\n"
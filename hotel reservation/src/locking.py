@@ -0,0 +1,151 @@
+import threading
+
+from src.reservation import ReservationManagement
+from src.validation import validate_booking
+
+
+class ConcurrentReservationManagement(ReservationManagement):
+    """
+    System rezerwacji bezpieczny dla wielu wątków.
+
+    Walidacja danych odbywa się bez blokad. Sprawdzenie konfliktu, zajęcie
+    łóżek, zapis rezerwacji, indeksy i zgłoszenie zmiany wykonywane są pod
+    jedną blokadą, podobnie jak anulowanie, archiwizacja i zapytania, więc
+    wszystkie operacje na wspólnych strukturach są wykonywane po kolei.
+    Blokady przypisane do dat nic by tu nie dały: pobyt obejmuje wiele nocy,
+    a kalendarz zajętości, rejestr i licznik numerów są wspólne.
+    """
+
+    def __init__(self, total_beds: int = None, columnar: bool = False, registry=None,
+                 changelog=None, archive=None):
+        """
+        Inicjalizuje nowy system rezerwacji bezpieczny dla wielu wątków.
+
+        Args:
+            total_beds (int, optional): Łączna liczba łóżek w hotelu
+            columnar (bool): Czy przechowywać rezerwacje w magazynie kolumnowym
+            registry (UserReservationRegistry, optional): Współdzielony rejestr powiązań
+            changelog (ChangeLog, optional): Bufor, do którego zgłaszane są zmiany
+            archive (ReservationArchive, optional): Archiwum zakończonych rezerwacji
+        """
+        super().__init__(total_beds, columnar, registry, changelog, archive)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Zwraca stan obiektu bez blokady, która nie daje się serializować."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Odtwarza stan obiektu i tworzy nową blokadę."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def booked_keys(self):
+        """
+        Zwraca zajęte klucze rezerwacji wyliczone z indeksów.
+
+        Returns:
+            set: Krotki (id, user, ordinal)
+        """
+        with self._lock:
+            return super().booked_keys
+
+    @property
+    def reservations(self):
+        """
+        Zwraca kopię listy aktywnych rezerwacji.
+
+        Returns:
+            list: Lista wszystkich rezerwacji w systemie
+        """
+        with self._lock:
+            return list(self.store.records())
+
+    def _book(self, id, user, date, beds, nights=1):
+        """
+        Waliduje dane bez blokad, a następnie zapisuje rezerwację pod blokadą.
+
+        Returns:
+            Reservation: Utworzona rezerwacja
+
+        Raises:
+            ValueError: Gdy dane są nieprawidłowe lub rezerwacja jest w konflikcie
+        """
+        ordinal = validate_booking(id, user, date, beds, nights)
+        with self._lock:
+            return self._insert(id, user, date, ordinal, beds, nights)
+
+    def cancelBooking(self, id):
+        """
+        Anuluje wszystkie rezerwacje dla danego użytkownika.
+
+        Args:
+            id (int): Identyfikator użytkownika
+
+        Returns:
+            bool: True jeśli anulowano jakiekolwiek rezerwacje, False w przeciwnym razie
+        """
+        with self._lock:
+            return super().cancelBooking(id)
+
+    def userReservation(self, id: int):
+        """
+        Zwraca listę wszystkich rezerwacji danego użytkownika.
+
+        Args:
+            id (int): Identyfikator użytkownika
+
+        Returns:
+            list: Lista rezerwacji użytkownika
+
+        Raises:
+            ValueError: Gdy identyfikator użytkownika jest nieprawidłowy
+        """
+        with self._lock:
+            return super().userReservation(id)
+
+    def archiveBefore(self, date: str):
+        """
+        Przenosi do archiwum rezerwacje, których pobyt zakończył się przed podaną datą.
+
+        Args:
+            date (str): Data w formacie 'YYYY-MM-DD'
+
+        Returns:
+            int: Liczba zarchiwizowanych rezerwacji
+        """
+        with self._lock:
+            return super().archiveBefore(date)
+
+    def freeBeds(self, check_in: str, check_out: str):
+        """
+        Zwraca liczbę łóżek wolnych w każdej nocy podanego przedziału.
+
+        Args:
+            check_in (str): Data przyjazdu w formacie 'YYYY-MM-DD'
+            check_out (str): Data wyjazdu w formacie 'YYYY-MM-DD'
+
+        Returns:
+            int: Liczba wolnych łóżek
+        """
+        with self._lock:
+            return super().freeBeds(check_in, check_out)
+
+    def availableDates(self, start: str, days: int, beds: int, nights: int = 1):
+        """
+        Zwraca daty przyjazdu, dla których w hotelu jest miejsce na pobyt.
+
+        Args:
+            start (str): Pierwsza sprawdzana data przyjazdu w formacie 'YYYY-MM-DD'
+            days (int): Liczba kolejnych sprawdzanych dni
+            beds (int): Liczba potrzebnych łóżek
+            nights (int): Liczba nocy pobytu
+
+        Returns:
+            list: Daty przyjazdu w formacie 'YYYY-MM-DD'
+        """
+        with self._lock:
+            return super().availableDates(start, days, beds, nights)
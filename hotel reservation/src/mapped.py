@@ -0,0 +1,294 @@
+import mmap
+import os
+import struct
+
+from src.reservation import Reservation
+from src.reviews import Review
+from src.users import User
+from src.validation import format_date, parse_date
+
+# oznaczenie formatu; zmienia się razem z układem rekordów
+MAPPED_MAGIC = b"HOTELMP2"
+HEADER = struct.Struct("<8sQQQQQQQ")
+# liczby łóżek i nocy są zapisywane w 64 bitach, bo liczba łóżek nie ma górnej granicy
+RESERVATION_RECORD = struct.Struct("<qqqiqII")
+USER_RECORD = struct.Struct("<qIIII")
+REVIEW_RECORD = struct.Struct("<qiII")
+KEY = struct.Struct("<q")
+INT64_LIMIT = 1 << 63
+
+
+class _StringTable:
+    """Bufor tekstów zapisywanych w migawce; powtarzające się teksty są zapisywane raz."""
+
+    def __init__(self):
+        """Inicjalizuje pusty bufor."""
+        self.data = bytearray()
+        self._offsets = {}
+
+    def add(self, text: str):
+        """
+        Dodaje tekst do bufora.
+
+        Returns:
+            tuple: Przesunięcie i długość zakodowanego tekstu
+        """
+        found = self._offsets.get(text)
+        if found is None:
+            encoded = text.encode("utf-8")
+            found = self._offsets[text] = (len(self.data), len(encoded))
+            self.data += encoded
+        return found
+
+
+def write_mapped_snapshot(path: str, reservations=None, users=None, reviews=None):
+    """
+    Zapisuje migawkę o stałym układzie, którą można otworzyć przez mmap.
+
+    Rekordy każdej sekcji mają stały rozmiar i są posortowane według
+    identyfikatora, dzięki czemu wyszukiwanie nie wymaga wczytania pliku.
+    Plik jest zapisywany obok i podmieniany atomowo, więc czytelnicy
+    z otwartym MappedSnapshot nadal widzą poprzednią, pełną wersję.
+
+    Args:
+        path (str): Ścieżka do pliku migawki
+        reservations (ReservationManagement, optional): Menedżer rezerwacji
+        users (UserManagement, optional): Menedżer użytkowników
+        reviews (Reviews, optional): Menedżer recenzji
+
+    Raises:
+        ValueError: Gdy liczba łóżek rezerwacji nie mieści się w 64 bitach
+    """
+    strings = _StringTable()
+    reservation_rows = sorted(
+        reservations.reservations if reservations is not None else (),
+        key=lambda reservation: (reservation.id, reservation.reservation_number),
+    )
+    user_rows = sorted(users.users.values() if users is not None else (), key=lambda user: user.id)
+    review_rows = sorted(
+        reviews.reviews_list.values() if reviews is not None else (), key=lambda review: review.id
+    )
+
+    body = bytearray()
+    for reservation in reservation_rows:
+        if not -INT64_LIMIT <= reservation.beds < INT64_LIMIT:
+            raise ValueError("Number of beds must be a valid integer.")
+        body += RESERVATION_RECORD.pack(
+            reservation.id, reservation.reservation_number, reservation.beds,
+            parse_date(reservation.date), reservation.nights, *strings.add(reservation.user)
+        )
+    users_offset = HEADER.size + len(body)
+    for user in user_rows:
+        body += USER_RECORD.pack(user.id, *strings.add(user.email), *strings.add(user.password))
+    reviews_offset = HEADER.size + len(body)
+    for review in review_rows:
+        body += REVIEW_RECORD.pack(review.id, review.stars, *strings.add(review.comment))
+    strings_offset = HEADER.size + len(body)
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(HEADER.pack(
+            MAPPED_MAGIC, len(reservation_rows), HEADER.size, len(user_rows), users_offset,
+            len(review_rows), reviews_offset, strings_offset
+        ))
+        file.write(body)
+        file.write(strings.data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+class _MappedSection:
+    """Sekcja migawki z rekordami o stałym rozmiarze posortowanymi według identyfikatora."""
+
+    def __init__(self, snapshot, record: struct.Struct, count: int, offset: int):
+        """
+        Args:
+            snapshot (MappedSnapshot): Migawka, do której należy sekcja
+            record (struct.Struct): Układ pojedynczego rekordu
+            count (int): Liczba rekordów
+            offset (int): Przesunięcie pierwszego rekordu w pliku
+        """
+        self._snapshot = snapshot
+        self._record = record
+        self._count = count
+        self._offset = offset
+
+    def __len__(self):
+        """Zwraca liczbę rekordów w sekcji."""
+        return self._count
+
+    def _key(self, index: int):
+        """Zwraca identyfikator rekordu o podanej pozycji."""
+        return KEY.unpack_from(self._snapshot._buffer, self._offset + index * self._record.size)[0]
+
+    def _row(self, index: int):
+        """Zwraca rozpakowany rekord o podanej pozycji."""
+        return self._record.unpack_from(self._snapshot._buffer, self._offset + index * self._record.size)
+
+    def _lower_bound(self, id: int):
+        """Zwraca pierwszą pozycję, której identyfikator nie jest mniejszy od id."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < id:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class MappedReservations(_MappedSection):
+    """Rezerwacje z migawki tylko do odczytu, materializowane przy dostępie."""
+
+    def _materialize(self, row):
+        """Tworzy obiekt Reservation z rekordu."""
+        id, number, beds, ordinal, nights, user_offset, user_length = row
+        user = self._snapshot._string(user_offset, user_length)
+        return Reservation(id, number, beds, user, format_date(ordinal), nights)
+
+    @property
+    def reservations(self):
+        """
+        Zwraca wszystkie rezerwacje z migawki w kolejności numerów rezerwacji.
+
+        Returns:
+            list: Lista rezerwacji
+        """
+        rows = [self._materialize(self._row(index)) for index in range(self._count)]
+        return sorted(rows, key=lambda reservation: reservation.reservation_number)
+
+    def userReservation(self, id: int):
+        """
+        Zwraca listę rezerwacji danego użytkownika.
+
+        Args:
+            id (int): Identyfikator użytkownika
+
+        Returns:
+            list: Lista rezerwacji użytkownika
+
+        Raises:
+            ValueError: Gdy identyfikator użytkownika jest nieprawidłowy
+        """
+        if id is None or not isinstance(id, int):
+            raise ValueError("User ID must be a valid integer.")
+        result = []
+        index = self._lower_bound(id)
+        while index < self._count and self._key(index) == id:
+            result.append(self._materialize(self._row(index)))
+            index += 1
+        return result
+
+
+class MappedUsers(_MappedSection):
+    """Użytkownicy z migawki tylko do odczytu, materializowani przy dostępie."""
+
+    def getUser(self, id: int):
+        """
+        Pobiera użytkownika o podanym ID.
+
+        Args:
+            id (int): Identyfikator użytkownika
+
+        Returns:
+            User or None: Obiekt użytkownika lub None jeśli użytkownik nie istnieje
+        """
+        if not isinstance(id, int):
+            return None
+        index = self._lower_bound(id)
+        if index == self._count or self._key(index) != id:
+            return None
+        _, email_offset, email_length, password_offset, password_length = self._row(index)
+        return User(
+            id,
+            self._snapshot._string(email_offset, email_length),
+            self._snapshot._string(password_offset, password_length),
+        )
+
+
+class MappedReviews(_MappedSection):
+    """Recenzje z migawki tylko do odczytu, materializowane przy dostępie."""
+
+    def get_review(self, id: int):
+        """
+        Pobiera recenzję o podanym ID.
+
+        Args:
+            id (int): Identyfikator recenzji
+
+        Returns:
+            Review or None: Obiekt recenzji lub None jeśli recenzja nie istnieje
+
+        Raises:
+            TypeError: Gdy podany identyfikator jest nieprawidłowy
+        """
+        if id is None:
+            raise TypeError("Review ID must be a valid integer.")
+        if not isinstance(id, int):
+            return None
+        index = self._lower_bound(id)
+        if index == self._count or self._key(index) != id:
+            return None
+        _, stars, comment_offset, comment_length = self._row(index)
+        return Review(id, stars, self._snapshot._string(comment_offset, comment_length))
+
+
+class MappedSnapshot:
+    """
+    Migawka otwarta przez mmap, przeznaczona dla replik tylko do odczytu.
+
+    Plik nie jest wczytywany przy otwarciu; obiekty są tworzone dopiero przy
+    zapytaniu, a strony pliku mogą być współdzielone przez wiele procesów.
+
+    Attributes:
+        reservations (MappedReservations): Rezerwacje z migawki
+        users (MappedUsers): Użytkownicy z migawki
+        reviews (MappedReviews): Recenzje z migawki
+    """
+
+    def __init__(self, path: str):
+        """
+        Otwiera migawkę.
+
+        Args:
+            path (str): Ścieżka do pliku migawki
+
+        Raises:
+            ValueError: Gdy plik nie jest migawką w oczekiwanym formacie
+        """
+        with open(path, "rb") as file:
+            try:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError("Snapshot file is corrupted.") from None
+        if len(self._buffer) < HEADER.size:
+            self._buffer.close()
+            raise ValueError("Snapshot file is corrupted.")
+        (magic, reservation_count, reservations_offset, user_count, users_offset,
+         review_count, reviews_offset, self._strings_offset) = HEADER.unpack_from(self._buffer)
+        if magic != MAPPED_MAGIC:
+            self._buffer.close()
+            raise ValueError("Snapshot file is corrupted.")
+        self.reservations = MappedReservations(
+            self, RESERVATION_RECORD, reservation_count, reservations_offset
+        )
+        self.users = MappedUsers(self, USER_RECORD, user_count, users_offset)
+        self.reviews = MappedReviews(self, REVIEW_RECORD, review_count, reviews_offset)
+
+    def _string(self, offset: int, length: int):
+        """Odczytuje tekst z bufora tekstów migawki."""
+        start = self._strings_offset + offset
+        return self._buffer[start:start + length].decode("utf-8")
+
+    def close(self):
+        """Zamyka odwzorowanie pliku."""
+        self._buffer.close()
+
+    def __enter__(self):
+        """Zwraca migawkę do użycia w bloku with."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Zamyka migawkę po wyjściu z bloku with."""
+        self.close()
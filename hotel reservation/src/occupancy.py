@@ -0,0 +1,327 @@
+class OccupancyTree:
+    """
+    Drzewo przedziałowe liczby zajętych łóżek dla kolejnych nocy.
+
+    Noce są indeksowane numerem dnia (ordinal) względem początku pokrytego
+    zakresu. Dodanie wartości do przedziału nocy oraz zapytania o maksimum,
+    minimum i sumę w przedziale mają koszt O(log n) dzięki leniwej propagacji;
+    obie operacje działają iteracyjnie, od liści w górę. Zakres drzewa jest
+    stały, a przedziały przekazywane do metod muszą się w nim mieścić
+    (OccupancyCalendar dzieli dłuższe przedziały między bloki).
+
+    Attributes:
+        origin (int): Numer dnia pierwszej pokrytej nocy
+        size (int): Liczba pokrytych nocy (potęga dwójki)
+    """
+
+    def __init__(self, size: int = 512, origin: int = 0):
+        """
+        Inicjalizuje puste drzewo.
+
+        Args:
+            size (int): Liczba pokrytych nocy (zaokrąglana w górę do potęgi dwójki)
+            origin (int): Numer dnia pierwszej pokrytej nocy
+
+        Raises:
+            ValueError: Gdy rozmiar jest nieprawidłowy
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("Tree size must be a valid integer.")
+        self.origin = origin
+        self.size = 1 << (size - 1).bit_length()
+        self._max = [0] * (2 * self.size)
+        self._min = [0] * (2 * self.size)
+        self._sum = [0] * (2 * self.size)
+        self._lazy = [0] * (2 * self.size)
+
+    def _apply(self, node: int, length: int, value: int):
+        """Dodaje wartość do wszystkich nocy poddrzewa węzła."""
+        self._max[node] += value
+        self._min[node] += value
+        self._sum[node] += value * length
+        if node < self.size:
+            self._lazy[node] += value
+
+    def _push(self, node: int, length: int):
+        """Przekazuje odłożoną wartość węzła do jego dzieci."""
+        value = self._lazy[node]
+        if value:
+            self._apply(2 * node, length // 2, value)
+            self._apply(2 * node + 1, length // 2, value)
+            self._lazy[node] = 0
+
+    def is_empty(self):
+        """
+        Sprawdza, czy wszystkie pokryte noce mają zerową zajętość.
+
+        Returns:
+            bool: True jeśli drzewo nie zawiera zajętych łóżek
+        """
+        # korzeń przechowuje maksimum i minimum całego zakresu
+        return self._max[1] == 0 and self._min[1] == 0
+
+    def _rebuild(self, first: int, last: int):
+        """Przelicza przodków liści first i last po zmianie przedziału między nimi."""
+        maxima, minima, sums, lazy = self._max, self._min, self._sum, self._lazy
+        length = 1
+        while first > 1:
+            first >>= 1
+            last >>= 1
+            length <<= 1
+            for node in (first, last) if first != last else (first,):
+                left, right, pending = 2 * node, 2 * node + 1, lazy[node]
+                high, low = maxima[left], maxima[right]
+                maxima[node] = (high if high > low else low) + pending
+                high, low = minima[left], minima[right]
+                minima[node] = (high if high < low else low) + pending
+                sums[node] = sums[left] + sums[right] + pending * length
+
+    def _push_paths(self, first: int, last: int):
+        """Przekazuje w dół odłożone wartości przodków liści first i last."""
+        lazy, size = self._lazy, self.size
+        for shift in range(size.bit_length() - 1, 0, -1):
+            for node in {first >> shift, last >> shift}:
+                if lazy[node]:
+                    self._push(node, 1 << shift)
+
+    def add(self, start: int, end: int, value: int):
+        """
+        Dodaje wartość do zajętości nocy z przedziału [start, end).
+
+        Args:
+            start (int): Numer dnia pierwszej nocy
+            end (int): Numer dnia po ostatniej nocy
+            value (int): Dodawana liczba łóżek (ujemna przy zwalnianiu)
+        """
+        if end <= start:
+            return
+        low = start - self.origin + self.size
+        high = end - self.origin + self.size
+        first, last, length = low, high - 1, 1
+        # iteracyjnie, od liści w górę: wystarczy O(log n) węzłów pokrywających przedział
+        while low < high:
+            if low & 1:
+                self._apply(low, length, value)
+                low += 1
+            if high & 1:
+                high -= 1
+                self._apply(high, length, value)
+            low >>= 1
+            high >>= 1
+            length <<= 1
+        self._rebuild(first, last)
+
+    def _query(self, values, combine, low: int, high: int):
+        """Łączy funkcją combine wartości liści [low, high) (indeksy względem origin)."""
+        low += self.size
+        high += self.size
+        self._push_paths(low, high - 1)
+        left = right = None
+        while low < high:
+            if low & 1:
+                left = values[low] if left is None else combine(left, values[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                right = values[high] if right is None else combine(values[high], right)
+            low >>= 1
+            high >>= 1
+        if left is None:
+            return right
+        return left if right is None else combine(left, right)
+
+    def maximum(self, start: int, end: int):
+        """
+        Zwraca największą zajętość w przedziale nocy [start, end).
+
+        Returns:
+            int: Największa liczba zajętych łóżek
+        """
+        if end <= start:
+            return 0
+        return self._query(self._max, max, start - self.origin, end - self.origin)
+
+    def minimum(self, start: int, end: int):
+        """
+        Zwraca najmniejszą zajętość w przedziale nocy [start, end).
+
+        Returns:
+            int: Najmniejsza liczba zajętych łóżek
+        """
+        if end <= start:
+            return 0
+        return self._query(self._min, min, start - self.origin, end - self.origin)
+
+    def total(self, start: int, end: int):
+        """
+        Zwraca sumę zajętości w przedziale nocy [start, end) (liczbę łóżkonocy).
+
+        Returns:
+            int: Suma liczby zajętych łóżek
+        """
+        if end <= start:
+            return 0
+        return self._query(self._sum, int.__add__, start - self.origin, end - self.origin)
+
+    def at_most(self, start: int, end: int, limit: int):
+        """
+        Zwraca noce z przedziału [start, end), których zajętość nie przekracza limitu.
+
+        Poddrzewa o minimum większym niż limit są pomijane, więc koszt wynosi
+        O((k + 1) log n) dla k zwróconych nocy.
+
+        Args:
+            start (int): Numer dnia pierwszej nocy
+            end (int): Numer dnia po ostatniej nocy
+            limit (int): Największa dopuszczalna zajętość
+
+        Returns:
+            list: Rosnące numery dni pasujących nocy
+        """
+        found = []
+        if end > start:
+            self._collect(1, 0, self.size, start - self.origin, end - self.origin, limit, found)
+        return found
+
+    def _collect(self, node, low, high, start, end, limit, found):
+        """Dopisuje do found noce [start, end) poddrzewa węzła o zajętości do limitu."""
+        if end <= low or high <= start or self._min[node] > limit:
+            return
+        if high - low == 1:
+            found.append(self.origin + low)
+            return
+        self._push(node, high - low)
+        middle = (low + high) // 2
+        self._collect(2 * node, low, middle, start, end, limit, found)
+        self._collect(2 * node + 1, middle, high, start, end, limit, found)
+
+
+class OccupancyCalendar:
+    """
+    Rzadki kalendarz zajętości złożony z bloków stałej długości.
+
+    Każdy blok jest osobnym OccupancyTree o stałym początku, tworzonym przy
+    pierwszej zmianie w jego nocach i usuwanym, gdy jego zajętość wróci
+    do zera. Pamięć zależy więc od liczby bloków z rezerwacjami, a nie od
+    rozpiętości dat, dlatego odległe daty (np. w roku 9999) nie wymagają
+    budowy drzewa pokrywającego cały przedział. Bloki poza kalendarzem mają
+    zerową zajętość.
+
+    Attributes:
+        block (int): Liczba nocy w jednym bloku (potęga dwójki)
+        blocks (dict): Drzewa OccupancyTree według numeru bloku
+    """
+
+    def __init__(self, block: int = 512):
+        """
+        Inicjalizuje pusty kalendarz.
+
+        Args:
+            block (int): Liczba nocy w jednym bloku
+
+        Raises:
+            ValueError: Gdy długość bloku jest nieprawidłowa
+        """
+        if not isinstance(block, int) or block <= 0:
+            raise ValueError("Tree size must be a valid integer.")
+        self.block = 1 << (block - 1).bit_length()
+        self.blocks = {}
+
+    def _parts(self, start: int, end: int):
+        """Dzieli przedział nocy [start, end) na części leżące w kolejnych blokach."""
+        block = self.block
+        for number in range(start // block, (end - 1) // block + 1):
+            low = number * block
+            yield number, max(start, low), min(end, low + block)
+
+    def add(self, start: int, end: int, value: int):
+        """
+        Dodaje wartość do zajętości nocy z przedziału [start, end).
+
+        Args:
+            start (int): Numer dnia pierwszej nocy
+            end (int): Numer dnia po ostatniej nocy
+            value (int): Dodawana liczba łóżek (ujemna przy zwalnianiu)
+        """
+        if end <= start:
+            return
+        number = start // self.block
+        # typowy pobyt mieści się w jednym bloku
+        if (end - 1) // self.block == number:
+            parts = ((number, start, end),)
+        else:
+            parts = self._parts(start, end)
+        for number, low, high in parts:
+            tree = self.blocks.get(number)
+            if tree is None:
+                tree = self.blocks[number] = OccupancyTree(self.block, number * self.block)
+            tree.add(low, high, value)
+            if tree.is_empty():
+                del self.blocks[number]
+
+    def maximum(self, start: int, end: int):
+        """
+        Zwraca największą zajętość w przedziale nocy [start, end).
+
+        Returns:
+            int: Największa liczba zajętych łóżek
+        """
+        number = start // self.block
+        if end > start and (end - 1) // self.block == number:
+            tree = self.blocks.get(number)
+            return tree.maximum(start, end) if tree is not None else 0
+        result = None
+        for number, low, high in self._parts(start, end):
+            tree = self.blocks.get(number)
+            value = tree.maximum(low, high) if tree is not None else 0
+            result = value if result is None or value > result else result
+        return result or 0
+
+    def minimum(self, start: int, end: int):
+        """
+        Zwraca najmniejszą zajętość w przedziale nocy [start, end).
+
+        Returns:
+            int: Najmniejsza liczba zajętych łóżek
+        """
+        result = None
+        for number, low, high in self._parts(start, end):
+            tree = self.blocks.get(number)
+            value = tree.minimum(low, high) if tree is not None else 0
+            result = value if result is None or value < result else result
+        return result or 0
+
+    def total(self, start: int, end: int):
+        """
+        Zwraca sumę zajętości w przedziale nocy [start, end) (liczbę łóżkonocy).
+
+        Returns:
+            int: Suma liczby zajętych łóżek
+        """
+        return sum(
+            self.blocks[number].total(low, high)
+            for number, low, high in self._parts(start, end) if number in self.blocks
+        )
+
+    def at_most(self, start: int, end: int, limit: int):
+        """
+        Zwraca noce z przedziału [start, end), których zajętość nie przekracza limitu.
+
+        Args:
+            start (int): Numer dnia pierwszej nocy
+            end (int): Numer dnia po ostatniej nocy
+            limit (int): Największa dopuszczalna zajętość
+
+        Returns:
+            list: Rosnące numery dni pasujących nocy
+        """
+        found = []
+        if end <= start:
+            return found
+        for number, low, high in self._parts(start, end):
+            tree = self.blocks.get(number)
+            if tree is not None:
+                found.extend(tree.at_most(low, high, limit))
+            elif limit >= 0:
+                found.extend(range(low, high))
+        return found
@@ -0,0 +1,360 @@
+import inspect
+import json
+import os
+import pickle
+import threading
+from collections.abc import Iterator
+
+from src.mapped import write_mapped_snapshot
+from src.reservation import ReservationManagement
+from src.reviews import Reviews
+from src.users import UserManagement
+
+SNAPSHOT_FILE = "snapshot.bin"
+JOURNAL_FILE = "journal.log"
+SNAPSHOT_MAGIC = b"HOTELSNP1\n"
+
+MUTATING_METHODS = {
+    "reservations": ("booking", "bookMany", "cancelBooking", "archiveBefore"),
+    "users": ("addUser", "updateUser", "deleteUser"),
+    "reviews": ("add_review", "edit_review", "delete_review"),
+}
+# pozycja hasła w argumentach metod menedżera użytkowników; dziennik zawiera
+# zamiast niego wartość przechowywaną przez menedżer (skrót, gdy ma hasher)
+PASSWORD_ARGUMENTS = {"addUser": 1, "updateUser": 2}
+
+MANAGER_FACTORIES = {
+    "reservations": ReservationManagement,
+    "users": UserManagement,
+    "reviews": Reviews,
+}
+
+
+class Journal:
+    """
+    Dziennik operacji zapisywany tylko przez dopisywanie (append-only).
+
+    Każda operacja to jedna linia JSON. Wywołanie fsync jest wykonywane
+    co sync_every wpisów, co ogranicza koszt zapisu na dysk.
+
+    Attributes:
+        path (str): Ścieżka do pliku dziennika
+        sync_every (int): Liczba wpisów między kolejnymi wywołaniami fsync
+    """
+
+    def __init__(self, path: str, sync_every: int = 64):
+        """
+        Otwiera dziennik do dopisywania.
+
+        Args:
+            path (str): Ścieżka do pliku dziennika
+            sync_every (int): Liczba wpisów między kolejnymi wywołaniami fsync
+        """
+        if not isinstance(sync_every, int) or sync_every <= 0:
+            raise ValueError("Sync interval must be a valid integer.")
+        self.path = path
+        self.sync_every = sync_every
+        self._file = open(path, "a", encoding="utf-8")
+        self._pending = 0
+
+    def append(self, seq: int, target: str, method: str, args, kwargs):
+        """
+        Dopisuje operację do dziennika.
+
+        Args:
+            seq (int): Numer kolejny operacji
+            target (str): Nazwa menedżera ("reservations", "users" lub "reviews")
+            method (str): Nazwa wywołanej metody
+            args (list): Argumenty pozycyjne
+            kwargs (dict): Argumenty nazwane
+        """
+        self.append_encoded(seq, target, method, json.dumps([args, kwargs]))
+
+    def append_encoded(self, seq: int, target: str, method: str, arguments: str):
+        """
+        Dopisuje operację, której argumenty zakodowano wcześniej w JSON.
+
+        Args:
+            seq (int): Numer kolejny operacji
+            target (str): Nazwa menedżera ("reservations", "users" lub "reviews")
+            method (str): Nazwa wywołanej metody
+            arguments (str): Lista JSON [args, kwargs]
+        """
+        header = json.dumps([seq, target, method])
+        self._file.write(f"{header[:-1]}, {arguments[1:]}\n")
+        self._pending += 1
+        if self._pending >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        """Zapisuje bufor i wymusza utrwalenie danych na dysku."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def truncate(self):
+        """Czyści dziennik po zapisaniu migawki."""
+        self._file.close()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self.sync()
+
+    def close(self):
+        """Utrwala oczekujące wpisy i zamyka plik."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    @staticmethod
+    def repair(path: str):
+        """
+        Obcina dziennik do końca ostatniej pełnej linii.
+
+        Niepełna ostatnia linia (bez znaku końca linii, np. po awarii w trakcie
+        zapisu) jest usuwana, aby kolejne wpisy nie zostały do niej doklejone.
+        Pełna linia, której nie da się odczytać, oznacza uszkodzenie dziennika;
+        plik nie jest wtedy zmieniany, bo obcięcie usunęłoby dalsze poprawne wpisy.
+
+        Args:
+            path (str): Ścieżka do pliku dziennika
+
+        Raises:
+            ValueError: Gdy którakolwiek pełna linia dziennika jest uszkodzona
+        """
+        if not os.path.exists(path):
+            return
+        valid = 0
+        with open(path, "rb") as file:
+            for line in file:
+                # tylko ostatnia linia pliku może nie mieć znaku końca linii
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    raise ValueError("Journal file is corrupted.") from None
+                valid += len(line)
+        if valid < os.path.getsize(path):
+            with open(path, "r+b") as file:
+                file.truncate(valid)
+                file.flush()
+                os.fsync(file.fileno())
+
+    @staticmethod
+    def read(path: str):
+        """
+        Odczytuje wpisy dziennika.
+
+        Niepełna ostatnia linia (np. po awarii w trakcie zapisu) jest pomijana.
+
+        Args:
+            path (str): Ścieżka do pliku dziennika
+
+        Yields:
+            list: Wpisy [seq, target, method, args, kwargs]
+
+        Raises:
+            ValueError: Gdy którakolwiek pełna linia dziennika jest uszkodzona
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    return
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    raise ValueError("Journal file is corrupted.") from None
+                yield entry
+
+
+class _JournaledManager:
+    """
+    Pośrednik przekazujący wywołania do menedżera i zapisujący
+    w dzienniku udane operacje modyfikujące.
+    """
+
+    def __init__(self, state, target: str, manager):
+        """
+        Args:
+            state (PersistentState): Stan, do którego należy menedżer
+            target (str): Nazwa menedżera w dzienniku
+            manager: Opakowywany menedżer
+        """
+        self._state = state
+        self._target = target
+        self._manager = manager
+
+    def __getattr__(self, name):
+        """Zwraca atrybut menedżera; metody modyfikujące są zapisywane w dzienniku."""
+        attribute = getattr(self._manager, name)
+        if name not in MUTATING_METHODS[self._target]:
+            return attribute
+
+        def journaled(*args, **kwargs):
+            # argumenty są kodowane przed wywołaniem, aby operacji, której nie da się
+            # zapisać w dzienniku, nie wykonać; iteratory są wcześniej materializowane
+            args = [list(arg) if isinstance(arg, Iterator) else arg for arg in args]
+            arguments = json.dumps([args, kwargs])
+            # wykonanie i zapis są jedną sekcją krytyczną, więc kolejność wpisów
+            # w dzienniku jest kolejnością wykonania (i nadanych numerów rezerwacji)
+            with self._state._lock:
+                result = attribute(*args, **kwargs)
+                if name in PASSWORD_ARGUMENTS:
+                    arguments = self._stored_password_arguments(attribute, name, args, kwargs, result)
+                self._state._record(self._target, name, arguments)
+            return result
+
+        return journaled
+
+    def _stored_password_arguments(self, method, name: str, args, kwargs, result):
+        """Koduje argumenty, zastępując hasło wartością zapisaną przez menedżer."""
+        call = inspect.signature(method).bind(*args, **kwargs)
+        args = list(call.args)
+        user_id = result if name == "addUser" else args[0]
+        args[PASSWORD_ARGUMENTS[name]] = self._manager.getUser(user_id).password
+        return json.dumps([args, call.kwargs])
+
+
+def _replay(manager, target: str, method: str, args, kwargs):
+    """
+    Powtarza operację z dziennika.
+
+    Hasła są już w postaci przechowywanej, a archiveBefore jedynie usuwa
+    rezerwacje zapisane w archiwum przy pierwotnym wywołaniu.
+    """
+    if target == "reservations" and method == "archiveBefore":
+        manager._replay_archive(*args, **kwargs)
+        return
+    if target != "users" or method not in PASSWORD_ARGUMENTS:
+        getattr(manager, method)(*args, **kwargs)
+        return
+    hasher, manager.hasher = manager.hasher, None
+    try:
+        getattr(manager, method)(*args, **kwargs)
+    finally:
+        manager.hasher = hasher
+
+
+class PersistentState:
+    """
+    Trwały stan systemu hotelowego: migawka binarna i dziennik operacji.
+
+    Udane operacje modyfikujące są dopisywane do dziennika. Co snapshot_every
+    operacji wszystkie menedżery są zapisywane do migawki, a dziennik jest
+    czyszczony. Odtworzenie stanu wczytuje migawkę i powtarza jedynie
+    operacje zapisane po niej. Operacje modyfikujące z wielu wątków są
+    wykonywane i zapisywane po kolei. Hasła użytkowników trafiają do dziennika
+    w postaci przechowywanej przez menedżer - skonfigurowany z PasswordHasher
+    zapisuje więc tylko ich skróty.
+
+    Attributes:
+        directory (str): Katalog z plikami migawki i dziennika
+        seq (int): Numer ostatniej zapisanej operacji
+        reservations: Menedżer rezerwacji (z zapisem do dziennika)
+        users: Menedżer użytkowników (z zapisem do dziennika)
+        reviews: Menedżer recenzji (z zapisem do dziennika)
+    """
+
+    def __init__(self, directory: str, sync_every: int = 64, snapshot_every: int = 10000,
+                 factories: dict = None):
+        """
+        Otwiera stan zapisany w katalogu lub tworzy nowy.
+
+        Args:
+            directory (str): Katalog z plikami migawki i dziennika
+            sync_every (int): Liczba wpisów między kolejnymi wywołaniami fsync
+            snapshot_every (int): Liczba operacji między automatycznymi migawkami
+            factories (dict, optional): Funkcje bez argumentów tworzące skonfigurowane
+                menedżery ("reservations", "users", "reviews"), np. z total_beds,
+                hasherem lub wspólnym rejestrem; używane, gdy nie ma migawki
+
+        Raises:
+            ValueError: Gdy podano fabrykę nieznanego menedżera albo migawka
+                lub dziennik są uszkodzone
+        """
+        factories = dict(factories or {})
+        if not set(factories) <= set(MANAGER_FACTORIES):
+            raise ValueError("Manager factories must use valid manager names.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self._factories = {**MANAGER_FACTORIES, **factories}
+        self._lock = threading.RLock()
+        self.seq, self._managers = self._recover()
+        self._since_snapshot = 0
+        self._journal = Journal(os.path.join(directory, JOURNAL_FILE), sync_every)
+        self.reservations = _JournaledManager(self, "reservations", self._managers["reservations"])
+        self.users = _JournaledManager(self, "users", self._managers["users"])
+        self.reviews = _JournaledManager(self, "reviews", self._managers["reviews"])
+
+    def _recover(self):
+        """
+        Wczytuje najnowszą migawkę i powtarza operacje z dziennika.
+
+        Returns:
+            tuple: Numer ostatniej operacji oraz słownik menedżerów
+        """
+        seq = 0
+        managers = {target: factory() for target, factory in self._factories.items()}
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "rb") as file:
+                if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                    raise ValueError("Snapshot file is corrupted.")
+                seq, managers = pickle.load(file)
+
+        journal_path = os.path.join(self.directory, JOURNAL_FILE)
+        Journal.repair(journal_path)
+        for entry_seq, target, method, args, kwargs in Journal.read(journal_path):
+            if entry_seq <= seq:
+                continue
+            _replay(managers[target], target, method, args, kwargs)
+            seq = entry_seq
+        return seq, managers
+
+    def _record(self, target: str, method: str, arguments: str):
+        """Dopisuje udaną operację do dziennika i w razie potrzeby tworzy migawkę."""
+        self.seq += 1
+        self._journal.append_encoded(self.seq, target, method, arguments)
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """Zapisuje migawkę wszystkich menedżerów i czyści dziennik."""
+        with self._lock:
+            self._journal.sync()
+            path = os.path.join(self.directory, SNAPSHOT_FILE)
+            temporary_path = path + ".tmp"
+            with open(temporary_path, "wb") as file:
+                file.write(SNAPSHOT_MAGIC)
+                pickle.dump((self.seq, self._managers), file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, path)
+            self._journal.truncate()
+            self._since_snapshot = 0
+
+    def export_mapped(self, path: str):
+        """
+        Zapisuje migawkę o stałym układzie do odczytu przez MappedSnapshot.
+
+        Args:
+            path (str): Ścieżka do pliku migawki
+        """
+        with self._lock:
+            write_mapped_snapshot(
+                path, self._managers["reservations"], self._managers["users"],
+                self._managers["reviews"],
+            )
+
+    def sync(self):
+        """Utrwala oczekujące wpisy dziennika."""
+        with self._lock:
+            self._journal.sync()
+
+    def close(self):
+        """Utrwala dziennik i zamyka plik."""
+        with self._lock:
+            self._journal.close()
@@ -0,0 +1,206 @@
+from array import array
+
+
+class UserReservationRegistry:
+    """
+    Rejestr powiązań między użytkownikami a ich rezerwacjami.
+
+    Rejestr może być współdzielony przez jeden ReservationManagement
+    i UserManagement, dzięki czemu oba menedżery widzą te same powiązania.
+    Dla każdego użytkownika numery rezerwacji są przechowywane w słowniku
+    zachowującym kolejność, więc dodanie i usunięcie powiązania ma koszt O(1).
+    Zwarty rejestr (dla magazynu kolumnowego) przechowuje je w tablicy liczb:
+    dodanie kosztuje O(1), a usunięcie pojedynczego powiązania O(k) dla k
+    rezerwacji użytkownika, za to bez obiektu Pythona na każdą rezerwację.
+
+    Attributes:
+        links (dict): Numery rezerwacji (klucze słownika lub tablica) według
+            identyfikatora użytkownika
+        compact (bool): Czy numery są przechowywane w tablicach
+    """
+
+    def __init__(self, compact: bool = False):
+        """
+        Inicjalizuje pusty rejestr.
+
+        Args:
+            compact (bool): Czy przechowywać numery rezerwacji w tablicach
+        """
+        self.links = {}
+        self.compact = compact
+        self._manager = None
+
+    def attach(self, manager):
+        """
+        Rejestruje menedżer rezerwacji używany przy kaskadowym anulowaniu.
+
+        Numery rezerwacji są unikalne tylko w obrębie jednego menedżera,
+        dlatego rejestr może obsługiwać tylko jeden menedżer rezerwacji.
+
+        Args:
+            manager (ReservationManagement): Menedżer rezerwacji
+
+        Raises:
+            ValueError: Gdy rejestr jest już używany przez inny menedżer
+        """
+        if self._manager is not None and self._manager is not manager:
+            raise ValueError("Registry is already attached to another reservation manager.")
+        self._manager = manager
+
+    def link(self, user_id: int, reservation_number: int):
+        """
+        Dodaje powiązanie użytkownika z rezerwacją.
+
+        Args:
+            user_id (int): Identyfikator użytkownika
+            reservation_number (int): Numer rezerwacji
+        """
+        numbers = self.links.get(user_id)
+        if numbers is None:
+            numbers = self.links[user_id] = array("q") if self.compact else {}
+        if self.compact:
+            numbers.append(reservation_number)
+        else:
+            numbers[reservation_number] = None
+
+    def unlink(self, user_id: int, reservation_number: int):
+        """
+        Usuwa powiązanie użytkownika z rezerwacją.
+
+        Args:
+            user_id (int): Identyfikator użytkownika
+            reservation_number (int): Numer rezerwacji
+        """
+        numbers = self.links.get(user_id)
+        if numbers is None:
+            return
+        if self.compact:
+            if reservation_number in numbers:
+                numbers.remove(reservation_number)
+        else:
+            numbers.pop(reservation_number, None)
+        if not numbers:
+            del self.links[user_id]
+
+    def unlink_user(self, user_id: int):
+        """
+        Usuwa wszystkie powiązania użytkownika.
+
+        Args:
+            user_id (int): Identyfikator użytkownika
+
+        Returns:
+            list: Numery rezerwacji, które były powiązane z użytkownikiem
+        """
+        return list(self.links.pop(user_id, ()))
+
+    def reservations_of(self, user_id: int):
+        """
+        Zwraca numery rezerwacji użytkownika w kolejności ich dodania.
+
+        Args:
+            user_id (int): Identyfikator użytkownika
+
+        Returns:
+            list: Numery rezerwacji
+        """
+        return list(self.links.get(user_id, ()))
+
+    def has_reservations(self, user_id: int):
+        """
+        Sprawdza, czy użytkownik ma jakiekolwiek rezerwacje.
+
+        Args:
+            user_id (int): Identyfikator użytkownika
+
+        Returns:
+            bool: True jeśli użytkownik ma rezerwacje
+        """
+        return user_id in self.links
+
+    def cancel_user(self, user_id: int):
+        """
+        Anuluje rezerwacje użytkownika w zarejestrowanym menedżerze rezerwacji.
+
+        Args:
+            user_id (int): Identyfikator użytkownika
+
+        Returns:
+            bool: True jeśli anulowano jakiekolwiek rezerwacje
+        """
+        if self._manager is None:
+            return bool(self.unlink_user(user_id))
+        return self._manager.cancelBooking(user_id)
+
+
+class UserReservations:
+    """
+    Widok numerów rezerwacji jednego użytkownika zapisanych w rejestrze.
+
+    Widok nie przechowuje własnej kopii numerów, więc zawsze odpowiada
+    aktualnemu stanowi rejestru współdzielonego z ReservationManagement.
+
+    Attributes:
+        registry (UserReservationRegistry): Rejestr powiązań
+        user_id (int): Identyfikator użytkownika
+    """
+
+    __slots__ = ("registry", "user_id")
+
+    def __init__(self, registry: UserReservationRegistry, user_id: int):
+        """
+        Inicjalizuje widok rezerwacji użytkownika.
+
+        Args:
+            registry (UserReservationRegistry): Rejestr powiązań
+            user_id (int): Identyfikator użytkownika
+        """
+        self.registry = registry
+        self.user_id = user_id
+
+    def __len__(self):
+        return len(self.registry.links.get(self.user_id, ()))
+
+    def __iter__(self):
+        return iter(self.registry.reservations_of(self.user_id))
+
+    def __getitem__(self, index):
+        return self.registry.reservations_of(self.user_id)[index]
+
+    def __contains__(self, reservation_number):
+        return reservation_number in self.registry.links.get(self.user_id, ())
+
+    def __eq__(self, other):
+        if isinstance(other, (list, UserReservations)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.registry.reservations_of(self.user_id))
+
+    def append(self, reservation_number: int):
+        """
+        Dodaje powiązanie użytkownika z rezerwacją.
+
+        Args:
+            reservation_number (int): Numer rezerwacji
+        """
+        self.registry.link(self.user_id, reservation_number)
+
+    def remove(self, reservation_number: int):
+        """
+        Usuwa powiązanie użytkownika z rezerwacją.
+
+        Args:
+            reservation_number (int): Numer rezerwacji
+
+        Raises:
+            ValueError: Gdy użytkownik nie ma takiej rezerwacji
+        """
+        if reservation_number not in self:
+            raise ValueError("Reservation is not existing.")
+        self.registry.unlink(self.user_id, reservation_number)
+
+    def clear(self):
+        """Usuwa wszystkie powiązania użytkownika."""
+        self.registry.unlink_user(self.user_id)
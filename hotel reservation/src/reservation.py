@@ -1,4 +1,21 @@
-import re
+from src.capacity import RoomCapacity
+from src.registry import UserReservationRegistry
+from src.storage import ColumnarStore, ObjectStore
+from src.validation import format_date, parse_date, validate_booking
+
+
+def _check_out(date: str, nights: int):
+    """
+    Wylicza datę wyjazdu na podstawie daty przyjazdu i liczby nocy.
+
+    Args:
+        date (str): Data przyjazdu w formacie 'YYYY-MM-DD'
+        nights (int): Liczba nocy
+
+    Returns:
+        str: Data wyjazdu w formacie 'YYYY-MM-DD'
+    """
+    return format_date(parse_date(date) + nights)
 
 
 class Reservation:
@@ -10,11 +27,13 @@ class Reservation:
         reservation_number (int): Unikalny numer rezerwacji
         beds (int): Liczba łóżek w rezerwacji
         user (str): Nazwa użytkownika dokonującego rezerwacji
-        date (str): Data rezerwacji w formacie 'YYYY-MM-DD'
+        date (str): Data rezerwacji (przyjazdu) w formacie 'YYYY-MM-DD'
+        nights (int): Liczba nocy pobytu
     """
 
     def __init__(
-            self, id: int, reservation_number: int, beds: int, user: str, date: str
+            self, id: int, reservation_number: int, beds: int, user: str, date: str,
+            nights: int = 1
     ):
         """
         Inicjalizuje nową rezerwację.
@@ -25,12 +44,23 @@ class Reservation:
             beds (int): Liczba łóżek
             user (str): Nazwa użytkownika
             date (str): Data rezerwacji
+            nights (int): Liczba nocy pobytu
         """
         self.id = id
         self.reservation_number = reservation_number
         self.beds = beds
         self.user = user
         self.date = date
+        self.nights = nights
+
+    def check_out(self):
+        """
+        Zwraca datę wyjazdu wynikającą z daty przyjazdu i liczby nocy.
+
+        Returns:
+            str: Data wyjazdu w formacie 'YYYY-MM-DD'
+        """
+        return _check_out(self.date, self.nights)
 
 
 class ReservationManagement:
@@ -40,15 +70,87 @@ class ReservationManagement:
     Umożliwia dodawanie nowych rezerwacji, anulowanie istniejących
     oraz sprawdzanie rezerwacji dla konkretnego użytkownika.
 
+    Rezerwacje są przechowywane w magazynie (ObjectStore lub ColumnarStore),
+    a indeksy pomocnicze zawierają jedynie numery rezerwacji. W trybie
+    kolumnowym nie ma indeksu według daty: zajęte daty są sprawdzane
+    w wierszach rezerwacji użytkownika, a rejestr przechowuje numery
+    w tablicach, więc na rezerwację nie przypada żaden obiekt Pythona.
+
     Attributes:
         reservations (list): Lista wszystkich rezerwacji w systemie
+        store (ObjectStore or ColumnarStore): Magazyn rezerwacji
+        next_number (int): Następny numer rezerwacji (nigdy nie jest używany ponownie)
+        registry (UserReservationRegistry): Powiązania użytkowników z numerami rezerwacji
+        by_date (dict): Numery rezerwacji według numeru dnia przyjazdu (ordinal),
+            kluczowane parą (id, user); pusty w trybie kolumnowym
+        booked_keys (set): Zbiór krotek (id, user, ordinal) zajętych rezerwacji,
+            wyliczany z indeksów
+        capacity (RoomCapacity or None): Licznik łóżek, jeśli podano pojemność hotelu
+        changelog (ChangeLog or None): Bufor, do którego zgłaszane są zmiany
+        archive (ReservationArchive or None): Zimne archiwum zakończonych rezerwacji
     """
 
-    def __init__(self):
-        """Inicjalizuje nowy system zarządzania rezerwacjami."""
-        self.reservations = []
+    def __init__(self, total_beds: int = None, columnar: bool = False,
+                 registry: UserReservationRegistry = None, changelog=None, archive=None):
+        """
+        Inicjalizuje nowy system zarządzania rezerwacjami.
+
+        Args:
+            total_beds (int, optional): Łączna liczba łóżek w hotelu. Gdy podana,
+                rezerwacje przekraczające pojemność są odrzucane.
+            columnar (bool): Czy przechowywać rezerwacje w zwartym magazynie kolumnowym
+            registry (UserReservationRegistry, optional): Rejestr powiązań współdzielony
+                z UserManagement
+            changelog (ChangeLog, optional): Bufor, do którego zgłaszane są zmiany
+            archive (ReservationArchive, optional): Archiwum, do którego archiveBefore
+                przenosi zakończone rezerwacje
+        """
+        self.store = ColumnarStore() if columnar else ObjectStore(Reservation)
+        self.next_number = 1
+        self.registry = registry if registry is not None else UserReservationRegistry(columnar)
+        self.registry.attach(self)
+        self.by_date = {}
+        self._columnar = columnar
+        self.capacity = RoomCapacity(total_beds) if total_beds is not None else None
+        self.changelog = changelog
+        self.archive = archive
 
-    def booking(self, id: int, user: str, date: str, beds: int):
+    @property
+    def booked_keys(self):
+        """
+        Zwraca zajęte klucze rezerwacji wyliczone z indeksów.
+
+        Returns:
+            set: Krotki (id, user, ordinal)
+        """
+        if self._columnar:
+            return {
+                (reservation.id, reservation.user, parse_date(reservation.date))
+                for reservation in self.store.records()
+            }
+        return {
+            (id, user, ordinal)
+            for ordinal, same_date in self.by_date.items() for id, user in same_date
+        }
+
+    def _is_booked(self, id: int, user: str, ordinal: int):
+        """Sprawdza, czy użytkownik ma już rezerwację z przyjazdem w danym dniu."""
+        if self._columnar:
+            return self.store.booked(self.registry.reservations_of(id), user, ordinal)
+        same_date = self.by_date.get(ordinal)
+        return same_date is not None and (id, user) in same_date
+
+    @property
+    def reservations(self):
+        """
+        Zwraca listę aktywnych rezerwacji w kolejności ich dodania.
+
+        Returns:
+            list: Lista wszystkich rezerwacji w systemie
+        """
+        return self.store.records()
+
+    def booking(self, id: int, user: str, date: str, beds: int, nights: int = 1):
         """
         Dodaje nową rezerwację do systemu.
 
@@ -57,34 +159,124 @@ class ReservationManagement:
             user (str): Nazwa użytkownika
             date (str): Data rezerwacji w formacie 'YYYY-MM-DD'
             beds (int): Liczba łóżek
+            nights (int): Liczba nocy pobytu
 
         Raises:
-            ValueError: Gdy którykolwiek z parametrów jest nieprawidłowy lub gdy
-                       użytkownik już ma rezerwację na daną datę
+            ValueError: Gdy którykolwiek z parametrów jest nieprawidłowy, gdy
+                       użytkownik już ma rezerwację na daną datę lub gdy
+                       w hotelu brakuje wolnych łóżek
         """
-        # input validation
-        if id is None or not isinstance(id, int) or id <= 0:
-            raise ValueError("User ID must be a valid integer.")
-        if not isinstance(user, str) or not user:
-            raise ValueError("User name must be a valid string.")
-        if not re.match(r"^[a-zA-Z0-9]+$", user):
-            raise ValueError("User name must contain only letters and numbers.")
-        if not isinstance(date, str) or not date:
-            raise ValueError("Date must be a valid string in 'YYYY-MM-DD' format.")
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
-            raise ValueError("Date must be a valid string in 'YYYY-MM-DD' format.")
-        if beds is None or not isinstance(beds, int) or beds <= 0:
-            raise ValueError("Number of beds must be a valid integer.")
+        self._book(id, user, date, beds, nights)
+
+    def bookMany(self, rows):
+        """
+        Dodaje wiele rezerwacji w jednym przebiegu.
+
+        Każdy wiersz jest walidowany niezależnie, więc błędny wiersz nie przerywa
+        przetwarzania pozostałych. Konflikty wykrywane są zarówno z istniejącymi
+        rezerwacjami, jak i z wcześniejszymi wierszami tej samej partii.
 
+        Args:
+            rows (iterable): Krotki (id, user, date, beds) lub (id, user, date, beds, nights)
+
+        Returns:
+            list: Dla każdego wiersza utworzona Reservation albo zgłoszony ValueError
+        """
+        results = []
+        for row in rows:
+            try:
+                if not isinstance(row, (tuple, list)) or len(row) not in (4, 5):
+                    raise ValueError("Booking row must contain id, user, date and beds.")
+                results.append(self._book(*row))
+            except ValueError as error:
+                results.append(error)
+        return results
+
+    def _book(self, id, user, date, beds, nights=1):
+        """
+        Waliduje dane i zapisuje pojedynczą rezerwację.
+
+        Args:
+            id (int): Identyfikator użytkownika
+            user (str): Nazwa użytkownika
+            date (str): Data rezerwacji w formacie 'YYYY-MM-DD'
+            beds (int): Liczba łóżek
+            nights (int): Liczba nocy pobytu
+
+        Returns:
+            Reservation: Utworzona rezerwacja
+
+        Raises:
+            ValueError: Gdy dane są nieprawidłowe lub rezerwacja jest w konflikcie
+        """
+        ordinal = validate_booking(id, user, date, beds, nights)
+        return self._insert(id, user, date, ordinal, beds, nights)
+
+    def _insert(self, id, user, date, ordinal, beds, nights):
+        """
+        Zapisuje zwalidowaną rezerwację, jeśli nie jest w konflikcie.
+
+        Args:
+            ordinal (int): Numer dnia przyjazdu wyznaczony podczas walidacji
+
+        Returns:
+            Reservation: Utworzona rezerwacja
+
+        Raises:
+            ValueError: Gdy użytkownik już ma rezerwację na daną datę lub brakuje łóżek
+        """
         # checking conflicting reservations
-        for existing_reservation in self.reservations:
-            if existing_reservation.id == id and existing_reservation.user == user and existing_reservation.date == date:
-                raise ValueError("User already booked room(s) on this date.")
+        if self._is_booked(id, user, ordinal):
+            raise ValueError("User already booked room(s) on this date.")
 
         # creating new reservation id
-        newID = len(self.reservations) + 1
-        newReservation = Reservation(id, newID, beds, user, date)
-        self.reservations.append(newReservation)
+        newID = self.next_number
+        if self.capacity is not None:
+            self.capacity.reserve_nights(ordinal, ordinal + nights, beds)
+        try:
+            newReservation = self.store.add(id, newID, beds, user, date, nights)
+        except Exception:
+            if self.capacity is not None:
+                self.capacity.release_nights(ordinal, ordinal + nights, beds)
+            raise
+        self.next_number += 1
+        self._index(id, user, ordinal, newID)
+        if self.changelog is not None:
+            self.changelog.emit("reservation", "create", newID, {
+                "id": id, "user": user, "date": date, "beds": beds, "nights": nights,
+            })
+        return newReservation
+
+    def _index(self, id: int, user: str, ordinal: int, reservation_number: int):
+        """
+        Dodaje numer rezerwacji do indeksów pomocniczych.
+
+        Args:
+            id (int): Identyfikator użytkownika
+            user (str): Nazwa użytkownika
+            ordinal (int): Numer dnia przyjazdu
+            reservation_number (int): Numer rezerwacji
+        """
+        self.registry.link(id, reservation_number)
+        if not self._columnar:
+            self.by_date.setdefault(ordinal, {})[(id, user)] = reservation_number
+
+    def _unindex(self, reservation: Reservation):
+        """
+        Usuwa rezerwację z indeksu według daty.
+
+        Powiązania w rejestrze są usuwane w całości przez cancelBooking.
+
+        Args:
+            reservation (Reservation): Rezerwacja do usunięcia z indeksów
+        """
+        if self._columnar:
+            return
+        ordinal = parse_date(reservation.date)
+        same_date = self.by_date[ordinal]
+        del same_date[(reservation.id, reservation.user)]
+        if not same_date:
+            del self.by_date[ordinal]
 
     def cancelBooking(self, id):
         """
@@ -96,16 +288,19 @@ class ReservationManagement:
         Returns:
             bool: True jeśli anulowano jakiekolwiek rezerwacje, False w przeciwnym razie
         """
-        reservations_to_remove = []
-        for reservation in self.reservations:
-            if reservation.id == id:
-                reservations_to_remove.append(reservation)
-
-        if not reservations_to_remove:
+        numbers_to_remove = self.registry.unlink_user(id)
+        if not numbers_to_remove:
             return False
 
-        for reservation in reservations_to_remove:
-            self.reservations.remove(reservation)
+        for number in numbers_to_remove:
+            reservation = self.store.get(number)
+            self._unindex(reservation)
+            if self.capacity is not None:
+                start = parse_date(reservation.date)
+                self.capacity.release_nights(start, start + reservation.nights, reservation.beds)
+            self.store.remove(number)
+            if self.changelog is not None:
+                self.changelog.emit("reservation", "delete", number)
         return True
 
     def userReservation(self, id: int):
@@ -125,8 +320,147 @@ class ReservationManagement:
             raise ValueError("User ID must be a valid integer.")
 
         # creating user reservations list
-        user_reservations = []
-        for reservation in self.reservations:
-            if reservation.id == id:
-                user_reservations.append(reservation)
-        return user_reservations
+        return [self.store.get(number) for number in self.registry.reservations_of(id)]
+
+    def archiveBefore(self, date: str):
+        """
+        Przenosi do archiwum rezerwacje, których pobyt zakończył się przed podaną datą.
+
+        Zarchiwizowane rezerwacje znikają z magazynu, indeksów i rejestru, więc
+        nie spowalniają operacji na bieżących rezerwacjach, nie są anulowane
+        przez cancelBooking i nie blokują ponownej rezerwacji tej samej daty.
+        Zajętość łóżek w minionych nocach pozostaje bez zmian. Rezerwacje są
+        zapisywane w archiwum przed usunięciem, więc błąd zapisu niczego nie usuwa.
+
+        Args:
+            date (str): Data w formacie 'YYYY-MM-DD'; archiwizowane są pobyty
+                z datą wyjazdu nie późniejszą niż ta data
+
+        Returns:
+            int: Liczba zarchiwizowanych rezerwacji
+
+        Raises:
+            ValueError: Gdy archiwum nie zostało podane lub data jest nieprawidłowa
+        """
+        if self.archive is None:
+            raise ValueError("Reservation archive is not configured.")
+        expired = self._expired(parse_date(date))
+        if expired:
+            self.archive.write(expired)
+            self._remove_archived(expired)
+        return len(expired)
+
+    def _expired(self, horizon: int):
+        """
+        Zwraca rezerwacje z datą wyjazdu nie późniejszą niż podany dzień.
+
+        Args:
+            horizon (int): Numer dnia granicznego
+
+        Returns:
+            list: Rezerwacje w kolejności numerów rezerwacji
+        """
+        if self._columnar:
+            return self.store.ending_by(horizon)
+        expired = []
+        for ordinal, same_date in self.by_date.items():
+            if ordinal >= horizon:
+                continue
+            for number in same_date.values():
+                reservation = self.store.get(number)
+                if ordinal + reservation.nights <= horizon:
+                    expired.append(reservation)
+        expired.sort(key=lambda reservation: reservation.reservation_number)
+        return expired
+
+    def _remove_archived(self, expired):
+        """Usuwa zarchiwizowane rezerwacje z magazynu, indeksów i rejestru."""
+        for reservation in expired:
+            number = reservation.reservation_number
+            self._unindex(reservation)
+            self.registry.unlink(reservation.id, number)
+            self.store.remove(number)
+            if self.changelog is not None:
+                self.changelog.emit("reservation", "archive", number)
+
+    def _replay_archive(self, date: str):
+        """
+        Powtarza archiveBefore z dziennika bez ponownego zapisu do archiwum.
+
+        Rezerwacje zostały zapisane w archiwum przy pierwotnym wywołaniu,
+        więc usuwane są jedynie z bieżącego stanu.
+
+        Args:
+            date (str): Data przekazana do archiveBefore
+        """
+        self._remove_archived(self._expired(parse_date(date)))
+
+    def archivedReservations(self, id: int):
+        """
+        Zwraca zarchiwizowane rezerwacje użytkownika (wolna ścieżka, odczyt z dysku).
+
+        Args:
+            id (int): Identyfikator użytkownika
+
+        Returns:
+            list: Lista zarchiwizowanych rezerwacji użytkownika
+
+        Raises:
+            ValueError: Gdy archiwum nie zostało podane lub identyfikator jest nieprawidłowy
+        """
+        if self.archive is None:
+            raise ValueError("Reservation archive is not configured.")
+        if id is None or not isinstance(id, int):
+            raise ValueError("User ID must be a valid integer.")
+        return self.archive.find(id=id)
+
+    def freeBeds(self, check_in: str, check_out: str):
+        """
+        Zwraca liczbę łóżek wolnych w każdej nocy podanego przedziału.
+
+        Args:
+            check_in (str): Data przyjazdu w formacie 'YYYY-MM-DD'
+            check_out (str): Data wyjazdu w formacie 'YYYY-MM-DD'
+
+        Returns:
+            int: Liczba wolnych łóżek
+
+        Raises:
+            ValueError: Gdy pojemność hotelu nie została podana lub daty są nieprawidłowe
+        """
+        if self.capacity is None:
+            raise ValueError("Hotel capacity is not configured.")
+        return self.capacity.free_beds(check_in, check_out)
+
+    def availableDates(self, start: str, days: int, beds: int, nights: int = 1):
+        """
+        Zwraca daty przyjazdu, dla których w hotelu jest miejsce na pobyt.
+
+        Zapytanie korzysta z kalendarza zajętości, więc nie przegląda rezerwacji.
+
+        Args:
+            start (str): Pierwsza sprawdzana data przyjazdu w formacie 'YYYY-MM-DD'
+            days (int): Liczba kolejnych sprawdzanych dni
+            beds (int): Liczba potrzebnych łóżek
+            nights (int): Liczba nocy pobytu
+
+        Returns:
+            list: Daty przyjazdu w formacie 'YYYY-MM-DD', od których przez
+                  wszystkie noce pobytu wolnych jest co najmniej beds łóżek
+
+        Raises:
+            ValueError: Gdy pojemność hotelu nie została podana lub parametry są nieprawidłowe
+        """
+        if self.capacity is None:
+            raise ValueError("Hotel capacity is not configured.")
+        first = parse_date(start)
+        if days is None or not isinstance(days, int) or days <= 0:
+            raise ValueError("Number of days must be a valid integer.")
+        if beds is None or not isinstance(beds, int) or beds <= 0:
+            raise ValueError("Number of beds must be a valid integer.")
+        if nights is None or not isinstance(nights, int) or nights <= 0:
+            raise ValueError("Number of nights must be a valid integer.")
+        return [
+            format_date(ordinal)
+            for ordinal in self.capacity.available_starts(first, first + days, beds, nights)
+        ]
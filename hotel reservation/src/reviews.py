@@ -1,3 +1,10 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+
+from src.compression import CommentArena
+from src.search import ReviewIndex
+
+
 class Review:
     """
     Klasa reprezentująca pojedynczą recenzję w systemie.
@@ -7,6 +14,8 @@ class Review:
         stars (int): Ocena w gwiazdkach (1-5)
         comment (str): Komentarz do recenzji
     """
+    __slots__ = ("id", "stars", "comment")
+
     def __init__(
             self, id: int, stars: int, comment: str
     ):
@@ -23,6 +32,60 @@ class Review:
         self.comment = comment
 
 
+class CompressedReview(Review):
+    """
+    Recenzja, której komentarz jest przechowywany w skompresowanym magazynie.
+
+    Komentarz jest rozpakowywany dopiero przy odczycie atrybutu comment.
+
+    Attributes:
+        id (int): Identyfikator recenzji
+        stars (int): Ocena w gwiazdkach (1-5)
+        comment (str): Komentarz do recenzji (odczytywany z magazynu)
+    """
+    __slots__ = ("_arena", "_ref")
+
+    def __init__(self, id: int, stars: int, comment: str, arena: CommentArena):
+        """
+        Inicjalizuje nową recenzję.
+
+        Args:
+            id (int): Identyfikator recenzji
+            stars (int): Ocena w gwiazdkach (1-5)
+            comment (str): Komentarz do recenzji
+            arena (CommentArena): Magazyn komentarzy
+        """
+        self._arena = arena
+        self._ref = None
+        super().__init__(id, stars, comment)
+
+    def __getstate__(self):
+        """Zwraca stan z odnośnikiem do komentarza zamiast rozpakowanego tekstu."""
+        return self.id, self.stars, self._arena, self._ref
+
+    def __setstate__(self, state):
+        """Odtwarza recenzję bez ponownego zapisywania komentarza w magazynie."""
+        self.id, self.stars, self._arena, self._ref = state
+
+    @property
+    def comment(self):
+        """Zwraca rozpakowany komentarz."""
+        return self._arena.load(self._ref)
+
+    @comment.setter
+    def comment(self, comment: str):
+        """Zapisuje nowy komentarz w magazynie i zwalnia poprzedni."""
+        previous = self._ref
+        self._ref = self._arena.store(comment)
+        if previous is not None:
+            self._arena.release(previous)
+
+    def release(self):
+        """Zwalnia komentarz w magazynie po usunięciu recenzji."""
+        self._arena.release(self._ref)
+        self._ref = None
+
+
 class Reviews:
     """
     Klasa zarządzająca systemem recenzji.
@@ -33,11 +96,74 @@ class Reviews:
     Attributes:
         reviews_list (dict): Słownik przechowujący wszystkie recenzje
         next_id (int): Następny dostępny identyfikator recenzji
+        star_counts (list): Liczba recenzji dla każdej oceny (indeksy 1-5)
+        stars_sum (int): Suma ocen wszystkich recenzji
+        stars_squares (int): Suma kwadratów ocen wszystkich recenzji
+        index (ReviewIndex): Indeks odwrócony komentarzy
+        by_stars (list): Posortowane klucze (-ocena, id) do listowania według ocen
+        by_recency (list): Posortowane klucze (numer dodania, id) do listowania według daty dodania
+        sequence (dict): Numer dodania według identyfikatora recenzji
+        next_seq (int): Następny numer dodania recenzji
+        arena (CommentArena or None): Magazyn skompresowanych komentarzy
+        changelog (ChangeLog or None): Bufor, do którego zgłaszane są zmiany
     """
-    def __init__(self):
-        """Inicjalizuje nowy system zarządzania recenzjami."""
+    def __init__(self, compress_comments: bool = False, dictionary: bytes = b"", changelog=None):
+        """
+        Inicjalizuje nowy system zarządzania recenzjami.
+
+        Args:
+            compress_comments (bool): Czy przechowywać komentarze w skompresowanym magazynie
+            dictionary (bytes): Słownik kompresji komentarzy (np. z build_dictionary)
+            changelog (ChangeLog, optional): Bufor, do którego zgłaszane są zmiany
+        """
         self.reviews_list = {}
         self.next_id = 1
+        self.star_counts = [0] * 6
+        self.stars_sum = 0
+        self.stars_squares = 0
+        self.index = ReviewIndex()
+        self.by_stars = []
+        self.by_recency = []
+        self.sequence = {}
+        self.next_seq = 1
+        self.arena = CommentArena(dictionary) if compress_comments else None
+        self.changelog = changelog
+
+    def _count_stars(self, stars: int, change: int):
+        """
+        Aktualizuje zagregowane statystyki ocen.
+
+        Args:
+            stars (int): Ocena w gwiazdkach (1-5)
+            change (int): 1 przy dodaniu oceny, -1 przy jej usunięciu
+        """
+        self.star_counts[stars] += change
+        self.stars_sum += change * stars
+        self.stars_squares += change * stars * stars
+
+    def _create(self, id: int, stars: int, comment: str):
+        """Tworzy recenzję w trybie przechowywania wybranym dla systemu."""
+        if self.arena is None:
+            return Review(id, stars, comment)
+        return CompressedReview(id, stars, comment, self.arena)
+
+    @staticmethod
+    def _release(review: Review):
+        """Zwalnia zasoby usuwanej lub nadpisywanej recenzji."""
+        if isinstance(review, CompressedReview):
+            review.release()
+
+    def _order_add(self, id: int, stars: int):
+        """Dodaje recenzję do indeksów uporządkowanych jako najnowszą."""
+        insort(self.by_stars, (-stars, id))
+        self.by_recency.append((self.next_seq, id))  # numery dodania rosną, lista pozostaje posortowana
+        self.sequence[id] = self.next_seq
+        self.next_seq += 1
+
+    def _order_remove(self, id: int, stars: int):
+        """Usuwa recenzję z indeksów uporządkowanych."""
+        del self.by_stars[bisect_left(self.by_stars, (-stars, id))]
+        del self.by_recency[bisect_left(self.by_recency, (self.sequence.pop(id), id))]
 
     def add_review(self, id: int, stars: int, comment: str):
         """
@@ -60,7 +186,19 @@ class Reviews:
             raise ValueError("Comment must be a string.")
 
         # dodanie/aktualizacja recenzji
-        self.reviews_list[id] = Review(id, stars, comment)  # nadpisuje, jeśli istnieje
+        previous = self.reviews_list.get(id)
+        if previous is not None:
+            self._count_stars(previous.stars, -1)
+            self.index.remove(id, previous.comment)
+            self._order_remove(id, previous.stars)
+            self._release(previous)
+        self.reviews_list[id] = self._create(id, stars, comment)  # nadpisuje, jeśli istnieje
+        self._count_stars(stars, 1)
+        self.index.add(id, comment)
+        self._order_add(id, stars)
+        if self.changelog is not None:
+            action = "create" if previous is None else "update"
+            self.changelog.emit("review", action, id, {"stars": stars, "comment": comment})
 
     def edit_review(self, id: int, stars: int, comment: str):
         """
@@ -85,8 +223,17 @@ class Reviews:
             raise ValueError("Comment must be a string.")
 
         # aktualizacja recenzji
+        self._count_stars(self.reviews_list[id].stars, -1)
+        self._count_stars(stars, 1)
+        self.index.remove(id, self.reviews_list[id].comment)
+        self.index.add(id, comment)
+        # edycja zmienia pozycję według ocen, ale nie kolejność dodania
+        del self.by_stars[bisect_left(self.by_stars, (-self.reviews_list[id].stars, id))]
+        insort(self.by_stars, (-stars, id))
         self.reviews_list[id].stars = stars
         self.reviews_list[id].comment = comment
+        if self.changelog is not None:
+            self.changelog.emit("review", "update", id, {"stars": stars, "comment": comment})
 
     def delete_review(self, id: int):
         """
@@ -100,7 +247,12 @@ class Reviews:
         """
         if id is None or id not in self.reviews_list:
             raise KeyError("Review with this ID does not exist.")
-        del self.reviews_list[id]
+        self._count_stars(self.reviews_list[id].stars, -1)
+        self.index.remove(id, self.reviews_list[id].comment)
+        self._order_remove(id, self.reviews_list[id].stars)
+        self._release(self.reviews_list.pop(id))
+        if self.changelog is not None:
+            self.changelog.emit("review", "delete", id)
 
     def get_review(self, id: int):
         """
@@ -118,3 +270,93 @@ class Reviews:
         if id is None:
             raise TypeError("Review ID must be a valid integer.")
         return self.reviews_list.get(id, None)
+
+    def stats(self):
+        """
+        Zwraca statystyki ocen wyliczone z zagregowanych liczników w czasie O(1).
+
+        Returns:
+            dict: Liczba recenzji (count), średnia (average), wariancja (variance)
+                  oraz histogram ocen (histogram: ocena -> liczba recenzji);
+                  średnia i wariancja są None, gdy nie ma recenzji
+        """
+        count = len(self.reviews_list)
+        histogram = {stars: self.star_counts[stars] for stars in range(1, 6)}
+        if not count:
+            return {"count": 0, "average": None, "variance": None, "histogram": histogram}
+        return {
+            "count": count,
+            "average": self.stars_sum / count,
+            "variance": (count * self.stars_squares - self.stars_sum ** 2) / count ** 2,
+            "histogram": histogram,
+        }
+
+    def search(self, query: str, mode: str = "and", top_k: int = None):
+        """
+        Wyszukuje recenzje, których komentarz zawiera słowa zapytania.
+
+        Wielkość liter nie ma znaczenia. Wyniki są posortowane malejąco według
+        liczby gwiazdek, a przy równej ocenie rosnąco według identyfikatora.
+
+        Args:
+            query (str): Słowa zapytania
+            mode (str): "and" - wszystkie słowa muszą wystąpić, "or" - dowolne słowo
+            top_k (int, optional): Największa liczba zwracanych recenzji
+
+        Returns:
+            list: Pasujące recenzje
+
+        Raises:
+            ValueError: Gdy zapytanie, tryb lub top_k są nieprawidłowe
+        """
+        if not isinstance(query, str):
+            raise ValueError("Query must be a string.")
+        if top_k is not None and (not isinstance(top_k, int) or top_k <= 0):
+            raise ValueError("Top k must be a valid integer.")
+        matches = (self.reviews_list[id] for id in self.index.search(query, mode))
+
+        def key(review):
+            return -review.stars, review.id
+
+        if top_k is None:
+            return sorted(matches, key=key)
+        return heapq.nsmallest(top_k, matches, key=key)
+
+    def iter_reviews(self, order: str = "stars", after=None, limit: int = 20):
+        """
+        Zwraca stronę recenzji w podanej kolejności oraz kursor następnej strony.
+
+        Strona jest wyznaczana przez wyszukiwanie binarne w posortowanym indeksie,
+        więc koszt wynosi O(log n + limit) niezależnie od liczby recenzji.
+        Kursor jest kluczem ostatniej zwróconej recenzji i pozostaje poprawny
+        także po dodaniu lub usunięciu innych recenzji.
+
+        Args:
+            order (str): "stars" - malejąco według ocen, "newest" - od najnowszych,
+                         "oldest" - od najstarszych
+            after (tuple, optional): Kursor zwrócony przez poprzednie wywołanie
+            limit (int): Największa liczba recenzji na stronie
+
+        Returns:
+            tuple: Lista recenzji oraz kursor następnej strony (None, gdy to ostatnia strona)
+
+        Raises:
+            ValueError: Gdy kolejność lub limit są nieprawidłowe
+        """
+        if order not in ("stars", "newest", "oldest"):
+            raise ValueError("Order must be 'stars', 'newest' or 'oldest'.")
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError("Limit must be a valid integer.")
+
+        if order == "newest":
+            keys = self.by_recency
+            stop = len(keys) if after is None else bisect_left(keys, tuple(after))
+            page = keys[max(stop - limit, 0):stop][::-1]
+            more = stop - limit > 0
+        else:
+            keys = self.by_stars if order == "stars" else self.by_recency
+            start = 0 if after is None else bisect_right(keys, tuple(after))
+            page = keys[start:start + limit]
+            more = start + limit < len(keys)
+        cursor = page[-1] if page and more else None
+        return [self.reviews_list[id] for _, id in page], cursor
@@ -0,0 +1,84 @@
+import re
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str):
+    """
+    Dzieli tekst na unikalne słowa zapisane małymi literami.
+
+    Args:
+        text (str): Tekst do podziału
+
+    Returns:
+        set: Zbiór słów
+    """
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+class ReviewIndex:
+    """
+    Indeks odwrócony komentarzy recenzji.
+
+    Dla każdego słowa przechowuje zbiór identyfikatorów recenzji, których
+    komentarz zawiera to słowo (lista wystąpień, postings).
+
+    Attributes:
+        postings (dict): Zbiory identyfikatorów recenzji według słowa
+    """
+
+    def __init__(self):
+        """Inicjalizuje pusty indeks."""
+        self.postings = {}
+
+    def add(self, review_id: int, text: str):
+        """
+        Dodaje komentarz recenzji do indeksu.
+
+        Args:
+            review_id (int): Identyfikator recenzji
+            text (str): Komentarz
+        """
+        for token in tokenize(text):
+            self.postings.setdefault(token, set()).add(review_id)
+
+    def remove(self, review_id: int, text: str):
+        """
+        Usuwa komentarz recenzji z indeksu.
+
+        Args:
+            review_id (int): Identyfikator recenzji
+            text (str): Komentarz, który był zaindeksowany
+        """
+        for token in tokenize(text):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(review_id)
+            if not ids:
+                del self.postings[token]
+
+    def search(self, query: str, mode: str = "and"):
+        """
+        Zwraca identyfikatory recenzji pasujących do zapytania.
+
+        Args:
+            query (str): Słowa zapytania
+            mode (str): "and" - wszystkie słowa muszą wystąpić, "or" - dowolne słowo
+
+        Returns:
+            set: Identyfikatory pasujących recenzji
+
+        Raises:
+            ValueError: Gdy tryb wyszukiwania jest nieprawidłowy
+        """
+        if mode not in ("and", "or"):
+            raise ValueError("Search mode must be 'and' or 'or'.")
+        tokens = tokenize(query)
+        if not tokens:
+            return set()
+        postings = [self.postings.get(token, set()) for token in tokens]
+        if mode == "or":
+            return set().union(*postings)
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
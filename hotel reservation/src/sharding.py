@@ -0,0 +1,285 @@
+import multiprocessing
+import os
+import threading
+
+from src.reservation import Reservation, ReservationManagement
+
+
+def shard_of(id, shards: int):
+    """
+    Zwraca numer shardu, do którego należy użytkownik.
+
+    Args:
+        id (int): Identyfikator użytkownika
+        shards (int): Liczba shardów
+
+    Returns:
+        int: Numer shardu (0..shards - 1)
+    """
+    # nieprawidłowe identyfikatory trafiają do shardu 0, który zgłosi błąd walidacji
+    return hash(id) % shards if isinstance(id, int) else 0
+
+
+def _global_number(number: int, shard: int, shards: int):
+    """Zamienia lokalny numer rezerwacji shardu na numer unikalny we wszystkich shardach."""
+    return (number - 1) * shards + shard + 1
+
+
+def _detach(result, shard: int, shards: int):
+    """
+    Zamienia rezerwacje w wyniku na krotki z globalnymi numerami rezerwacji.
+
+    Widoki magazynu kolumnowego odwołują się do całego magazynu, więc nie
+    mogą być przesyłane między procesami, a krotki są serializowane znacznie
+    taniej niż obiekty. Żaden inny wynik menedżera nie jest krotką.
+    """
+    if isinstance(result, list):
+        return [_detach(item, shard, shards) for item in result]
+    if hasattr(result, "reservation_number"):
+        return (
+            result.id, _global_number(result.reservation_number, shard, shards), result.beds,
+            result.user, result.date, result.nights
+        )
+    return result
+
+
+def _attach(result):
+    """Odtwarza obiekty Reservation z krotek utworzonych przez _detach."""
+    if isinstance(result, list):
+        return [_attach(item) for item in result]
+    if isinstance(result, tuple):
+        return Reservation(*result)
+    return result
+
+
+def _user_reservations(manager, ids):
+    """Zwraca rezerwacje wielu użytkowników jednego shardu."""
+    return [manager.userReservation(id) for id in ids]
+
+
+# polecenia wykonywane przez proces roboczy, które nie są metodami menedżera
+_COMMANDS = {"userReservations": _user_reservations}
+
+
+def _serve(connection, shard: int, shards: int, columnar: bool):
+    """
+    Pętla procesu roboczego: wykonuje żądania na własnym menedżerze rezerwacji.
+
+    Args:
+        connection (Connection): Połączenie z routerem
+        shard (int): Numer shardu
+        shards (int): Liczba shardów
+        columnar (bool): Czy przechowywać rezerwacje w magazynie kolumnowym
+    """
+    manager = ReservationManagement(columnar=columnar)
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        method, args, kwargs = request
+        try:
+            if method in _COMMANDS:
+                result = _COMMANDS[method](manager, *args, **kwargs)
+            else:
+                result = getattr(manager, method)
+                if callable(result):
+                    result = result(*args, **kwargs)
+            connection.send((True, _detach(result, shard, shards)))
+        except Exception as error:
+            connection.send((False, error))
+    connection.close()
+
+
+class ShardedReservationManagement:
+    """
+    System rezerwacji podzielony między procesy robocze.
+
+    Użytkownicy są przypisywani do shardów według skrótu identyfikatora;
+    każdy shard jest osobnym procesem z własnym ReservationManagement, więc
+    rezerwacje różnych użytkowników są przetwarzane równolegle, bez wspólnej
+    blokady GIL. Zapytania dotyczące wielu użytkowników są rozsyłane do
+    wszystkich potrzebnych shardów naraz, a wyniki scalane.
+
+    Numery rezerwacji są unikalne globalnie (numer lokalny shardu jest
+    przeplatany z numerem shardu). Pojemność hotelu jest wspólna dla
+    wszystkich użytkowników, dlatego ten tryb jej nie obsługuje.
+
+    Attributes:
+        shards (int): Liczba procesów roboczych
+    """
+
+    def __init__(self, shards: int = None, columnar: bool = False):
+        """
+        Uruchamia procesy robocze.
+
+        Args:
+            shards (int, optional): Liczba procesów roboczych (domyślnie liczba rdzeni)
+            columnar (bool): Czy przechowywać rezerwacje w magazynie kolumnowym
+
+        Raises:
+            ValueError: Gdy liczba shardów jest nieprawidłowa
+        """
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if not isinstance(shards, int) or shards <= 0:
+            raise ValueError("Number of shards must be a valid integer.")
+        self.shards = shards
+        self._connections = []
+        self._locks = []
+        self._processes = []
+        for shard in range(shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve, args=(child, shard, shards, columnar), daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._locks.append(threading.Lock())
+            self._processes.append(process)
+
+    def _call_many(self, requests):
+        """
+        Wysyła żądania do shardów, a następnie zbiera odpowiedzi.
+
+        Wszystkie żądania są wysyłane przed odebraniem pierwszej odpowiedzi,
+        więc shardy wykonują je równolegle.
+
+        Args:
+            requests (dict): Krotki (method, args, kwargs) według numeru shardu
+
+        Returns:
+            dict: Wyniki według numeru shardu
+
+        Raises:
+            Exception: Pierwszy błąd zgłoszony przez którykolwiek shard
+        """
+        shards = sorted(requests)
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self._connections[shard].send(requests[shard])
+            replies = {shard: self._connections[shard].recv() for shard in shards}
+        finally:
+            for shard in shards:
+                self._locks[shard].release()
+        for ok, result in replies.values():
+            if not ok:
+                raise result
+        return {shard: _attach(result) for shard, (_, result) in replies.items()}
+
+    def _call(self, id, method: str, *args, **kwargs):
+        """Wykonuje metodę na shardzie użytkownika."""
+        shard = shard_of(id, self.shards)
+        return self._call_many({shard: (method, (id, *args), kwargs)})[shard]
+
+    def booking(self, id: int, user: str, date: str, beds: int, nights: int = 1):
+        """
+        Dodaje nową rezerwację w shardzie użytkownika (patrz ReservationManagement.booking).
+
+        Raises:
+            ValueError: Gdy dane są nieprawidłowe lub rezerwacja jest w konflikcie
+        """
+        self._call(id, "booking", user, date, beds, nights=nights)
+
+    def bookMany(self, rows):
+        """
+        Dodaje wiele rezerwacji, rozdzielając wiersze między shardy.
+
+        Args:
+            rows (iterable): Krotki (id, user, date, beds) lub (id, user, date, beds, nights)
+
+        Returns:
+            list: Dla każdego wiersza utworzona Reservation albo zgłoszony ValueError
+        """
+        rows = list(rows)
+        positions = {}
+        for position, row in enumerate(rows):
+            id = row[0] if isinstance(row, (tuple, list)) and row else None
+            positions.setdefault(shard_of(id, self.shards), []).append(position)
+        replies = self._call_many({
+            shard: ("bookMany", ([rows[position] for position in indexes],), {})
+            for shard, indexes in positions.items()
+        })
+        results = [None] * len(rows)
+        for shard, indexes in positions.items():
+            for position, result in zip(indexes, replies[shard]):
+                results[position] = result
+        return results
+
+    def cancelBooking(self, id):
+        """
+        Anuluje wszystkie rezerwacje użytkownika (patrz ReservationManagement.cancelBooking).
+
+        Returns:
+            bool: True jeśli anulowano jakiekolwiek rezerwacje, False w przeciwnym razie
+        """
+        return self._call(id, "cancelBooking")
+
+    def userReservation(self, id: int):
+        """
+        Zwraca rezerwacje użytkownika (patrz ReservationManagement.userReservation).
+
+        Returns:
+            list: Lista rezerwacji użytkownika
+
+        Raises:
+            ValueError: Gdy identyfikator użytkownika jest nieprawidłowy
+        """
+        return self._call(id, "userReservation")
+
+    def userReservations(self, ids):
+        """
+        Zwraca rezerwacje wielu użytkowników, odpytując shardy równolegle.
+
+        Args:
+            ids (iterable): Identyfikatory użytkowników
+
+        Returns:
+            dict: Listy rezerwacji według identyfikatora użytkownika
+
+        Raises:
+            ValueError: Gdy którykolwiek identyfikator jest nieprawidłowy
+        """
+        groups = {}
+        for id in dict.fromkeys(ids):
+            groups.setdefault(shard_of(id, self.shards), []).append(id)
+        requests = {
+            shard: ("userReservations", (group,), {}) for shard, group in groups.items()
+        }
+        results = {}
+        for shard, reply in self._call_many(requests).items():
+            results.update(zip(groups[shard], reply))
+        return results
+
+    @property
+    def reservations(self):
+        """
+        Zwraca rezerwacje ze wszystkich shardów w kolejności numerów rezerwacji.
+
+        Returns:
+            list: Lista wszystkich rezerwacji w systemie
+        """
+        replies = self._call_many({shard: ("reservations", (), {}) for shard in range(self.shards)})
+        merged = [reservation for reply in replies.values() for reservation in reply]
+        return sorted(merged, key=lambda reservation: reservation.reservation_number)
+
+    def close(self):
+        """Zatrzymuje procesy robocze."""
+        for connection, process in zip(self._connections, self._processes):
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+            process.join()
+        self._connections, self._processes = [], []
+
+    def __enter__(self):
+        """Zwraca router do użycia w bloku with."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Zatrzymuje procesy robocze po wyjściu z bloku with."""
+        self.close()
@@ -0,0 +1,329 @@
+from array import array
+from bisect import bisect_left
+
+from src.validation import format_date, parse_date
+
+
+def _fits(column, value: int):
+    """Sprawdza, czy liczba całkowita mieści się w typie elementów tablicy."""
+    limit = 1 << (8 * column.itemsize - 1)
+    return -limit <= value < limit
+
+
+class ObjectStore:
+    """
+    Magazyn rezerwacji przechowujący każdą rezerwację jako osobny obiekt.
+
+    Anulowane rezerwacje zostawiają puste miejsce (tombstone), które jest
+    usuwane podczas kompaktowania.
+
+    Attributes:
+        record_type (type): Klasa tworzonych rekordów rezerwacji
+    """
+
+    def __init__(self, record_type):
+        """
+        Inicjalizuje pusty magazyn.
+
+        Args:
+            record_type (type): Klasa rezerwacji (np. Reservation)
+        """
+        self.record_type = record_type
+        self._records = []
+        self._slots = {}
+        self._tombstones = 0
+
+    def __len__(self):
+        """Zwraca liczbę aktywnych rezerwacji."""
+        return len(self._slots)
+
+    def add(self, id: int, reservation_number: int, beds: int, user: str, date: str, nights: int):
+        """
+        Zapisuje nową rezerwację.
+
+        Returns:
+            Reservation: Zapisana rezerwacja
+        """
+        record = self.record_type(id, reservation_number, beds, user, date, nights)
+        self._slots[reservation_number] = len(self._records)
+        self._records.append(record)
+        return record
+
+    def get(self, reservation_number: int):
+        """
+        Zwraca rezerwację o podanym numerze.
+
+        Returns:
+            Reservation or None: Rezerwacja lub None jeśli nie istnieje
+        """
+        slot = self._slots.get(reservation_number)
+        return None if slot is None else self._records[slot]
+
+    def remove(self, reservation_number: int):
+        """
+        Oznacza rezerwację jako usuniętą i kompaktuje magazyn, gdy co najmniej
+        połowa miejsc jest pusta.
+        """
+        self._records[self._slots.pop(reservation_number)] = None
+        self._tombstones += 1
+        if self._tombstones * 2 >= len(self._records):
+            self.compact()
+
+    def compact(self):
+        """Usuwa puste miejsca po anulowanych rezerwacjach i przelicza pozycje."""
+        self._records = [record for record in self._records if record is not None]
+        self._slots = {
+            record.reservation_number: slot for slot, record in enumerate(self._records)
+        }
+        self._tombstones = 0
+
+    def records(self):
+        """
+        Zwraca aktywne rezerwacje w kolejności ich dodania.
+
+        Returns:
+            list: Lista rezerwacji
+        """
+        if self._tombstones:
+            self.compact()
+        return self._records
+
+
+class ReservationView:
+    """
+    Lekki widok na wiersz magazynu kolumnowego.
+
+    Udostępnia te same atrybuty co Reservation, odczytując je z kolumn
+    magazynu przy każdym dostępie, więc po anulowaniu lub archiwizacji
+    rezerwacji jej pola nie są już dostępne.
+    """
+
+    __slots__ = ("_store", "reservation_number")
+
+    def __init__(self, store, reservation_number: int):
+        """
+        Inicjalizuje widok.
+
+        Args:
+            store (ColumnarStore): Magazyn, z którego czytane są dane
+            reservation_number (int): Numer rezerwacji
+        """
+        self._store = store
+        self.reservation_number = reservation_number
+
+    @property
+    def _slot(self):
+        """
+        Pozycja wiersza w kolumnach.
+
+        Raises:
+            ValueError: Gdy rezerwacja została usunięta z magazynu
+        """
+        slot = self._store._find(self.reservation_number)
+        if slot is None:
+            raise ValueError("Reservation no longer exists.")
+        return slot
+
+    @property
+    def id(self):
+        """Identyfikator użytkownika."""
+        return self._store.ids[self._slot]
+
+    @property
+    def beds(self):
+        """Liczba łóżek."""
+        return self._store.beds[self._slot]
+
+    @property
+    def user(self):
+        """Nazwa użytkownika."""
+        return self._store.names[self._store.user_codes[self._slot]]
+
+    @property
+    def date(self):
+        """Data przyjazdu w formacie 'YYYY-MM-DD'."""
+        return format_date(self._store.dates[self._slot])
+
+    @property
+    def nights(self):
+        """Liczba nocy pobytu."""
+        return self._store.nights[self._slot]
+
+    def check_out(self):
+        """
+        Zwraca datę wyjazdu wynikającą z daty przyjazdu i liczby nocy.
+
+        Returns:
+            str: Data wyjazdu w formacie 'YYYY-MM-DD'
+        """
+        slot = self._slot
+        return format_date(self._store.dates[slot] + self._store.nights[slot])
+
+
+class ColumnarStore:
+    """
+    Kolumnowy magazyn rezerwacji oparty na tablicach array.
+
+    Każde pole rezerwacji jest przechowywane w osobnej tablicy liczb,
+    daty jako numery dni, a nazwy użytkowników w tabeli nazw
+    współdzielonej przez wszystkie wiersze. Numery rezerwacji rosną, więc
+    wiersz jest odnajdywany wyszukiwaniem binarnym bez dodatkowego słownika.
+    Anulowane wiersze są oznaczane w tablicy alive i usuwane podczas
+    kompaktowania.
+
+    Attributes:
+        ids (array): Identyfikatory użytkowników
+        numbers (array): Rosnące numery rezerwacji
+        alive (bytearray): 1 dla aktywnego wiersza, 0 dla usuniętego
+        beds (array): Liczby łóżek
+        dates (array): Daty przyjazdu jako numery dni
+        nights (array): Liczby nocy
+        user_codes (array): Indeksy nazw użytkowników w tabeli names
+        names (list): Tabela nazw użytkowników
+    """
+
+    def __init__(self):
+        """Inicjalizuje pusty magazyn kolumnowy."""
+        self.ids = array("q")
+        self.numbers = array("q")
+        self.beds = array("q")
+        self.dates = array("i")
+        self.nights = array("h")
+        self.user_codes = array("i")
+        self.alive = bytearray()
+        self.names = []
+        self._name_codes = {}
+        self._tombstones = 0
+
+    def __len__(self):
+        """Zwraca liczbę aktywnych rezerwacji."""
+        return len(self.numbers) - self._tombstones
+
+    def _find(self, reservation_number: int):
+        """
+        Zwraca pozycję aktywnego wiersza o podanym numerze rezerwacji.
+
+        Returns:
+            int or None: Pozycja wiersza lub None jeśli rezerwacja nie istnieje
+        """
+        slot = bisect_left(self.numbers, reservation_number)
+        if slot < len(self.numbers) and self.numbers[slot] == reservation_number and self.alive[slot]:
+            return slot
+        return None
+
+    def add(self, id: int, reservation_number: int, beds: int, user: str, date: str, nights: int):
+        """
+        Zapisuje nową rezerwację jako wiersz tablic.
+
+        Returns:
+            ReservationView: Widok na zapisany wiersz
+
+        Raises:
+            ValueError: Gdy data nie istnieje w kalendarzu lub wartość nie mieści
+                się w typie kolumny
+        """
+        ordinal = parse_date(date)
+        if self.numbers and reservation_number <= self.numbers[-1]:
+            raise ValueError("Reservation numbers must be increasing.")
+        # wszystkie wartości są sprawdzane przed dopisaniem pierwszej kolumny,
+        # aby nieudany zapis nie zostawił kolumn o różnych długościach
+        for column, value, message in (
+                (self.ids, id, "User ID must be a valid integer."),
+                (self.numbers, reservation_number, "Reservation number must be a valid integer."),
+                (self.beds, beds, "Number of beds must be a valid integer."),
+                (self.nights, nights, "Number of nights must be a valid integer."),
+        ):
+            if not _fits(column, value):
+                raise ValueError(message)
+        code = self._name_codes.get(user)
+        if code is None:
+            code = self._name_codes[user] = len(self.names)
+            self.names.append(user)
+
+        self.ids.append(id)
+        self.numbers.append(reservation_number)
+        self.beds.append(beds)
+        self.dates.append(ordinal)
+        self.nights.append(nights)
+        self.user_codes.append(code)
+        self.alive.append(1)
+        return ReservationView(self, reservation_number)
+
+    def booked(self, numbers, user: str, ordinal: int):
+        """
+        Sprawdza, czy wśród podanych rezerwacji jest rezerwacja użytkownika
+        o danej nazwie z przyjazdem w danym dniu.
+
+        Args:
+            numbers (iterable): Numery rezerwacji (np. jednego użytkownika)
+            user (str): Nazwa użytkownika
+            ordinal (int): Numer dnia przyjazdu
+
+        Returns:
+            bool: True jeśli taka rezerwacja istnieje
+        """
+        code = self._name_codes.get(user)
+        if code is None:
+            return False
+        for number in numbers:
+            slot = self._find(number)
+            if slot is not None and self.dates[slot] == ordinal and self.user_codes[slot] == code:
+                return True
+        return False
+
+    def ending_by(self, horizon: int):
+        """
+        Zwraca widoki rezerwacji, których wyjazd nie wypada później niż podany dzień.
+
+        Args:
+            horizon (int): Numer dnia granicznego
+
+        Returns:
+            list: Widoki ReservationView w kolejności numerów rezerwacji
+        """
+        dates, nights, alive = self.dates, self.nights, self.alive
+        return [
+            ReservationView(self, self.numbers[slot]) for slot in range(len(self.numbers))
+            if alive[slot] and dates[slot] + nights[slot] <= horizon
+        ]
+
+    def get(self, reservation_number: int):
+        """
+        Zwraca widok na rezerwację o podanym numerze.
+
+        Returns:
+            ReservationView or None: Widok lub None jeśli rezerwacja nie istnieje
+        """
+        if self._find(reservation_number) is None:
+            return None
+        return ReservationView(self, reservation_number)
+
+    def remove(self, reservation_number: int):
+        """
+        Oznacza wiersz jako usunięty i kompaktuje magazyn, gdy co najmniej
+        połowa wierszy jest pusta.
+        """
+        self.alive[self._find(reservation_number)] = 0
+        self._tombstones += 1
+        if self._tombstones * 2 >= len(self.numbers):
+            self.compact()
+
+    def compact(self):
+        """Przepisuje kolumny z pominięciem usuniętych wierszy."""
+        live = [slot for slot, flag in enumerate(self.alive) if flag]
+        for name in ("ids", "numbers", "beds", "dates", "nights", "user_codes"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[slot] for slot in live]))
+        self.alive = bytearray(b"\x01") * len(live)
+        self._tombstones = 0
+
+    def records(self):
+        """
+        Zwraca widoki aktywnych rezerwacji w kolejności ich dodania.
+
+        Returns:
+            list: Lista widoków ReservationView
+        """
+        if self._tombstones:
+            self.compact()
+        return [ReservationView(self, number) for number in self.numbers]
@@ -1,3 +1,21 @@
+import hmac
+
+from src.registry import UserReservationRegistry, UserReservations
+
+
+def normalize_email(email: str):
+    """
+    Zwraca postać adresu email używaną do sprawdzania unikalności.
+
+    Args:
+        email (str): Adres email
+
+    Returns:
+        str: Adres bez białych znaków na końcach, zapisany małymi literami
+    """
+    return email.strip().lower()
+
+
 class User:
     """
     Klasa reprezentująca użytkownika w systemie.
@@ -6,9 +24,9 @@ class User:
         id (int): Unikalny identyfikator użytkownika
         email (str): Adres email użytkownika
         password (str): Hasło użytkownika
-        reservations (list): Lista rezerwacji użytkownika
+        registry (UserReservationRegistry): Rejestr powiązań z rezerwacjami
     """
-    def __init__(self, id: int, email: str, password: str):
+    def __init__(self, id: int, email: str, password: str, registry: UserReservationRegistry = None):
         """
         Inicjalizuje nowego użytkownika.
 
@@ -16,11 +34,23 @@ class User:
             id (int): Identyfikator użytkownika
             email (str): Adres email
             password (str): Hasło (minimum 8 znaków)
+            registry (UserReservationRegistry, optional): Rejestr powiązań
+                z rezerwacjami; domyślnie pusty rejestr tylko tego użytkownika
         """
         self.id = id
         self.email = email
         self.password = password
-        self.reservations = []
+        self.registry = registry if registry is not None else UserReservationRegistry()
+
+    @property
+    def reservations(self):
+        """
+        Numery rezerwacji użytkownika zapisane w rejestrze.
+
+        Returns:
+            UserReservations: Widok powiązań użytkownika w rejestrze
+        """
+        return UserReservations(self.registry, self.id)
 
 
 class UserManagement:
@@ -32,11 +62,29 @@ class UserManagement:
 
     Attributes:
         users (dict): Słownik przechowujący wszystkich użytkowników
+        email_index (dict): Identyfikatory użytkowników według znormalizowanego adresu email
         next_id (int): Następny dostępny identyfikator użytkownika
+        hasher (PasswordHasher or None): Obiekt wyliczający skróty haseł
+        registry (UserReservationRegistry): Rejestr powiązań z rezerwacjami
+        changelog (ChangeLog or None): Bufor, do którego zgłaszane są zmiany
     """
-    def __init__(self):
-        """Inicjalizuje nowy system zarządzania użytkownikami."""
+    def __init__(self, hasher=None, registry=None, changelog=None):
+        """
+        Inicjalizuje nowy system zarządzania użytkownikami.
+
+        Args:
+            hasher (PasswordHasher, optional): Gdy podany, zamiast haseł
+                przechowywane są ich skróty
+            registry (UserReservationRegistry, optional): Rejestr powiązań
+                współdzielony z ReservationManagement; domyślnie własny rejestr
+            changelog (ChangeLog, optional): Bufor, do którego zgłaszane są zmiany;
+                zdarzenia nie zawierają haseł
+        """
+        self.hasher = hasher
+        self.registry = registry if registry is not None else UserReservationRegistry()
+        self.changelog = changelog
         self.users = {}
+        self.email_index = {}
         self.next_id = 1
 
     def addUser(self, email: str, password: str):
@@ -54,9 +102,8 @@ class UserManagement:
             ValueError: Gdy email już istnieje lub gdy dane są nieprawidłowe
         """
         # check if user already exists
-        for user in self.users.values():
-            if user.email == email:
-                raise ValueError("User already exists.")
+        if isinstance(email, str) and normalize_email(email) in self.email_index:
+            raise ValueError("User already exists.")
 
         # input validation
         if not isinstance(email, str) or not email:
@@ -66,8 +113,11 @@ class UserManagement:
 
         # creating user
         user_id = self.next_id
-        self.users[user_id] = User(user_id, email, password)
+        self.users[user_id] = User(user_id, email, self._protect(password), self.registry)
+        self.email_index[normalize_email(email)] = user_id
         self.next_id += 1
+        if self.changelog is not None:
+            self.changelog.emit("user", "create", user_id, {"email": email})
         return user_id
 
     def updateUser(self, id: int, email: str, password: str):
@@ -93,20 +143,25 @@ class UserManagement:
         if not isinstance(password, str) or len(password) < 8:
             raise ValueError("Password must be longer than 8 characters.")
 
-        for user in self.users.values():
-            if user.id != id and user.email == email:
-                raise ValueError("Email already exists.")
+        owner = self.email_index.get(normalize_email(email))
+        if owner is not None and owner != id:
+            raise ValueError("Email already exists.")
 
         # updating data
+        del self.email_index[normalize_email(self.users[id].email)]
+        self.email_index[normalize_email(email)] = id
         self.users[id].email = email
-        self.users[id].password = password
+        self.users[id].password = self._protect(password)
+        if self.changelog is not None:
+            self.changelog.emit("user", "update", id, {"email": email})
 
-    def deleteUser(self, id: int):
+    def deleteUser(self, id: int, cascade: bool = False):
         """
         Usuwa użytkownika z systemu.
 
         Args:
             id (int): Identyfikator użytkownika do usunięcia
+            cascade (bool): Czy anulować rezerwacje użytkownika zapisane w rejestrze
 
         Raises:
             ValueError: Gdy użytkownik nie istnieje lub ma aktywne rezerwacje
@@ -116,10 +171,15 @@ class UserManagement:
             raise ValueError("User is not existing.")
 
         # check if user have existing reservations
-        if self.users[id].reservations:
-            raise ValueError("User have existing reservations.")
+        if self.registry.has_reservations(id):
+            if not cascade:
+                raise ValueError("User have existing reservations.")
+            self.registry.cancel_user(id)
 
+        del self.email_index[normalize_email(self.users[id].email)]
         del self.users[id]
+        if self.changelog is not None:
+            self.changelog.emit("user", "delete", id)
 
     def getUser(self, id: int):
         """
@@ -132,3 +192,60 @@ class UserManagement:
             User or None: Obiekt użytkownika lub None jeśli użytkownik nie istnieje
         """
         return self.users.get(id, None)
+
+    def getUserByEmail(self, email: str):
+        """
+        Pobiera użytkownika o podanym adresie email.
+
+        Wielkość liter i białe znaki na końcach adresu nie mają znaczenia.
+
+        Args:
+            email (str): Adres email
+
+        Returns:
+            User or None: Obiekt użytkownika lub None jeśli użytkownik nie istnieje
+        """
+        if not isinstance(email, str):
+            return None
+        user_id = self.email_index.get(normalize_email(email))
+        return None if user_id is None else self.users[user_id]
+
+    def _protect(self, password: str):
+        """Zwraca skrót hasła, jeśli skonfigurowano hasher, lub samo hasło."""
+        return password if self.hasher is None else self.hasher.hash(password)
+
+    def verifyPassword(self, id: int, password: str):
+        """
+        Sprawdza hasło użytkownika.
+
+        Args:
+            id (int): Identyfikator użytkownika
+            password (str): Hasło do sprawdzenia
+
+        Returns:
+            bool: True jeśli użytkownik istnieje i hasło jest poprawne
+        """
+        return self.verifyPasswords([(id, password)])[0]
+
+    def verifyPasswords(self, credentials):
+        """
+        Sprawdza hasła wielu użytkowników naraz.
+
+        Args:
+            credentials (iterable): Krotki (id, password)
+
+        Returns:
+            list: Wyniki weryfikacji w kolejności danych wejściowych
+        """
+        credentials = list(credentials)
+        stored = [self.users.get(id) for id, _ in credentials]
+        if self.hasher is not None:
+            return self.hasher.verify_many(
+                (password, user.password if user is not None else None)
+                for (_, password), user in zip(credentials, stored)
+            )
+        return [
+            user is not None and isinstance(password, str)
+            and hmac.compare_digest(user.password.encode("utf-8"), password.encode("utf-8"))
+            for (_, password), user in zip(credentials, stored)
+        ]
@@ -0,0 +1,92 @@
+import re
+from datetime import date as Date
+from functools import lru_cache
+
+USER_PATTERN = re.compile(r"[a-zA-Z0-9]+")
+DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+DATE_ERROR = "Date must be a valid string in 'YYYY-MM-DD' format."
+# najdłuższy pobyt w jednej rezerwacji
+MAX_NIGHTS = 365
+# numer dnia 9999-12-31; wyjazd musi dać się zapisać jako data
+LAST_ORDINAL = Date.max.toordinal()
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date: str) -> int:
+    """Zamienia tekst daty na numer dnia; wyniki są zapamiętywane (LRU)."""
+    match = DATE_PATTERN.fullmatch(date)
+    if match is None:
+        raise ValueError(DATE_ERROR)
+    try:
+        return Date(*map(int, match.groups())).toordinal()
+    except ValueError:
+        raise ValueError(DATE_ERROR) from None
+
+
+def parse_date(date: str) -> int:
+    """
+    Zamienia datę w formacie 'YYYY-MM-DD' na numer dnia (ordinal).
+
+    Sprawdzane jest także, czy data istnieje w kalendarzu (np. '2026-02-30'
+    jest odrzucana). Rezerwacje dotyczą zwykle niewielkiej liczby dat, więc
+    wyniki są zapamiętywane w pamięci podręcznej LRU.
+
+    Args:
+        date (str): Data w formacie 'YYYY-MM-DD'
+
+    Returns:
+        int: Numer dnia zgodny z datetime.date.toordinal()
+
+    Raises:
+        ValueError: Gdy data jest nieprawidłowa
+    """
+    if not isinstance(date, str):
+        raise ValueError(DATE_ERROR)
+    return _parse_date(date)
+
+
+@lru_cache(maxsize=4096)
+def format_date(ordinal: int) -> str:
+    """
+    Zamienia numer dnia na datę w formacie 'YYYY-MM-DD'.
+
+    Args:
+        ordinal (int): Numer dnia zgodny z datetime.date.toordinal()
+
+    Returns:
+        str: Data w formacie 'YYYY-MM-DD'
+    """
+    return Date.fromordinal(ordinal).isoformat()
+
+
+def validate_booking(id, user, date, beds, nights) -> int:
+    """
+    Sprawdza poprawność danych rezerwacji.
+
+    Args:
+        id (int): Identyfikator użytkownika
+        user (str): Nazwa użytkownika
+        date (str): Data rezerwacji w formacie 'YYYY-MM-DD'
+        beds (int): Liczba łóżek
+        nights (int): Liczba nocy pobytu (co najwyżej MAX_NIGHTS)
+
+    Returns:
+        int: Numer dnia przyjazdu (ordinal)
+
+    Raises:
+        ValueError: Gdy którykolwiek z parametrów jest nieprawidłowy
+    """
+    if id is None or not isinstance(id, int) or id <= 0:
+        raise ValueError("User ID must be a valid integer.")
+    if not isinstance(user, str) or not user:
+        raise ValueError("User name must be a valid string.")
+    if USER_PATTERN.fullmatch(user) is None:
+        raise ValueError("User name must contain only letters and numbers.")
+    ordinal = parse_date(date)
+    if beds is None or not isinstance(beds, int) or beds <= 0:
+        raise ValueError("Number of beds must be a valid integer.")
+    if nights is None or not isinstance(nights, int) or not 0 < nights <= MAX_NIGHTS:
+        raise ValueError("Number of nights must be a valid integer.")
+    if ordinal + nights > LAST_ORDINAL:
+        raise ValueError("Check-out date must not be later than 9999-12-31.")
+    return ordinal
@@ -0,0 +1,125 @@
+"""
+Moduł testów dla asynchronicznych nakładek na menedżery.
+
+Ten moduł zawiera testy sprawdzające grupowanie współbieżnych wywołań,
+przekazywanie błędów oraz ograniczenie długości kolejki.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+from src.aio import AsyncReservationManagement, AsyncReviews, AsyncUserManagement
+from src.reservation import ReservationManagement
+
+
+class TestAsyncReservationManagement(unittest.IsolatedAsyncioTestCase):
+    """
+    Testy asynchronicznej nakładki na system rezerwacji.
+
+    Sprawdza łączenie rezerwacji w wywołania bookMany, przekazywanie
+    wyjątków oraz zachowanie kolejności operacji.
+    """
+
+    async def asyncSetUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement()
+        self.facade = AsyncReservationManagement(self.manager, max_batch=64)
+
+    async def asyncTearDown(self):
+        """Zatrzymuje zadanie robocze nakładki."""
+        await self.facade.close()
+
+    async def test_concurrent_bookings_are_coalesced(self):
+        with mock.patch.object(self.manager, "bookMany", wraps=self.manager.bookMany) as book_many:
+            await asyncio.gather(*(
+                self.facade.booking(user_id, f"user{user_id}", "2026-03-01", 1)
+                for user_id in range(1, 101)
+            ))
+        self.assertEqual(len(self.manager.reservations), 100)
+        self.assertLess(book_many.call_count, 100)
+
+    async def test_errors_reach_the_caller(self):
+        results = await asyncio.gather(
+            self.facade.booking(1, "user1", "2026-03-01", 1),
+            self.facade.booking(1, "user1", "2026-03-01", 1),
+            self.facade.booking(2, "user@2", "2026-03-01", 1),
+            return_exceptions=True,
+        )
+        self.assertIsNone(results[0])
+        self.assertEqual(str(results[1]), "User already booked room(s) on this date.")
+        self.assertEqual(str(results[2]), "User name must contain only letters and numbers.")
+
+    async def test_backend_failure_reaches_every_caller(self):
+        with mock.patch.object(self.manager, "bookMany", side_effect=RuntimeError("disk full")):
+            results = await asyncio.wait_for(asyncio.gather(
+                self.facade.booking(1, "user1", "2026-03-01", 1),
+                self.facade.booking(2, "user2", "2026-03-01", 1),
+                return_exceptions=True,
+            ), 1)
+        self.assertEqual([str(result) for result in results], ["disk full", "disk full"])
+        await asyncio.wait_for(self.facade.join(), 1)
+        await self.facade.booking(3, "user3", "2026-03-01", 1)
+        self.assertEqual(len(self.manager.reservations), 1)
+
+    async def test_operations_keep_order(self):
+        _, cancelled, remaining = await asyncio.gather(
+            self.facade.booking(1, "user1", "2026-03-01", 1, nights=2),
+            self.facade.cancelBooking(1),
+            self.facade.userReservation(1),
+        )
+        self.assertTrue(cancelled)
+        self.assertEqual(remaining, [])
+
+    async def test_book_many(self):
+        results = await self.facade.bookMany([(1, "user1", "2026-03-01", 1), (1, "user1", "2026-03-01", 1)])
+        self.assertEqual(results[0].reservation_number, 1)
+        self.assertIsInstance(results[1], ValueError)
+
+    async def test_back_pressure_with_small_queue(self):
+        facade = AsyncReservationManagement(max_batch=2, max_pending=2)
+        await asyncio.gather(*(
+            facade.booking(user_id, f"user{user_id}", "2026-03-01", 1) for user_id in range(1, 21)
+        ))
+        self.assertEqual(len(facade.manager.reservations), 20)
+        await facade.close()
+
+    def test_invalid_sizes(self):
+        with self.assertRaisesRegex(ValueError, "Batch size must be a valid integer."):
+            AsyncReservationManagement(max_batch=0)
+        with self.assertRaisesRegex(ValueError, "Queue size must be a valid integer."):
+            AsyncReservationManagement(max_pending=0)
+
+
+class TestAsyncUsersAndReviews(unittest.IsolatedAsyncioTestCase):
+    """
+    Testy asynchronicznych nakładek na systemy użytkowników i recenzji.
+    """
+
+    async def test_user_operations(self):
+        facade = AsyncUserManagement()
+        ids = await asyncio.gather(*(
+            facade.addUser(f"user{i}@mail.com", "password123") for i in range(10)
+        ))
+        self.assertEqual(sorted(ids), list(range(1, 11)))
+        await facade.updateUser(1, "new@mail.com", "password123")
+        self.assertEqual((await facade.getUser(1)).email, "new@mail.com")
+        with self.assertRaisesRegex(ValueError, "User already exists."):
+            await facade.addUser("new@mail.com", "password123")
+        await facade.deleteUser(1)
+        self.assertIsNone(await facade.getUser(1))
+        await facade.close()
+
+    async def test_review_operations(self):
+        facade = AsyncReviews()
+        await asyncio.gather(*(facade.add_review(i, 5, "great") for i in range(1, 6)))
+        await facade.edit_review(1, 3, "ok")
+        self.assertEqual((await facade.get_review(1)).stars, 3)
+        await facade.delete_review(2)
+        with self.assertRaisesRegex(KeyError, "Review with this ID does not exist."):
+            await facade.delete_review(2)
+        self.assertEqual(len(facade.manager.reviews_list), 4)
+        await facade.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
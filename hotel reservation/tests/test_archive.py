@@ -0,0 +1,184 @@
+"""
+Moduł testów dla archiwum rezerwacji.
+
+Ten moduł zawiera testy zapisu rezerwacji do partycji miesięcznych,
+wyszukiwania w archiwum oraz przenoszenia zakończonych rezerwacji
+z menedżera rezerwacji do archiwum.
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+from src.archive import ReservationArchive
+from src.events import ChangeLog
+from src.locking import ConcurrentReservationManagement
+from src.reservation import Reservation, ReservationManagement
+from src.validation import parse_date
+from parameterized import parameterized
+
+
+class TestReservationArchive(unittest.TestCase):
+    """
+    Testy archiwum rezerwacji podzielonego na miesiące.
+    """
+
+    def setUp(self):
+        """Przygotowuje katalog tymczasowy przed każdym testem."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = ReservationArchive(self.directory.name)
+
+    def tearDown(self):
+        """Usuwa katalog tymczasowy po każdym teście."""
+        self.directory.cleanup()
+
+    def test_write_partitions_by_month(self):
+        written = self.archive.write([
+            Reservation(1, 1, 2, "Jan", "2026-01-30", 3),
+            Reservation(2, 2, 1, "Ewa", "2026-02-01"),
+            Reservation(1, 3, 1, "Jan", "2026-02-14"),
+        ])
+        self.assertEqual(written, 3)
+        self.assertEqual(self.archive.months(), ["2026-01", "2026-02"])
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "2026-02.jsonl.gz")))
+        self.assertGreater(self.archive.stored_bytes(), 0)
+
+    def test_append_keeps_earlier_rows(self):
+        self.archive.write([Reservation(1, 1, 2, "Jan", "2026-01-05")])
+        self.archive.write([Reservation(1, 2, 1, "Jan", "2026-01-20", 2)])
+        found = self.archive.find(id=1)
+        self.assertEqual([reservation.reservation_number for reservation in found], [1, 2])
+        self.assertEqual(found[1].nights, 2)
+        self.assertEqual(found[1].check_out(), "2026-01-22")
+
+    def test_find_filters(self):
+        self.archive.write([
+            Reservation(1, 1, 2, "Jan", "2026-01-30"),
+            Reservation(2, 2, 1, "Ewa", "2026-02-01"),
+            Reservation(1, 3, 1, "Jan", "2026-03-14"),
+        ])
+        self.assertEqual([r.reservation_number for r in self.archive.find()], [1, 2, 3])
+        self.assertEqual([r.reservation_number for r in self.archive.find(id=2)], [2])
+        self.assertEqual(
+            [r.reservation_number for r in self.archive.find(start="2026-01-31", end="2026-03-14")], [2]
+        )
+        self.assertEqual(self.archive.find(id=3), [])
+
+    @parameterized.expand([
+        ("id", {"id": "1"}, "User ID must be a valid integer."),
+        ("start", {"start": "2026-13-01"}, "Date must be a valid string in 'YYYY-MM-DD' format."),
+    ])
+    def test_find_invalid(self, name, kwargs, message):
+        with self.assertRaises(ValueError) as context:
+            self.archive.find(**kwargs)
+        self.assertEqual(str(context.exception), message)
+
+    @parameterized.expand([
+        ("directory", {"directory": ""}, "Archive directory must be a valid string."),
+        ("level", {"level": 10}, "Compression level must be a valid integer between 0 and 9."),
+    ])
+    def test_invalid_arguments(self, name, kwargs, message):
+        arguments = {"directory": self.directory.name, **kwargs}
+        with self.assertRaises(ValueError) as context:
+            ReservationArchive(**arguments)
+        self.assertEqual(str(context.exception), message)
+
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(self.archive))
+        restored.write([Reservation(1, 1, 2, "Jan", "2026-01-05")])
+        self.assertEqual(len(self.archive.find()), 1)
+
+
+class TestArchiveBefore(unittest.TestCase):
+    """
+    Testy przenoszenia zakończonych rezerwacji do archiwum.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = ReservationArchive(self.directory.name)
+
+    def tearDown(self):
+        """Usuwa katalog tymczasowy po każdym teście."""
+        self.directory.cleanup()
+
+    @parameterized.expand([
+        ("objects", ReservationManagement, False),
+        ("columnar", ReservationManagement, True),
+        ("concurrent", ConcurrentReservationManagement, False),
+    ])
+    def test_moves_finished_stays(self, name, manager_class, columnar):
+        manager = manager_class(columnar=columnar, archive=self.archive)
+        manager.booking(1, "Jan", "2026-01-10", 2, nights=3)
+        manager.booking(1, "Jan", "2026-01-29", 1, nights=6)
+        manager.booking(2, "Ewa", "2026-02-02", 1)
+        self.assertEqual(manager.archiveBefore("2026-02-03"), 2)
+        self.assertEqual(
+            [reservation.reservation_number for reservation in manager.reservations], [2]
+        )
+        self.assertEqual(
+            [reservation.reservation_number for reservation in manager.userReservation(1)], [2]
+        )
+        self.assertEqual(
+            [reservation.reservation_number for reservation in manager.archivedReservations(1)], [1]
+        )
+        self.assertEqual(
+            [reservation.reservation_number for reservation in manager.archivedReservations(2)], [3]
+        )
+        self.assertNotIn(parse_date("2026-01-10"), manager.by_date)
+
+    def test_archived_dates_can_be_booked_again(self):
+        manager = ReservationManagement(archive=self.archive)
+        manager.booking(1, "Jan", "2026-01-10", 2)
+        manager.archiveBefore("2026-01-11")
+        manager.booking(1, "Jan", "2026-01-10", 2)
+        self.assertEqual(manager.userReservation(1)[0].reservation_number, 2)
+
+    def test_cancel_keeps_archive(self):
+        manager = ReservationManagement(archive=self.archive)
+        manager.booking(1, "Jan", "2026-01-10", 2)
+        manager.archiveBefore("2026-02-01")
+        self.assertFalse(manager.cancelBooking(1))
+        self.assertEqual(len(manager.archivedReservations(1)), 1)
+
+    def test_capacity_of_past_nights_is_kept(self):
+        manager = ReservationManagement(total_beds=4, archive=self.archive)
+        manager.booking(1, "Jan", "2026-01-10", 3)
+        manager.archiveBefore("2026-02-01")
+        self.assertEqual(manager.freeBeds("2026-01-10", "2026-01-11"), 1)
+
+    def test_nothing_to_archive(self):
+        manager = ReservationManagement(archive=self.archive)
+        manager.booking(1, "Jan", "2026-01-10", 2)
+        self.assertEqual(manager.archiveBefore("2026-01-10"), 0)
+        self.assertEqual(self.archive.months(), [])
+
+    def test_changelog_event(self):
+        log = ChangeLog()
+        manager = ReservationManagement(changelog=log, archive=self.archive)
+        manager.booking(1, "Jan", "2026-01-10", 2)
+        manager.archiveBefore("2026-02-01")
+        self.assertEqual(
+            [(event.action, event.key) for event in log.read()], [("create", 1), ("archive", 1)]
+        )
+
+    @parameterized.expand([
+        ("archive_before", lambda manager: manager.archiveBefore("2026-01-01")),
+        ("archived_reservations", lambda manager: manager.archivedReservations(1)),
+    ])
+    def test_archive_not_configured(self, name, call):
+        with self.assertRaises(ValueError) as context:
+            call(ReservationManagement())
+        self.assertEqual(str(context.exception), "Reservation archive is not configured.")
+
+    def test_invalid_arguments(self):
+        manager = ReservationManagement(archive=self.archive)
+        with self.assertRaises(ValueError):
+            manager.archiveBefore("2026/01/01")
+        with self.assertRaises(ValueError):
+            manager.archivedReservations("1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Moduł testów dla licznika pojemności hotelu.
+
+Ten moduł zawiera testy jednostkowe sprawdzające zajmowanie i zwalnianie
+łóżek dla przedziałów dat oraz odrzucanie przepełnionych rezerwacji.
+"""
+
+import unittest
+from src.capacity import RoomCapacity
+from src.validation import parse_date
+from parameterized import parameterized
+
+
+class TestRoomCapacity(unittest.TestCase):
+    """
+    Testy podstawowych operacji licznika pojemności.
+
+    Sprawdza:
+    - zajmowanie łóżek dla pobytów wielodniowych
+    - odrzucanie rezerwacji przekraczających pojemność
+    - zwalnianie łóżek
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.capacity = RoomCapacity(10)
+
+    def test_reserve_and_free_beds(self):
+        self.capacity.reserve("2026-03-01", "2026-03-04", 4)
+        self.assertEqual(self.capacity.free_beds("2026-03-01", "2026-03-02"), 6)
+        self.assertEqual(self.capacity.free_beds("2026-03-04", "2026-03-05"), 10)
+
+    def test_free_beds_uses_busiest_night(self):
+        self.capacity.reserve("2026-03-01", "2026-03-03", 4)
+        self.capacity.reserve("2026-03-02", "2026-03-05", 5)
+        self.assertEqual(self.capacity.occupied("2026-03-01", "2026-03-05"), 9)
+        self.assertEqual(self.capacity.free_beds("2026-03-03", "2026-03-05"), 5)
+
+    def test_overbooking_rejected(self):
+        self.capacity.reserve("2026-03-02", "2026-03-03", 8)
+        with self.assertRaisesRegex(ValueError, "Not enough free beds on this date."):
+            self.capacity.reserve("2026-03-01", "2026-03-04", 3)
+        self.assertEqual(self.capacity.free_beds("2026-03-01", "2026-03-02"), 10)
+
+    def test_release(self):
+        self.capacity.reserve("2026-03-01", "2026-03-03", 10)
+        self.capacity.release("2026-03-01", "2026-03-03", 10)
+        self.assertEqual(self.capacity.booked_nights("2026-03-01", "2026-03-03"), 0)
+        self.assertEqual(self.capacity.free_beds("2026-03-01", "2026-03-03"), 10)
+
+    def test_distant_dates(self):
+        self.capacity.reserve("2026-03-01", "2026-03-04", 4)
+        self.capacity.reserve("9999-12-01", "9999-12-31", 3)
+        self.assertEqual(len(self.capacity.calendar.blocks), 2)
+        self.assertEqual(self.capacity.free_beds("9999-12-30", "9999-12-31"), 7)
+        self.assertEqual(self.capacity.occupied("2026-03-01", "9999-12-31"), 4)
+
+    def test_booked_nights(self):
+        self.capacity.reserve("2026-03-01", "2026-03-03", 4)
+        self.capacity.reserve("2026-03-02", "2026-03-05", 1)
+        self.assertEqual(self.capacity.booked_nights("2026-03-01", "2026-03-08"), 4 * 2 + 1 * 3)
+
+    def test_available_starts(self):
+        self.capacity.reserve("2026-03-03", "2026-03-04", 8)
+        first = parse_date("2026-03-01")
+        self.assertEqual(
+            self.capacity.available_starts(first, first + 5, 3),
+            [first, first + 1, first + 3, first + 4],
+        )
+        self.assertEqual(self.capacity.available_starts(first, first + 5, 3, nights=2),
+                         [first, first + 3, first + 4])
+
+    @parameterized.expand([
+        ("same_day", "2026-03-01", "2026-03-01", "Check-out date must be after check-in date."),
+        ("reversed", "2026-03-02", "2026-03-01", "Check-out date must be after check-in date."),
+        ("bad_format", "2026/03/01", "2026-03-02", "Date must be a valid string in 'YYYY-MM-DD' format."),
+        ("no_such_day", "2026-02-30", "2026-03-02", "Date must be a valid string in 'YYYY-MM-DD' format."),
+    ])
+    def test_invalid_ranges(self, name, check_in, check_out, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            self.capacity.reserve(check_in, check_out, 1)
+
+    @parameterized.expand([
+        ("zero", 0),
+        ("negative", -5),
+        ("none", None),
+        ("string", "10"),
+    ])
+    def test_invalid_total_beds(self, name, total_beds):
+        with self.assertRaisesRegex(ValueError, "Number of beds must be a valid integer."):
+            RoomCapacity(total_beds)
+
+    def test_consecutive_nights(self):
+        self.assertEqual(parse_date("2026-03-02") - parse_date("2026-03-01"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Moduł testów dla magazynu skompresowanych komentarzy.
+
+Ten moduł zawiera testy budowania słownika kompresji, zapisu i odczytu
+tekstów, współdzielenia identycznych tekstów oraz zwalniania miejsca.
+"""
+
+import pickle
+import unittest
+from src.compression import CommentArena, build_dictionary
+from src.reviews import CompressedReview, Review, Reviews
+from parameterized import parameterized
+
+
+class TestCommentArena(unittest.TestCase):
+    """
+    Testy magazynu skompresowanych tekstów.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        samples = ["great room and friendly staff", "the room was clean and quiet"]
+        self.arena = CommentArena(build_dictionary(samples))
+
+    @parameterized.expand([
+        ("short", "ok"),
+        ("long", "The room was clean and quiet, the staff friendly. " * 10),
+        ("unicode", "Świetne śniadanie, cicha okolica"),
+    ])
+    def test_round_trip(self, name, text):
+        self.assertEqual(self.arena.load(self.arena.store(text)), text)
+
+    def test_long_text_is_compressed(self):
+        text = "The room was clean and quiet, the staff friendly. " * 10
+        self.arena.store(text)
+        self.assertLess(self.arena.stored_bytes(), len(text) // 4)
+
+    def test_identical_texts_are_interned(self):
+        first = self.arena.store("great room")
+        second = self.arena.store("great room")
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.arena), 1)
+        self.arena.release(first)
+        self.assertEqual(self.arena.load(second), "great room")
+
+    def test_released_slot_is_reused(self):
+        ref = self.arena.store("great room")
+        self.arena.release(ref)
+        self.assertEqual(len(self.arena), 0)
+        self.assertEqual(self.arena.store("quiet room"), ref)
+
+    def test_compaction_keeps_live_texts(self):
+        refs = [self.arena.store(f"review number {n} about the room " * 3) for n in range(6)]
+        for ref in refs[:3]:
+            self.arena.release(ref)
+        self.assertEqual(self.arena.stored_bytes(), len(self.arena._data))
+        self.assertEqual(self.arena.load(refs[4]), "review number 4 about the room " * 3)
+
+    def test_build_dictionary_prefers_frequent_words(self):
+        dictionary = build_dictionary(["room room room staff", "room pool"], size=12)
+        self.assertTrue(dictionary.endswith(b"room "))
+        self.assertLessEqual(len(dictionary), 12)
+
+    @parameterized.expand([
+        ("dictionary_string", "room", 6, "Dictionary must be bytes."),
+        ("level_too_high", b"", 10, "Compression level must be a valid integer between 0 and 9."),
+    ])
+    def test_invalid_arguments(self, name, dictionary, level, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            CommentArena(dictionary, level)
+
+
+class TestCompressedReviews(unittest.TestCase):
+    """
+    Testy systemu recenzji przechowującego komentarze w skompresowanym magazynie.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = Reviews(compress_comments=True)
+        self.manager.add_review(1, 5, "great room")
+        self.manager.add_review(2, 3, "great room")
+
+    def test_reviews_are_slotted(self):
+        self.assertFalse(hasattr(Review(1, 5, "comment"), "__dict__"))
+        self.assertIsInstance(self.manager.get_review(1), CompressedReview)
+        self.assertFalse(hasattr(self.manager.get_review(1), "__dict__"))
+
+    def test_lifecycle_keeps_arena_consistent(self):
+        self.manager.edit_review(1, 4, "noisy street")
+        self.manager.add_review(2, 2, "noisy street")
+        self.assertEqual(self.manager.get_review(1).comment, "noisy street")
+        self.assertEqual(len(self.manager.arena), 1)
+        self.manager.delete_review(1)
+        self.manager.delete_review(2)
+        self.assertEqual(len(self.manager.arena), 0)
+
+    def test_search_reads_compressed_comments(self):
+        self.manager.edit_review(2, 3, "quiet pool")
+        self.assertEqual([r.id for r in self.manager.search("room")], [1])
+
+    def test_pickle_keeps_shared_comments(self):
+        restored = pickle.loads(pickle.dumps(self.manager, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(restored.get_review(2).comment, "great room")
+        restored.delete_review(1)
+        self.assertEqual(restored.get_review(2).comment, "great room")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Moduł testów dla skrótów haseł.
+
+Ten moduł zawiera testy jednostkowe sprawdzające wyliczanie i weryfikację
+skrótów, weryfikację wsadową, pulę procesów oraz pamięć podręczną z TTL.
+"""
+
+import pickle
+import unittest
+from src.credentials import PasswordHasher
+from src.users import UserManagement
+from parameterized import parameterized
+
+
+class FakeClock:
+    """Zegar sterowany ręcznie w testach pamięci podręcznej."""
+
+    def __init__(self):
+        """Ustawia zegar na chwilę 0."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Zwraca bieżący czas zegara."""
+        return self.now
+
+
+class TestPasswordHasher(unittest.TestCase):
+    """
+    Testy wyliczania i weryfikacji skrótów haseł.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.clock = FakeClock()
+        self.hasher = PasswordHasher(iterations=1000, cache_size=2, cache_ttl=10, clock=self.clock)
+
+    def test_hash_and_verify(self):
+        encoded = self.hasher.hash("password123")
+        self.assertTrue(encoded.startswith("pbkdf2_sha256$1000$"))
+        self.assertNotIn("password123", encoded)
+        self.assertTrue(self.hasher.verify("password123", encoded))
+        self.assertFalse(self.hasher.verify("password124", encoded))
+
+    def test_salts_differ(self):
+        first, second = self.hasher.hash_many(["password123", "password123"])
+        self.assertNotEqual(first, second)
+
+    @parameterized.expand([
+        ("none_password", None, "pbkdf2_sha256$1$00$00"),
+        ("none_hash", "password123", None),
+        ("garbage_hash", "password123", "garbage"),
+        ("other_algorithm", "password123", "md5$1$00$00"),
+    ])
+    def test_verify_invalid_input(self, name, password, encoded):
+        self.assertFalse(self.hasher.verify(password, encoded))
+
+    def test_verify_many(self):
+        first, second = self.hasher.hash_many(["password123", "password456"])
+        results = self.hasher.verify_many([
+            ("password123", first), ("wrong", first), ("password456", second),
+        ])
+        self.assertEqual(results, [True, False, True])
+
+    def test_cache_ttl_and_eviction(self):
+        encoded = self.hasher.hash("password123")
+        self.hasher.verify("password123", encoded)
+        self.assertEqual(len(self.hasher._cache), 1)
+        self.clock.now = 11
+        self.assertFalse(self.hasher._cached(self.hasher._cache_key("password123", encoded)))
+
+        others = self.hasher.hash_many(["a" * 8, "b" * 8, "c" * 8])
+        self.hasher.verify_many(zip(["a" * 8, "b" * 8, "c" * 8], others))
+        self.assertEqual(len(self.hasher._cache), 2)
+
+    def test_failed_verification_not_cached(self):
+        encoded = self.hasher.hash("password123")
+        self.hasher.verify("wrong", encoded)
+        self.assertEqual(len(self.hasher._cache), 0)
+
+    def test_process_pool(self):
+        hasher = PasswordHasher(iterations=1000, workers=2)
+        try:
+            hashes = hasher.hash_many([f"password{i}" for i in range(4)])
+            results = hasher.verify_many((f"password{i}", hashes[i]) for i in range(4))
+            self.assertEqual(results, [True] * 4)
+            restored = pickle.loads(pickle.dumps(hasher))
+            self.assertIsNone(restored._pool)
+        finally:
+            hasher.close()
+
+    @parameterized.expand([
+        ("iterations", {"iterations": 0}, "Number of iterations must be a valid integer."),
+        ("workers", {"workers": -1}, "Number of workers must be a valid integer."),
+        ("cache_size", {"cache_size": -1}, "Cache size must be a valid integer."),
+    ])
+    def test_invalid_parameters(self, name, kwargs, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            PasswordHasher(**kwargs)
+
+
+class TestHashedUserManagement(unittest.TestCase):
+    """
+    Testy systemu użytkowników przechowującego skróty haseł.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = UserManagement(hasher=PasswordHasher(iterations=1000))
+
+    def test_password_is_hashed(self):
+        user_id = self.manager.addUser("user@mail.com", "password123")
+        self.assertNotEqual(self.manager.getUser(user_id).password, "password123")
+        self.assertTrue(self.manager.verifyPassword(user_id, "password123"))
+        self.assertFalse(self.manager.verifyPassword(user_id, "password124"))
+
+    def test_update_rehashes(self):
+        user_id = self.manager.addUser("user@mail.com", "password123")
+        self.manager.updateUser(user_id, "user@mail.com", "newpassword123")
+        self.assertFalse(self.manager.verifyPassword(user_id, "password123"))
+        self.assertTrue(self.manager.verifyPassword(user_id, "newpassword123"))
+
+    def test_verify_passwords_batch(self):
+        first = self.manager.addUser("a@mail.com", "password123")
+        second = self.manager.addUser("b@mail.com", "password456")
+        results = self.manager.verifyPasswords([
+            (first, "password123"), (second, "password123"), (999, "password123"),
+        ])
+        self.assertEqual(results, [True, False, False])
+
+    def test_plaintext_mode_verification(self):
+        manager = UserManagement()
+        user_id = manager.addUser("user@mail.com", "password123")
+        self.assertTrue(manager.verifyPassword(user_id, "password123"))
+        self.assertFalse(manager.verifyPassword(user_id, "password12"))
+        self.assertFalse(manager.verifyPassword(user_id, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
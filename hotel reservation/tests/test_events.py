@@ -0,0 +1,148 @@
+"""
+Moduł testów dla strumienia zdarzeń zmian.
+
+Ten moduł zawiera testy bufora cyklicznego zdarzeń (numeracja, odczyt od
+podanego numeru, nadpisywanie najstarszych zdarzeń) oraz zdarzeń zgłaszanych
+przez menedżery rezerwacji, użytkowników i recenzji.
+"""
+
+import pickle
+import unittest
+from src.events import ChangeLog
+from src.locking import ConcurrentReservationManagement
+from src.reservation import ReservationManagement
+from src.reviews import Reviews
+from src.users import UserManagement
+from parameterized import parameterized
+
+
+class TestChangeLog(unittest.TestCase):
+    """
+    Testy bufora cyklicznego zdarzeń.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.log = ChangeLog(capacity=4)
+
+    def test_emit_numbers_events(self):
+        self.assertEqual(self.log.emit("user", "create", 1), 1)
+        self.assertEqual(self.log.emit("user", "delete", 1), 2)
+        self.assertEqual(self.log.last_seq, 2)
+        self.assertEqual(
+            [event.as_dict() for event in self.log.read()],
+            [
+                {"seq": 1, "entity": "user", "action": "create", "key": 1, "data": None},
+                {"seq": 2, "entity": "user", "action": "delete", "key": 1, "data": None},
+            ]
+        )
+
+    def test_read_after_and_limit(self):
+        for key in range(1, 4):
+            self.log.emit("review", "create", key)
+        self.assertEqual([event.seq for event in self.log.read(after=1)], [2, 3])
+        self.assertEqual([event.seq for event in self.log.read(after=0, limit=2)], [1, 2])
+        self.assertEqual(self.log.read(after=3), [])
+
+    def test_wraparound(self):
+        for key in range(1, 7):
+            self.log.emit("review", "create", key)
+        self.assertEqual(self.log.first_seq, 3)
+        self.assertEqual([event.key for event in self.log.read(after=2)], [3, 4, 5, 6])
+        with self.assertRaises(ValueError) as context:
+            self.log.read(after=1)
+        self.assertEqual(str(context.exception), "Requested events are no longer available.")
+
+    @parameterized.expand([
+        ("negative", {"after": -1}, "Sequence number must be a valid integer."),
+        ("string", {"after": "1"}, "Sequence number must be a valid integer."),
+        ("zero_limit", {"limit": 0}, "Limit must be a valid integer."),
+    ])
+    def test_read_invalid(self, name, kwargs, message):
+        with self.assertRaises(ValueError) as context:
+            self.log.read(**kwargs)
+        self.assertEqual(str(context.exception), message)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError) as context:
+            ChangeLog(capacity=0)
+        self.assertEqual(str(context.exception), "Capacity must be a valid integer.")
+
+    def test_pickle(self):
+        self.log.emit("user", "create", 1, {"email": "a@b.pl"})
+        restored = pickle.loads(pickle.dumps(self.log))
+        self.assertEqual(restored.read()[0].data, {"email": "a@b.pl"})
+        self.assertEqual(restored.emit("user", "delete", 1), 2)
+
+
+class TestManagerEvents(unittest.TestCase):
+    """
+    Testy zdarzeń zgłaszanych przez menedżery.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.log = ChangeLog()
+
+    def changes(self):
+        return [(event.entity, event.action, event.key, event.data) for event in self.log.read()]
+
+    @parameterized.expand([
+        ("plain", ReservationManagement),
+        ("concurrent", ConcurrentReservationManagement),
+    ])
+    def test_reservation_events(self, name, manager_class):
+        manager = manager_class(changelog=self.log)
+        manager.booking(1, "Jan", "2026-05-01", 2, nights=3)
+        manager.bookMany([(2, "Ewa", "2026-05-02", 1)])
+        manager.cancelBooking(1)
+        self.assertEqual(self.changes(), [
+            ("reservation", "create", 1,
+             {"id": 1, "user": "Jan", "date": "2026-05-01", "beds": 2, "nights": 3}),
+            ("reservation", "create", 2,
+             {"id": 2, "user": "Ewa", "date": "2026-05-02", "beds": 1, "nights": 1}),
+            ("reservation", "delete", 1, None),
+        ])
+
+    def test_failed_booking_emits_nothing(self):
+        manager = ReservationManagement(changelog=self.log)
+        with self.assertRaises(ValueError):
+            manager.booking(1, "Jan", "2026-13-01", 1)
+        self.assertFalse(manager.cancelBooking(1))
+        self.assertEqual(self.changes(), [])
+
+    def test_user_events_without_passwords(self):
+        manager = UserManagement(changelog=self.log)
+        user_id = manager.addUser("jan@example.com", "Secret123")
+        manager.updateUser(user_id, "jan@example.org", "Secret456")
+        manager.deleteUser(user_id)
+        self.assertEqual(self.changes(), [
+            ("user", "create", user_id, {"email": "jan@example.com"}),
+            ("user", "update", user_id, {"email": "jan@example.org"}),
+            ("user", "delete", user_id, None),
+        ])
+
+    def test_review_events(self):
+        reviews = Reviews(changelog=self.log)
+        reviews.add_review(1, 5, "Great")
+        reviews.add_review(1, 4, "Good")
+        reviews.edit_review(1, 3, "Fine")
+        reviews.delete_review(1)
+        self.assertEqual(self.changes(), [
+            ("review", "create", 1, {"stars": 5, "comment": "Great"}),
+            ("review", "update", 1, {"stars": 4, "comment": "Good"}),
+            ("review", "update", 1, {"stars": 3, "comment": "Fine"}),
+            ("review", "delete", 1, None),
+        ])
+
+    def test_shared_log_orders_all_managers(self):
+        users = UserManagement(changelog=self.log)
+        reviews = Reviews(changelog=self.log)
+        user_id = users.addUser("ewa@example.com", "Secret123")
+        reviews.add_review(user_id, 5, "Great")
+        self.assertEqual([event.entity for event in self.log.read()], ["user", "review"])
+        self.assertEqual([event.entity for event in self.log.read(after=1)], ["review"])
+
+
+if __name__ == '__main__':
+    unittest.main()
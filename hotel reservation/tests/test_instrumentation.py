@@ -0,0 +1,95 @@
+"""
+Moduł testów dla pomiarów wywołań metod menedżerów.
+
+Ten moduł zawiera testy zliczania wywołań i błędów, histogramów czasu
+wykonania, rozmiarów kolekcji oraz eksportu do słownika i formatu Prometheusa.
+"""
+
+import pickle
+import unittest
+from src.instrumentation import Metrics
+from src.reservation import ReservationManagement
+from src.reviews import Reviews
+from src.users import UserManagement
+from parameterized import parameterized
+
+
+class FakeClock:
+    """Zegar przesuwany o stały krok przy każdym odczycie."""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestMetrics(unittest.TestCase):
+    """
+    Testy pomiarów wywołań metod menedżerów.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.metrics = Metrics(buckets=(0.001, 0.01), clock=FakeClock(0.002))
+        self.reservations = self.metrics.instrument(ReservationManagement(), "reservations")
+        self.users = self.metrics.instrument(UserManagement(), "users")
+        self.reviews = self.metrics.instrument(Reviews(), "reviews", methods=["add_review"])
+
+    def test_calls_errors_and_histogram(self):
+        self.reservations.booking(1, "user1", "2026-01-01", 1)
+        self.reservations.booking(2, "user2", "2026-01-01", 1)
+        with self.assertRaises(ValueError):
+            self.reservations.booking(1, "user1", "2026-01-01", 1)
+        stats = self.metrics.as_dict()["methods"]["reservations"]["booking"]
+        self.assertEqual(stats["calls"], 3)
+        self.assertEqual(stats["errors"], 1)
+        self.assertAlmostEqual(stats["average_seconds"], 0.002)
+        self.assertEqual(list(stats["histogram"].values()), [0, 3, 3])
+
+    def test_collection_sizes(self):
+        self.reservations.booking(1, "user1", "2026-01-01", 1)
+        self.users.addUser("a@example.com", "password123")
+        self.reviews.add_review(1, 5, "great")
+        self.reviews.add_review(2, 4, "good")
+        self.assertEqual(self.metrics.sizes(), {"reservations": 1, "users": 1, "reviews": 2})
+
+    def test_selected_methods_only(self):
+        self.reviews.add_review(1, 5, "great")
+        self.reviews.get_review(1)
+        self.assertEqual(list(self.metrics.as_dict()["methods"]["reviews"]), ["add_review"])
+
+    def test_uninstrument_allows_pickling(self):
+        self.reservations.booking(1, "user1", "2026-01-01", 1)
+        self.metrics.uninstrument(self.reservations)
+        restored = pickle.loads(pickle.dumps(self.reservations))
+        self.assertEqual(len(restored.userReservation(1)), 1)
+        self.assertEqual(self.metrics.as_dict()["methods"]["reservations"]["booking"]["calls"], 1)
+
+    def test_prometheus_export(self):
+        self.users.addUser("a@example.com", "password123")
+        text = self.metrics.prometheus()
+        self.assertIn('hotel_method_calls_total{component="users",method="addUser"} 1', text)
+        self.assertIn('hotel_method_duration_seconds_bucket{component="users",method="addUser",le="+Inf"} 1',
+                      text)
+        self.assertIn('hotel_collection_size{component="users"} 1', text)
+        self.assertIn("# TYPE hotel_method_duration_seconds histogram", text)
+
+    def test_double_instrumentation(self):
+        with self.assertRaisesRegex(ValueError, "Manager is already instrumented."):
+            self.metrics.instrument(self.users, "users")
+
+    @parameterized.expand([
+        ("empty", ()),
+        ("decreasing", (0.1, 0.01)),
+        ("duplicated", (0.1, 0.1)),
+    ])
+    def test_invalid_buckets(self, name, buckets):
+        with self.assertRaisesRegex(ValueError, "Buckets must be a non-empty increasing sequence."):
+            Metrics(buckets=buckets)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Moduł testów dla systemu rezerwacji bezpiecznego dla wielu wątków.
+
+Ten moduł zawiera testy sprawdzające spójność rezerwacji wykonywanych
+równolegle z wielu wątków oraz serializację obiektu z blokadami.
+"""
+
+import pickle
+import threading
+import unittest
+from src.locking import ConcurrentReservationManagement
+
+
+class TestConcurrentReservation(unittest.TestCase):
+    """
+    Testy równoległych rezerwacji.
+
+    Sprawdza, że konfliktujące rezerwacje kończą się dokładnie jednym
+    sukcesem, a numery rezerwacji się nie powtarzają.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ConcurrentReservationManagement(total_beds=1000)
+
+    def run_threads(self, target, count=8):
+        """Uruchamia podaną funkcję w wielu wątkach jednocześnie."""
+        barrier = threading.Barrier(count)
+
+        def wrapped(index):
+            barrier.wait()
+            target(index)
+
+        threads = [threading.Thread(target=wrapped, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_conflicting_bookings_serialize(self):
+        successes = []
+
+        def book(index):
+            for day in range(1, 29):
+                try:
+                    self.manager.booking(1, "user1", f"2026-02-{day:02d}", 1)
+                    successes.append(day)
+                except ValueError:
+                    pass
+
+        self.run_threads(book)
+        self.assertEqual(sorted(successes), list(range(1, 29)))
+        self.assertEqual(len(self.manager.userReservation(1)), 28)
+
+    def test_reservation_numbers_unique(self):
+        def book(index):
+            for day in range(1, 29):
+                self.manager.booking(index + 1, f"user{index}", f"2026-02-{day:02d}", 1)
+            if index % 2:
+                self.manager.cancelBooking(index + 1)
+
+        self.run_threads(book)
+        numbers = [r.reservation_number for r in self.manager.reservations]
+        self.assertEqual(len(numbers), 4 * 28)
+        self.assertEqual(len(set(numbers)), len(numbers))
+        self.assertEqual(self.manager.freeBeds("2026-02-01", "2026-03-01"), 1000 - 4)
+
+    def test_pickle_recreates_locks(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        restored = pickle.loads(pickle.dumps(self.manager))
+        restored.booking(2, "user2", "2026-03-01", 1)
+        self.assertEqual(len(restored.reservations), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
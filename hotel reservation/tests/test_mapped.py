@@ -0,0 +1,116 @@
+"""
+Moduł testów dla migawek otwieranych przez mmap.
+
+Ten moduł zawiera testy jednostkowe sprawdzające zapis migawki o stałym
+układzie oraz leniwe zapytania o rezerwacje, użytkowników i recenzje.
+"""
+
+import os
+import tempfile
+import unittest
+from src.mapped import MappedSnapshot, write_mapped_snapshot
+from src.persistence import PersistentState
+from src.reservation import ReservationManagement
+from src.reviews import Reviews
+from src.users import UserManagement
+from src.validation import MAX_NIGHTS
+
+
+class TestMappedSnapshot(unittest.TestCase):
+    """
+    Testy zapisu i odczytu migawki mmap.
+
+    Sprawdza wyszukiwanie rezerwacji według użytkownika, pobieranie
+    użytkowników i recenzji oraz obsługę uszkodzonych plików.
+    """
+
+    def setUp(self):
+        """Przygotowuje menedżery i plik migawki przed każdym testem."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "snapshot.map")
+
+        reservations = ReservationManagement()
+        reservations.booking(2, "user2", "2026-03-01", 1)
+        reservations.booking(1, "user1", "2026-03-01", 2, nights=3)
+        reservations.booking(2, "user2", "2026-03-05", 4)
+        users = UserManagement()
+        users.addUser("user@mail.com", "password123")
+        users.addUser("zażółć@mail.com", "password456")
+        reviews = Reviews()
+        reviews.add_review(7, 5, "great")
+        reviews.add_review(3, 2, "great")
+        write_mapped_snapshot(self.path, reservations, users, reviews)
+        self.snapshot = MappedSnapshot(self.path)
+
+    def tearDown(self):
+        """Zamyka migawkę i usuwa katalog tymczasowy."""
+        self.snapshot.close()
+        self.directory.cleanup()
+
+    def test_user_reservation(self):
+        result = self.snapshot.reservations.userReservation(2)
+        self.assertEqual([r.date for r in result], ["2026-03-01", "2026-03-05"])
+        self.assertEqual(result[1].beds, 4)
+        self.assertEqual(self.snapshot.reservations.userReservation(1)[0].check_out(), "2026-03-04")
+        self.assertEqual(self.snapshot.reservations.userReservation(9), [])
+
+    def test_all_reservations_in_booking_order(self):
+        numbers = [r.reservation_number for r in self.snapshot.reservations.reservations]
+        self.assertEqual(numbers, [1, 2, 3])
+        self.assertEqual(len(self.snapshot.reservations), 3)
+
+    def test_get_user(self):
+        self.assertEqual(self.snapshot.users.getUser(2).email, "zażółć@mail.com")
+        self.assertEqual(self.snapshot.users.getUser(1).password, "password123")
+        self.assertIsNone(self.snapshot.users.getUser(3))
+        self.assertIsNone(self.snapshot.users.getUser(None))
+
+    def test_get_review(self):
+        self.assertEqual(self.snapshot.reviews.get_review(3).stars, 2)
+        self.assertEqual(self.snapshot.reviews.get_review(7).comment, "great")
+        self.assertIsNone(self.snapshot.reviews.get_review(5))
+        with self.assertRaisesRegex(TypeError, "Review ID must be a valid integer."):
+            self.snapshot.reviews.get_review(None)
+
+    def test_invalid_user_id(self):
+        with self.assertRaisesRegex(ValueError, "User ID must be a valid integer."):
+            self.snapshot.reservations.userReservation("1")
+
+    def test_large_number_of_beds(self):
+        reservations = ReservationManagement()
+        reservations.booking(1, "user1", "2026-03-01", 2 ** 40, nights=MAX_NIGHTS)
+        write_mapped_snapshot(self.path, reservations)
+        with MappedSnapshot(self.path) as snapshot:
+            reservation = snapshot.reservations.userReservation(1)[0]
+            self.assertEqual((reservation.beds, reservation.nights), (2 ** 40, MAX_NIGHTS))
+        reservations.booking(2, "user2", "2026-03-01", 2 ** 63)
+        with self.assertRaisesRegex(ValueError, "Number of beds must be a valid integer."):
+            write_mapped_snapshot(self.path, reservations)
+
+    def test_corrupted_file(self):
+        path = os.path.join(self.directory.name, "broken.map")
+        with open(path, "wb") as file:
+            file.write(b"not a snapshot" * 10)
+        with self.assertRaisesRegex(ValueError, "Snapshot file is corrupted."):
+            MappedSnapshot(path)
+
+    def test_overwrite_keeps_open_snapshot(self):
+        write_mapped_snapshot(self.path)
+        self.assertEqual(len(self.snapshot.reservations), 3)
+        self.assertEqual(self.snapshot.users.getUser(2).email, "zażółć@mail.com")
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+        with MappedSnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot.reservations), 0)
+
+    def test_export_from_persistent_state(self):
+        state = PersistentState(os.path.join(self.directory.name, "state"))
+        state.reservations.booking(5, "user5", "2026-04-01", 2)
+        state.export_mapped(self.path)
+        state.close()
+        with MappedSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.reservations.userReservation(5)[0].beds, 2)
+            self.assertEqual(len(snapshot.users), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Moduł testów dla kalendarza zajętości.
+
+Ten moduł zawiera testy drzewa przedziałowego: dodawania wartości do
+przedziałów nocy, zapytań o maksimum, minimum i sumę, wyszukiwania nocy
+o ograniczonej zajętości, a także rzadkiego kalendarza złożonego z bloków.
+"""
+
+import random
+import unittest
+from src.occupancy import OccupancyCalendar, OccupancyTree
+from parameterized import parameterized
+
+
+class TestOccupancyTree(unittest.TestCase):
+    """
+    Testy drzewa przedziałowego zajętości.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.tree = OccupancyTree(size=200, origin=1000)
+
+    def test_empty_tree(self):
+        self.assertEqual(self.tree.size, 256)
+        self.assertTrue(self.tree.is_empty())
+        self.assertEqual(self.tree.maximum(1100, 1110), 0)
+        self.assertEqual(self.tree.total(1100, 1110), 0)
+        self.assertEqual(self.tree.at_most(1100, 1103, 0), [1100, 1101, 1102])
+
+    def test_range_queries(self):
+        self.tree.add(1100, 1104, 3)
+        self.tree.add(1102, 1106, 2)
+        self.assertEqual(self.tree.maximum(1100, 1106), 5)
+        self.assertEqual(self.tree.minimum(1100, 1106), 2)
+        self.assertEqual(self.tree.minimum(1099, 1101), 0)
+        self.assertEqual(self.tree.total(1100, 1106), 3 * 4 + 2 * 4)
+        self.assertEqual(self.tree.at_most(1098, 1108, 2), [1098, 1099, 1104, 1105, 1106, 1107])
+
+    def test_is_empty_after_release(self):
+        self.tree.add(1000, 1010, 2)
+        self.assertFalse(self.tree.is_empty())
+        self.tree.add(1000, 1005, -2)
+        self.assertFalse(self.tree.is_empty())
+        self.tree.add(1005, 1010, -2)
+        self.assertTrue(self.tree.is_empty())
+
+    def test_matches_plain_array(self):
+        generator = random.Random(7)
+        plain = [0] * 200
+        for _ in range(300):
+            start = generator.randrange(200)
+            end = generator.randint(start + 1, min(start + 15, 200))
+            value = generator.randint(-2, 3)
+            self.tree.add(1000 + start, 1000 + end, value)
+            for night in range(start, end):
+                plain[night] += value
+            low = generator.randrange(200)
+            high = generator.randint(low + 1, 200)
+            self.assertEqual(self.tree.maximum(1000 + low, 1000 + high), max(plain[low:high]))
+            self.assertEqual(self.tree.minimum(1000 + low, 1000 + high), min(plain[low:high]))
+            self.assertEqual(self.tree.total(1000 + low, 1000 + high), sum(plain[low:high]))
+        self.assertEqual(
+            self.tree.at_most(1000, 1200, 1),
+            [1000 + night for night, value in enumerate(plain) if value <= 1],
+        )
+
+    @parameterized.expand([
+        ("zero", 0),
+        ("string", "8"),
+    ])
+    def test_invalid_size(self, name, size):
+        with self.assertRaisesRegex(ValueError, "Tree size must be a valid integer."):
+            OccupancyTree(size)
+
+
+class TestOccupancyCalendar(unittest.TestCase):
+    """
+    Testy rzadkiego kalendarza zajętości.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.calendar = OccupancyCalendar(block=16)
+
+    def test_matches_plain_array_across_blocks(self):
+        generator = random.Random(3)
+        plain = [0] * 200
+        for _ in range(300):
+            start = generator.randrange(200)
+            end = generator.randint(start + 1, min(start + 40, 200))
+            value = generator.randint(-2, 3)
+            self.calendar.add(1000 + start, 1000 + end, value)
+            for night in range(start, end):
+                plain[night] += value
+            low = generator.randrange(200)
+            high = generator.randint(low + 1, 200)
+            self.assertEqual(self.calendar.maximum(1000 + low, 1000 + high), max(plain[low:high]))
+            self.assertEqual(self.calendar.minimum(1000 + low, 1000 + high), min(plain[low:high]))
+            self.assertEqual(self.calendar.total(1000 + low, 1000 + high), sum(plain[low:high]))
+        self.assertEqual(
+            self.calendar.at_most(990, 1210, 1),
+            list(range(990, 1000))
+            + [1000 + night for night, value in enumerate(plain) if value <= 1]
+            + list(range(1200, 1210)),
+        )
+
+    def test_distant_dates_allocate_single_blocks(self):
+        self.calendar.add(739000, 739003, 2)
+        self.calendar.add(3652000, 3652005, 1)
+        self.assertEqual(len(self.calendar.blocks), 2)
+        self.assertEqual(self.calendar.maximum(739000, 3652059), 2)
+        self.assertEqual(self.calendar.total(739000, 3652059), 2 * 3 + 5)
+
+    def test_released_blocks_are_dropped(self):
+        self.calendar.add(100, 140, 2)
+        self.calendar.add(100, 140, -2)
+        self.assertEqual(self.calendar.blocks, {})
+        self.assertEqual(self.calendar.at_most(100, 103, 0), [100, 101, 102])
+
+    def test_invalid_block(self):
+        with self.assertRaisesRegex(ValueError, "Tree size must be a valid integer."):
+            OccupancyCalendar(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,259 @@
+"""
+Moduł testów dla trwałego stanu systemu hotelowego.
+
+Ten moduł zawiera testy jednostkowe sprawdzające dziennik operacji,
+migawki oraz odtwarzanie stanu po ponownym uruchomieniu.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from functools import partial
+from src.archive import ReservationArchive
+from src.credentials import PasswordHasher
+from src.locking import ConcurrentReservationManagement
+from src.persistence import JOURNAL_FILE, SNAPSHOT_FILE, Journal, PersistentState
+from src.reservation import ReservationManagement
+from src.users import UserManagement
+
+
+class TestJournal(unittest.TestCase):
+    """
+    Testy dziennika operacji.
+
+    Sprawdza zapis i odczyt wpisów oraz pomijanie uszkodzonej końcówki pliku.
+    """
+
+    def setUp(self):
+        """Przygotowuje katalog tymczasowy przed każdym testem."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, JOURNAL_FILE)
+
+    def tearDown(self):
+        """Usuwa katalog tymczasowy po każdym teście."""
+        self.directory.cleanup()
+
+    def test_append_and_read(self):
+        journal = Journal(self.path, sync_every=2)
+        journal.append(1, "users", "addUser", ["a@mail.com", "password123"], {})
+        journal.append(2, "users", "deleteUser", [1], {})
+        journal.close()
+        entries = list(Journal.read(self.path))
+        self.assertEqual(entries[1], [2, "users", "deleteUser", [1], {}])
+
+    def test_torn_last_line_is_ignored(self):
+        journal = Journal(self.path)
+        journal.append(1, "reviews", "delete_review", [1], {})
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('[2, "reviews", "del')
+        self.assertEqual(len(list(Journal.read(self.path))), 1)
+
+    def test_repair_removes_torn_last_line(self):
+        journal = Journal(self.path)
+        journal.append(1, "reviews", "delete_review", [1], {})
+        journal.close()
+        size = os.path.getsize(self.path)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('[2, "reviews", "del')
+        Journal.repair(self.path)
+        self.assertEqual(os.path.getsize(self.path), size)
+
+    def test_repair_rejects_corruption_before_last_line(self):
+        journal = Journal(self.path)
+        journal.append(1, "reviews", "delete_review", [1], {})
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('[2, "reviews", "del\n')
+        journal = Journal(self.path)
+        journal.append(3, "reviews", "delete_review", [3], {})
+        journal.close()
+        size = os.path.getsize(self.path)
+        with self.assertRaisesRegex(ValueError, "Journal file is corrupted."):
+            Journal.repair(self.path)
+        self.assertEqual(os.path.getsize(self.path), size)
+        with self.assertRaisesRegex(ValueError, "Journal file is corrupted."):
+            list(Journal.read(self.path))
+
+    def test_invalid_sync_interval(self):
+        with self.assertRaisesRegex(ValueError, "Sync interval must be a valid integer."):
+            Journal(self.path, sync_every=0)
+
+
+class TestPersistentState(unittest.TestCase):
+    """
+    Testy odtwarzania stanu wszystkich menedżerów.
+
+    Sprawdza odtworzenie z samego dziennika, z migawki oraz z migawki
+    i dopisanej po niej końcówki dziennika.
+    """
+
+    def setUp(self):
+        """Przygotowuje katalog tymczasowy przed każdym testem."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self):
+        """Usuwa katalog tymczasowy po każdym teście."""
+        self.directory.cleanup()
+
+    def populate(self, state):
+        """Wykonuje przykładowe operacje na wszystkich menedżerach."""
+        state.reservations.booking(1, "user1", "2026-03-01", 2)
+        state.reservations.bookMany([(2, "user2", "2026-03-01", 1), (3, "user3", "2026-03-02", 1, 2)])
+        state.reservations.cancelBooking(2)
+        user_id = state.users.addUser("user@mail.com", "password123")
+        state.users.updateUser(user_id, "new@mail.com", "password123")
+        state.reviews.add_review(1, 5, "great")
+        state.reviews.edit_review(1, 4, "good")
+
+    def assertRecovered(self, state):
+        """Sprawdza, że stan odpowiada operacjom z populate."""
+        self.assertEqual([r.id for r in state.reservations.reservations], [1, 3])
+        self.assertEqual(state.reservations.userReservation(3)[0].nights, 2)
+        self.assertEqual(state.reservations.next_number, 4)
+        self.assertEqual(state.users.getUser(1).email, "new@mail.com")
+        self.assertEqual(state.reviews.get_review(1).comment, "good")
+
+    def test_recover_from_journal(self):
+        state = PersistentState(self.path)
+        self.populate(state)
+        state.close()
+        self.assertRecovered(PersistentState(self.path))
+
+    def test_recover_from_snapshot_and_tail(self):
+        state = PersistentState(self.path)
+        self.populate(state)
+        state.snapshot()
+        state.users.addUser("other@mail.com", "password123")
+        state.close()
+        self.assertEqual(len(list(Journal.read(os.path.join(self.path, JOURNAL_FILE)))), 1)
+
+        recovered = PersistentState(self.path)
+        self.assertRecovered(recovered)
+        self.assertEqual(recovered.users.getUser(2).email, "other@mail.com")
+        self.assertEqual(recovered.seq, 8)
+
+    def test_torn_tail_then_appends(self):
+        state = PersistentState(self.path)
+        state.reservations.booking(1, "user1", "2026-03-01", 2)
+        state.close()
+        with open(os.path.join(self.path, JOURNAL_FILE), "a", encoding="utf-8") as file:
+            file.write('[2, "reservations", "book')
+
+        state = PersistentState(self.path)
+        state.reservations.booking(2, "user2", "2026-03-02", 1)
+        state.close()
+        recovered = PersistentState(self.path)
+        self.assertEqual([r.id for r in recovered.reservations.reservations], [1, 2])
+        self.assertEqual(recovered.seq, 2)
+
+    def test_generator_arguments_are_journaled(self):
+        state = PersistentState(self.path)
+        state.reservations.bookMany(row for row in [(1, "user1", "2026-03-01", 1)])
+        state.close()
+        recovered = PersistentState(self.path)
+        self.assertEqual([r.id for r in recovered.reservations.reservations], [1])
+
+    def test_unserializable_arguments_do_not_mutate(self):
+        state = PersistentState(self.path)
+        with self.assertRaises(TypeError):
+            state.reviews.add_review(1, 5, object())
+        with self.assertRaises(TypeError):
+            state.reservations.bookMany([(1, "user1", "2026-03-01", 1), object()])
+        self.assertEqual(state.reservations.reservations, [])
+        state.close()
+        self.assertEqual(list(Journal.read(os.path.join(self.path, JOURNAL_FILE))), [])
+
+    def test_configured_managers(self):
+        factories = {
+            "reservations": partial(ReservationManagement, total_beds=2),
+            "users": partial(UserManagement, hasher=PasswordHasher(iterations=1000)),
+        }
+        state = PersistentState(self.path, factories=factories)
+        state.reservations.booking(1, "user1", "2026-03-01", 2)
+        state.close()
+        recovered = PersistentState(self.path, factories=factories)
+        with self.assertRaises(ValueError):
+            recovered.reservations.booking(2, "user2", "2026-03-01", 1)
+
+    def test_archive_is_journaled(self):
+        archive = ReservationArchive(os.path.join(self.path, "archive"))
+        factories = {"reservations": partial(ReservationManagement, archive=archive)}
+        state = PersistentState(self.path, factories=factories)
+        state.reservations.booking(1, "user1", "2026-01-10", 1)
+        state.reservations.booking(2, "user2", "2026-03-01", 1)
+        self.assertEqual(state.reservations.archiveBefore("2026-02-01"), 1)
+        state.close()
+
+        recovered = PersistentState(self.path, factories=factories)
+        self.assertEqual([r.id for r in recovered.reservations.reservations], [2])
+        self.assertEqual(len(recovered.reservations.archivedReservations(1)), 1)
+        recovered.reservations.booking(1, "user1", "2026-01-10", 1)
+        self.assertEqual(recovered.reservations.userReservation(1)[0].reservation_number, 3)
+
+    def test_invalid_factory_name(self):
+        with self.assertRaisesRegex(ValueError, "Manager factories must use valid manager names."):
+            PersistentState(self.path, factories={"rooms": dict})
+
+    def test_passwords_are_journaled_as_hashes(self):
+        factories = {"users": partial(UserManagement, hasher=PasswordHasher(iterations=1000))}
+        state = PersistentState(self.path, factories=factories)
+        user_id = state.users.addUser("user@mail.com", "password123")
+        state.users.updateUser(user_id, "user@mail.com", password="secret-password")
+        state.close()
+        with open(os.path.join(self.path, JOURNAL_FILE), encoding="utf-8") as file:
+            journal = file.read()
+        self.assertNotIn("password123", journal)
+        self.assertNotIn("secret-password", journal)
+
+        recovered = PersistentState(self.path, factories=factories)
+        self.assertTrue(recovered.users.verifyPassword(user_id, "secret-password"))
+        self.assertFalse(recovered.users.verifyPassword(user_id, "password123"))
+
+    def test_concurrent_operations_keep_journal_order(self):
+        factories = {"reservations": ConcurrentReservationManagement}
+        state = PersistentState(self.path, factories=factories)
+
+        def book(index):
+            for day in range(1, 29):
+                state.reservations.booking(index + 1, f"user{index}", f"2026-02-{day:02d}", 1)
+
+        threads = [threading.Thread(target=book, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        expected = [(r.reservation_number, r.id, r.date) for r in state.reservations.reservations]
+        state.close()
+
+        recovered = PersistentState(self.path, factories=factories)
+        self.assertEqual(
+            [(r.reservation_number, r.id, r.date) for r in recovered.reservations.reservations],
+            expected,
+        )
+
+    def test_failed_operations_are_not_journaled(self):
+        state = PersistentState(self.path)
+        with self.assertRaises(ValueError):
+            state.users.addUser("user@mail.com", "short")
+        state.close()
+        self.assertEqual(list(Journal.read(os.path.join(self.path, JOURNAL_FILE))), [])
+
+    def test_automatic_snapshot(self):
+        state = PersistentState(self.path, snapshot_every=3)
+        self.populate(state)
+        state.close()
+        self.assertTrue(os.path.exists(os.path.join(self.path, SNAPSHOT_FILE)))
+        self.assertRecovered(PersistentState(self.path))
+
+    def test_corrupted_snapshot(self):
+        with open(os.path.join(self.path, SNAPSHOT_FILE), "wb") as file:
+            file.write(b"garbage")
+        with self.assertRaisesRegex(ValueError, "Snapshot file is corrupted."):
+            PersistentState(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Moduł testów dla rejestru powiązań użytkowników z rezerwacjami.
+
+Ten moduł zawiera testy sprawdzające spójność powiązań przy rezerwacji
+i anulowaniu oraz usuwanie użytkowników z kaskadowym anulowaniem.
+"""
+
+import unittest
+from parameterized import parameterized
+from src.registry import UserReservationRegistry
+from src.reservation import ReservationManagement
+from src.users import UserManagement
+
+
+class TestUserReservationRegistry(unittest.TestCase):
+    """
+    Testy podstawowych operacji rejestru.
+    """
+
+    @parameterized.expand([("dict", False), ("compact", True)])
+    def test_link_and_unlink(self, name, compact):
+        self.registry = UserReservationRegistry(compact)
+        self.registry.link(1, 10)
+        self.registry.link(1, 11)
+        self.assertEqual(self.registry.reservations_of(1), [10, 11])
+        self.registry.unlink(1, 10)
+        self.assertEqual(self.registry.reservations_of(1), [11])
+        self.registry.unlink(1, 11)
+        self.assertFalse(self.registry.has_reservations(1))
+        self.registry.unlink(1, 11)
+
+    @parameterized.expand([("dict", False), ("compact", True)])
+    def test_unlink_user(self, name, compact):
+        self.registry = UserReservationRegistry(compact)
+        self.registry.link(2, 5)
+        self.assertEqual(self.registry.unlink_user(2), [5])
+        self.assertEqual(self.registry.unlink_user(2), [])
+
+
+class TestSharedRegistry(unittest.TestCase):
+    """
+    Testy współdzielenia rejestru przez systemy rezerwacji i użytkowników.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.registry = UserReservationRegistry()
+        self.reservations = ReservationManagement(registry=self.registry)
+        self.users = UserManagement(registry=self.registry)
+        self.user_id = self.users.addUser("user@mail.com", "password123")
+
+    def test_booking_links_reservations(self):
+        self.reservations.booking(self.user_id, "user1", "2026-03-01", 1)
+        self.reservations.booking(self.user_id, "user1", "2026-03-02", 1)
+        self.assertEqual(self.registry.reservations_of(self.user_id), [1, 2])
+        self.reservations.cancelBooking(self.user_id)
+        self.assertFalse(self.registry.has_reservations(self.user_id))
+
+    def test_user_reservations_follow_registry(self):
+        user = self.users.getUser(self.user_id)
+        self.reservations.booking(self.user_id, "user1", "2026-03-01", 1)
+        self.reservations.booking(self.user_id, "user1", "2026-03-02", 1)
+        self.assertEqual(user.reservations, [1, 2])
+        self.assertEqual(self.users.getUser(self.user_id).reservations, [1, 2])
+        self.reservations.cancelBooking(self.user_id)
+        self.assertEqual(len(user.reservations), 0)
+
+    def test_delete_user_with_reservations(self):
+        self.reservations.booking(self.user_id, "user1", "2026-03-01", 1)
+        with self.assertRaisesRegex(ValueError, "User have existing reservations."):
+            self.users.deleteUser(self.user_id)
+        self.assertIsNotNone(self.users.getUser(self.user_id))
+
+    def test_delete_user_after_cancellation(self):
+        self.reservations.booking(self.user_id, "user1", "2026-03-01", 1)
+        self.reservations.cancelBooking(self.user_id)
+        self.users.deleteUser(self.user_id)
+        self.assertIsNone(self.users.getUser(self.user_id))
+
+    def test_cascade_delete(self):
+        registry = UserReservationRegistry()
+        reservations = ReservationManagement(total_beds=5, registry=registry)
+        users = UserManagement(registry=registry)
+        user_id = users.addUser("user@mail.com", "password123")
+        other_id = users.addUser("other@mail.com", "password123")
+        reservations.booking(user_id, "user1", "2026-03-01", 1)
+        reservations.booking(user_id, "user1", "2026-03-05", 5, nights=2)
+        reservations.booking(other_id, "user2", "2026-03-01", 1)
+        users.deleteUser(user_id, cascade=True)
+        self.assertIsNone(users.getUser(user_id))
+        self.assertEqual([r.id for r in reservations.reservations], [other_id])
+        self.assertEqual(reservations.freeBeds("2026-03-05", "2026-03-07"), 5)
+
+    def test_second_manager_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Registry is already attached to another reservation manager."):
+            ReservationManagement(registry=self.registry)
+
+
+if __name__ == '__main__':
+    unittest.main()
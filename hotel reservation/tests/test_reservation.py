@@ -7,6 +7,7 @@ systemu rezerwacji, w tym tworzenie, anulowanie i zarządzanie rezerwacjami.
 
 import unittest
 from src.reservation import ReservationManagement
+from src.validation import parse_date
 from parameterized import parameterized
 
 
@@ -208,6 +209,225 @@ class TestUserReservationQueries(unittest.TestCase):
             self.manager.userReservation(None)
 
 
+class TestReservationIndexes(unittest.TestCase):
+    """
+    Testy indeksów pomocniczych systemu rezerwacji.
+
+    Sprawdza spójność indeksów według użytkownika, daty oraz zbioru
+    zajętych kluczy po rezerwacjach i anulowaniach.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement()
+
+    def test_indexes_after_booking(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        self.manager.booking(2, "user2", "2026-03-01", 2)
+        self.assertEqual(len(self.manager.registry.links[1]), 1)
+        self.assertEqual(len(self.manager.by_date[parse_date("2026-03-01")]), 2)
+        self.assertIn((2, "user2", parse_date("2026-03-01")), self.manager.booked_keys)
+
+    def test_indexes_after_cancellation(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        self.manager.booking(1, "user1", "2026-03-02", 1)
+        self.manager.booking(2, "user2", "2026-03-01", 2)
+        self.assertTrue(self.manager.cancelBooking(1))
+        self.assertNotIn(1, self.manager.registry.links)
+        self.assertNotIn(parse_date("2026-03-02"), self.manager.by_date)
+        self.assertEqual(self.manager.booked_keys, {(2, "user2", parse_date("2026-03-01"))})
+        self.assertEqual(len(self.manager.userReservation(2)), 1)
+
+    def test_rebooking_after_cancellation(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        self.manager.cancelBooking(1)
+        self.manager.booking(1, "user1", "2026-03-01", 3)
+        self.assertEqual(self.manager.userReservation(1)[0].beds, 3)
+
+    def test_same_user_id_different_name(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        self.manager.booking(1, "other", "2026-03-01", 1)
+        self.assertEqual(len(self.manager.userReservation(1)), 2)
+
+
+class TestReservationCapacity(unittest.TestCase):
+    """
+    Testy rezerwacji z ograniczoną pojemnością hotelu.
+
+    Sprawdza odrzucanie przepełnionych rezerwacji, pobyty wielodniowe
+    oraz zwalnianie łóżek po anulowaniu.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement(total_beds=4)
+
+    def test_overbooking_rejected(self):
+        self.manager.booking(1, "user1", "2026-03-01", 3)
+        with self.assertRaisesRegex(ValueError, "Not enough free beds on this date."):
+            self.manager.booking(2, "user2", "2026-03-01", 2)
+        self.assertEqual(len(self.manager.reservations), 1)
+
+    def test_multi_night_stay(self):
+        self.manager.booking(1, "user1", "2026-03-01", 2, nights=3)
+        self.assertEqual(self.manager.reservations[0].check_out(), "2026-03-04")
+        self.assertEqual(self.manager.freeBeds("2026-03-01", "2026-03-04"), 2)
+        self.assertEqual(self.manager.freeBeds("2026-03-04", "2026-03-05"), 4)
+
+    def test_cancel_releases_beds(self):
+        self.manager.booking(1, "user1", "2026-03-01", 4, nights=2)
+        self.manager.cancelBooking(1)
+        self.assertEqual(self.manager.freeBeds("2026-03-01", "2026-03-03"), 4)
+
+    def test_invalid_nights(self):
+        with self.assertRaisesRegex(ValueError, "Number of nights must be a valid integer."):
+            self.manager.booking(1, "user1", "2026-03-01", 1, nights=0)
+
+    def test_free_beds_without_capacity(self):
+        with self.assertRaisesRegex(ValueError, "Hotel capacity is not configured."):
+            ReservationManagement().freeBeds("2026-03-01", "2026-03-02")
+
+
+class TestAvailability(unittest.TestCase):
+    """
+    Testy wyszukiwania dat przyjazdu z wolnymi łóżkami.
+
+    Sprawdza wyniki dla pobytów jedno- i wielodniowych oraz ich
+    aktualizację po rezerwacjach i anulowaniach.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement(total_beds=4)
+        self.manager.booking(1, "user1", "2026-03-02", 3, nights=2)
+
+    def test_single_night(self):
+        self.assertEqual(
+            self.manager.availableDates("2026-03-01", 5, 2),
+            ["2026-03-01", "2026-03-04", "2026-03-05"],
+        )
+        self.assertEqual(len(self.manager.availableDates("2026-03-01", 5, 1)), 5)
+
+    def test_multi_night_stay(self):
+        self.assertEqual(self.manager.availableDates("2026-02-27", 5, 2, nights=2),
+                         ["2026-02-27", "2026-02-28"])
+
+    def test_follows_bookings_and_cancellations(self):
+        self.manager.booking(2, "user2", "2026-03-05", 4)
+        self.assertNotIn("2026-03-05", self.manager.availableDates("2026-03-01", 5, 1))
+        self.manager.cancelBooking(1)
+        self.assertEqual(self.manager.availableDates("2026-03-01", 5, 4),
+                         ["2026-03-01", "2026-03-02", "2026-03-03", "2026-03-04"])
+
+    @parameterized.expand([
+        ("bad_date", "2026-02-30", 5, 1, 1, "Date must be a valid string in 'YYYY-MM-DD' format."),
+        ("zero_days", "2026-03-01", 0, 1, 1, "Number of days must be a valid integer."),
+        ("zero_beds", "2026-03-01", 5, 0, 1, "Number of beds must be a valid integer."),
+        ("zero_nights", "2026-03-01", 5, 1, 0, "Number of nights must be a valid integer."),
+    ])
+    def test_invalid_arguments(self, name, start, days, beds, nights, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            self.manager.availableDates(start, days, beds, nights)
+
+    def test_without_capacity(self):
+        with self.assertRaisesRegex(ValueError, "Hotel capacity is not configured."):
+            ReservationManagement().availableDates("2026-03-01", 5, 1)
+
+
+class TestCancellationTombstones(unittest.TestCase):
+    """
+    Testy anulowania rezerwacji z użyciem pustych miejsc (tombstones).
+
+    Sprawdza unikalność numerów rezerwacji po anulowaniu oraz
+    kompaktowanie wewnętrznej listy rezerwacji.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement()
+
+    def test_reservation_numbers_not_reused(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        self.manager.booking(2, "user2", "2026-03-01", 1)
+        self.manager.cancelBooking(1)
+        self.manager.booking(3, "user3", "2026-03-01", 1)
+        numbers = [r.reservation_number for r in self.manager.reservations]
+        self.assertEqual(numbers, [2, 3])
+
+    def test_tombstones_until_compaction(self):
+        for user_id in range(1, 5):
+            self.manager.booking(user_id, f"user{user_id}", "2026-03-01", 1)
+        self.manager.cancelBooking(2)
+        self.assertEqual(self.manager.store._tombstones, 1)
+        self.assertIsNone(self.manager.store._records[1])
+        self.assertEqual([r.id for r in self.manager.reservations], [1, 3, 4])
+        self.assertEqual(self.manager.store._tombstones, 0)
+
+    def test_compaction_keeps_slots_consistent(self):
+        for user_id in range(1, 7):
+            self.manager.booking(user_id, f"user{user_id}", "2026-03-01", 1)
+        for user_id in (1, 3, 5):
+            self.manager.cancelBooking(user_id)
+        self.assertEqual(self.manager.store._tombstones, 0)
+        self.assertTrue(self.manager.cancelBooking(6))
+        self.assertEqual([r.id for r in self.manager.reservations], [2, 4])
+
+
+class TestBulkBooking(unittest.TestCase):
+    """
+    Testy masowego dodawania rezerwacji.
+
+    Sprawdza, że błędne wiersze nie przerywają partii oraz że konflikty
+    są wykrywane wewnątrz partii i z istniejącymi rezerwacjami.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement()
+
+    def test_book_many_success(self):
+        results = self.manager.bookMany([
+            (1, "user1", "2026-03-01", 1),
+            (2, "user2", "2026-03-01", 2),
+            (1, "user1", "2026-03-02", 1, 3),
+        ])
+        self.assertEqual([r.reservation_number for r in results], [1, 2, 3])
+        self.assertEqual(results[2].nights, 3)
+        self.assertEqual(len(self.manager.userReservation(1)), 2)
+
+    def test_book_many_reports_errors_per_row(self):
+        results = self.manager.bookMany([
+            (1, "user1", "2026-03-01", 1),
+            (1, "user@1", "2026-03-01", 1),
+            (2, "user2", "2026-03-01", 0),
+            (3, "user3", "2026-03-01", 1),
+        ])
+        self.assertEqual(str(results[1]), "User name must contain only letters and numbers.")
+        self.assertEqual(str(results[2]), "Number of beds must be a valid integer.")
+        self.assertIsInstance(results[3].reservation_number, int)
+        self.assertEqual(len(self.manager.reservations), 2)
+
+    def test_book_many_detects_conflicts(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        results = self.manager.bookMany([
+            (1, "user1", "2026-03-01", 1),
+            (2, "user2", "2026-03-02", 1),
+            (2, "user2", "2026-03-02", 2),
+        ])
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1].beds, 1)
+        self.assertEqual(str(results[2]), "User already booked room(s) on this date.")
+
+    @parameterized.expand([
+        ("too_short", (1, "user1", "2026-03-01")),
+        ("too_long", (1, "user1", "2026-03-01", 1, 1, 1)),
+        ("not_a_row", "1,user1,2026-03-01,1"),
+    ])
+    def test_book_many_malformed_rows(self, name, row):
+        results = self.manager.bookMany([row])
+        self.assertEqual(str(results[0]), "Booking row must contain id, user, date and beds.")
+
+
 class TestParameterizedReservation(unittest.TestCase):
     """
     Klasa zawierająca parametryzowane testy dla systemu rezerwacji.
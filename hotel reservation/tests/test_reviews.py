@@ -284,5 +284,114 @@ class TestParameterizedReviews(unittest.TestCase):
         self.assertEqual(review.comment, new_comment)
 
 
+class TestReviewStats(unittest.TestCase):
+    """
+    Testy zagregowanych statystyk ocen.
+
+    Sprawdza aktualizację liczników przy dodawaniu, nadpisywaniu,
+    edycji i usuwaniu recenzji.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = Reviews()
+
+    def test_empty_stats(self):
+        stats = self.manager.stats()
+        self.assertEqual(stats["count"], 0)
+        self.assertIsNone(stats["average"])
+        self.assertEqual(stats["histogram"], {1: 0, 2: 0, 3: 0, 4: 0, 5: 0})
+
+    def test_stats_after_changes(self):
+        self.manager.add_review(1, 5, "great")
+        self.manager.add_review(2, 3, "ok")
+        self.manager.add_review(3, 1, "bad")
+        self.manager.add_review(3, 4, "better")
+        self.manager.edit_review(2, 2, "meh")
+        self.manager.delete_review(1)
+        stats = self.manager.stats()
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["average"], 3.0)
+        self.assertEqual(stats["variance"], 1.0)
+        self.assertEqual(stats["histogram"], {1: 0, 2: 1, 3: 0, 4: 1, 5: 0})
+
+    def test_stats_match_full_scan(self):
+        for review_id in range(1, 51):
+            self.manager.add_review(review_id, review_id % 5 + 1, "comment")
+        for review_id in range(1, 51, 3):
+            self.manager.delete_review(review_id)
+        stars = [review.stars for review in self.manager.reviews_list.values()]
+        stats = self.manager.stats()
+        self.assertAlmostEqual(stats["average"], sum(stars) / len(stars))
+        self.assertEqual(sum(stats["histogram"].values()), len(stars))
+
+    def test_failed_edit_keeps_stats(self):
+        self.manager.add_review(1, 5, "great")
+        with self.assertRaises(ValueError):
+            self.manager.edit_review(1, 6, "great")
+        self.assertEqual(self.manager.stats()["average"], 5.0)
+
+
+class TestReviewPagination(unittest.TestCase):
+    """
+    Testy stronicowanego listowania recenzji.
+
+    Sprawdza kolejność według ocen i daty dodania, kursory kolejnych
+    stron oraz aktualizację indeksów przy zmianach recenzji.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = Reviews()
+        for review_id, stars in [(4, 2), (1, 5), (3, 5), (2, 1), (5, 4)]:
+            self.manager.add_review(review_id, stars, f"comment{review_id}")
+
+    def collect(self, order, limit):
+        ids, cursor, pages = [], None, 0
+        while True:
+            page, cursor = self.manager.iter_reviews(order, after=cursor, limit=limit)
+            ids.extend(review.id for review in page)
+            pages += 1
+            if cursor is None:
+                return ids, pages
+
+    @parameterized.expand([
+        ("stars", "stars", [1, 3, 5, 4, 2]),
+        ("newest", "newest", [5, 2, 3, 1, 4]),
+        ("oldest", "oldest", [4, 1, 3, 2, 5]),
+    ])
+    def test_pages_cover_all_reviews(self, name, order, expected):
+        ids, pages = self.collect(order, 2)
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_single_page_has_no_cursor(self):
+        page, cursor = self.manager.iter_reviews("stars", limit=5)
+        self.assertEqual(len(page), 5)
+        self.assertIsNone(cursor)
+
+    def test_index_follows_changes(self):
+        self.manager.edit_review(2, 5, "better")
+        self.manager.add_review(4, 3, "again")
+        self.manager.delete_review(3)
+        self.assertEqual(self.collect("stars", 2)[0], [1, 2, 5, 4])
+        self.assertEqual(self.collect("newest", 3)[0], [4, 5, 2, 1])
+
+    def test_cursor_survives_deletion(self):
+        page, cursor = self.manager.iter_reviews("stars", limit=2)
+        self.manager.delete_review(3)
+        page, cursor = self.manager.iter_reviews("stars", after=cursor, limit=2)
+        self.assertEqual([review.id for review in page], [5, 4])
+
+    @parameterized.expand([
+        ("bad_order", "rating", 10, "Order must be 'stars', 'newest' or 'oldest'."),
+        ("zero_limit", "stars", 0, "Limit must be a valid integer."),
+        ("string_limit", "stars", "10", "Limit must be a valid integer."),
+    ])
+    def test_invalid_arguments(self, name, order, limit, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            self.manager.iter_reviews(order, limit=limit)
+
+
 if __name__ == '__main__':
     unittest.main()
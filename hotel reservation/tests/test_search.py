@@ -0,0 +1,93 @@
+"""
+Moduł testów dla wyszukiwania pełnotekstowego recenzji.
+
+Ten moduł zawiera testy indeksu odwróconego oraz wyszukiwania recenzji
+z zapytaniami AND/OR i ograniczeniem liczby wyników.
+"""
+
+import unittest
+from src.reviews import Reviews
+from src.search import ReviewIndex, tokenize
+from parameterized import parameterized
+
+
+class TestReviewIndex(unittest.TestCase):
+    """
+    Testy indeksu odwróconego.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.index = ReviewIndex()
+        self.index.add(1, "Great breakfast, noisy room")
+        self.index.add(2, "Quiet room and great staff")
+        self.index.add(3, "Breakfast was cold")
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Noisy, NOISY room!"), {"noisy", "room"})
+
+    @parameterized.expand([
+        ("and_single", "breakfast", "and", {1, 3}),
+        ("and_many", "great room", "and", {1, 2}),
+        ("and_none", "breakfast quiet", "and", set()),
+        ("or_many", "quiet cold", "or", {2, 3}),
+        ("unknown_word", "pool", "or", set()),
+        ("empty_query", "  ", "and", set()),
+    ])
+    def test_search(self, name, query, mode, expected):
+        self.assertEqual(self.index.search(query, mode), expected)
+
+    def test_remove(self):
+        self.index.remove(3, "Breakfast was cold")
+        self.assertEqual(self.index.search("breakfast"), {1})
+        self.assertNotIn("cold", self.index.postings)
+
+    def test_invalid_mode(self):
+        with self.assertRaisesRegex(ValueError, "Search mode must be 'and' or 'or'."):
+            self.index.search("room", "xor")
+
+
+class TestReviewsSearch(unittest.TestCase):
+    """
+    Testy wyszukiwania recenzji w systemie recenzji.
+
+    Sprawdza aktualizację indeksu przy dodawaniu, nadpisywaniu, edycji
+    i usuwaniu recenzji oraz sortowanie wyników według ocen.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = Reviews()
+        self.manager.add_review(1, 3, "Noisy room, good breakfast")
+        self.manager.add_review(2, 5, "Great breakfast")
+        self.manager.add_review(3, 5, "Breakfast included")
+        self.manager.add_review(4, 1, "Noisy street")
+
+    def test_results_sorted_by_stars(self):
+        results = self.manager.search("breakfast")
+        self.assertEqual([review.id for review in results], [2, 3, 1])
+
+    def test_top_k(self):
+        results = self.manager.search("noisy breakfast", mode="or", top_k=2)
+        self.assertEqual([review.id for review in results], [2, 3])
+
+    def test_index_follows_changes(self):
+        self.manager.edit_review(2, 4, "Lovely pool")
+        self.manager.add_review(3, 2, "Noisy pool")
+        self.manager.delete_review(4)
+        self.assertEqual([r.id for r in self.manager.search("breakfast")], [1])
+        self.assertEqual([r.id for r in self.manager.search("pool")], [2, 3])
+        self.assertEqual([r.id for r in self.manager.search("noisy")], [1, 3])
+
+    @parameterized.expand([
+        ("query_none", None, None, "Query must be a string."),
+        ("top_k_zero", "room", 0, "Top k must be a valid integer."),
+        ("top_k_string", "room", "1", "Top k must be a valid integer."),
+    ])
+    def test_invalid_arguments(self, name, query, top_k, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            self.manager.search(query, top_k=top_k)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Moduł testów dla systemu rezerwacji podzielonego między procesy.
+
+Ten moduł zawiera testy kierowania żądań do shardów, scalania wyników
+zapytań dotyczących wielu użytkowników oraz przekazywania błędów.
+"""
+
+import unittest
+from src.sharding import ShardedReservationManagement, shard_of
+from parameterized import parameterized
+
+
+class TestShardOf(unittest.TestCase):
+    """
+    Testy przypisywania użytkowników do shardów.
+    """
+
+    @parameterized.expand([
+        ("first", 1, 4, 1),
+        ("wraps", 6, 4, 2),
+        ("invalid_id", None, 4, 0),
+    ])
+    def test_shard_of(self, name, user_id, shards, expected):
+        self.assertEqual(shard_of(user_id, shards), expected)
+
+
+class TestShardedReservationManagement(unittest.TestCase):
+    """
+    Testy routera rezerwacji z procesami roboczymi.
+
+    Procesy są uruchamiane raz dla całej klasy testów, a każdy test
+    używa własnych identyfikatorów użytkowników.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Uruchamia procesy robocze przed testami."""
+        cls.manager = ShardedReservationManagement(shards=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Zatrzymuje procesy robocze po testach."""
+        cls.manager.close()
+
+    def test_booking_and_lookup(self):
+        self.manager.booking(1, "user1", "2026-03-01", 2)
+        self.manager.booking(1, "user1", "2026-03-02", 1, nights=2)
+        reservations = self.manager.userReservation(1)
+        self.assertEqual([r.date for r in reservations], ["2026-03-01", "2026-03-02"])
+        self.assertEqual(reservations[1].check_out(), "2026-03-04")
+
+    def test_errors_are_forwarded(self):
+        self.manager.booking(2, "user2", "2026-03-01", 1)
+        with self.assertRaisesRegex(ValueError, "User already booked room\\(s\\) on this date."):
+            self.manager.booking(2, "user2", "2026-03-01", 1)
+        with self.assertRaisesRegex(ValueError, "User ID must be a valid integer."):
+            self.manager.booking(None, "user2", "2026-03-01", 1)
+
+    def test_book_many_keeps_row_order(self):
+        rows = [(10 + n, f"user{10 + n}", "2026-04-01", 1) for n in range(6)]
+        rows.insert(3, (10, "user10", "2026-04-01", 1))
+        results = self.manager.bookMany(rows)
+        self.assertEqual([getattr(r, "id", None) for r in results], [10, 11, 12, None, 13, 14, 15])
+        self.assertIsInstance(results[3], ValueError)
+
+    def test_reservation_numbers_are_global(self):
+        self.manager.bookMany([(20, "user20", "2026-05-01", 1), (21, "user21", "2026-05-01", 1)])
+        numbers = [r.reservation_number for r in self.manager.reservations]
+        self.assertEqual(len(numbers), len(set(numbers)))
+        self.assertEqual(numbers, sorted(numbers))
+
+    def test_multi_user_query_and_cancel(self):
+        self.manager.bookMany([(30, "user30", "2026-06-01", 1), (31, "user31", "2026-06-01", 2)])
+        self.assertTrue(self.manager.cancelBooking(30))
+        self.assertFalse(self.manager.cancelBooking(30))
+        found = self.manager.userReservations([30, 31, 32])
+        self.assertEqual(found[30], [])
+        self.assertEqual([r.beds for r in found[31]], [2])
+        self.assertEqual(found[32], [])
+
+    def test_invalid_shards(self):
+        with self.assertRaisesRegex(ValueError, "Number of shards must be a valid integer."):
+            ShardedReservationManagement(shards=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
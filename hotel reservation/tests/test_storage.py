@@ -0,0 +1,175 @@
+"""
+Moduł testów dla magazynów rezerwacji.
+
+Ten moduł zawiera testy jednostkowe sprawdzające magazyn obiektowy
+i kolumnowy, w tym odczyt widoków, usuwanie i kompaktowanie.
+"""
+
+import unittest
+from src.reservation import Reservation, ReservationManagement
+from src.storage import ColumnarStore, ObjectStore, ReservationView
+from src.validation import parse_date
+from parameterized import parameterized
+
+
+class TestStores(unittest.TestCase):
+    """
+    Testy wspólnego zachowania magazynów obiektowego i kolumnowego.
+
+    Sprawdza zapis, odczyt, usuwanie oraz kompaktowanie rezerwacji.
+    """
+
+    @parameterized.expand([
+        ("objects", lambda: ObjectStore(Reservation)),
+        ("columnar", ColumnarStore),
+    ])
+    def test_add_get_remove(self, name, factory):
+        store = factory()
+        store.add(1, 1, 2, "user1", "2026-03-01", 3)
+        store.add(2, 2, 1, "user2", "2026-03-02", 1)
+        record = store.get(1)
+        self.assertEqual(
+            (record.id, record.beds, record.user, record.date, record.nights),
+            (1, 2, "user1", "2026-03-01", 3),
+        )
+        self.assertEqual(record.check_out(), "2026-03-04")
+        store.remove(1)
+        self.assertIsNone(store.get(1))
+        self.assertEqual(len(store), 1)
+        self.assertEqual([r.reservation_number for r in store.records()], [2])
+
+    @parameterized.expand([
+        ("objects", lambda: ObjectStore(Reservation)),
+        ("columnar", ColumnarStore),
+    ])
+    def test_compaction_keeps_lookups(self, name, factory):
+        store = factory()
+        for number in range(1, 9):
+            store.add(number, number, 1, f"user{number}", "2026-03-01", 1)
+        for number in (1, 2, 3, 4):
+            store.remove(number)
+        self.assertEqual(store._tombstones, 0)
+        self.assertEqual(store.get(7).user, "user7")
+        self.assertEqual(len(store.records()), 4)
+
+
+class TestColumnarStore(unittest.TestCase):
+    """
+    Testy specyficzne dla magazynu kolumnowego.
+
+    Sprawdza współdzielenie nazw użytkowników, widoki wierszy
+    oraz odrzucanie nieistniejących dat.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.store = ColumnarStore()
+
+    def test_user_names_are_interned(self):
+        self.store.add(1, 1, 1, "user1", "2026-03-01", 1)
+        self.store.add(1, 2, 1, "user1", "2026-03-02", 1)
+        self.assertEqual(self.store.names, ["user1"])
+        self.assertEqual(list(self.store.user_codes), [0, 0])
+
+    def test_view_survives_compaction(self):
+        for number in range(1, 5):
+            self.store.add(number, number, number, "user", "2026-03-01", 1)
+        view = self.store.get(4)
+        self.store.remove(1)
+        self.store.remove(2)
+        self.assertIsInstance(view, ReservationView)
+        self.assertEqual(view.beds, 4)
+
+    def test_view_of_removed_row(self):
+        view = self.store.add(1, 1, 1, "user1", "2026-03-01", 1)
+        self.store.add(2, 2, 1, "user2", "2026-03-01", 1)
+        self.store.add(3, 3, 1, "user3", "2026-03-01", 1)
+        self.store.remove(1)
+        with self.assertRaisesRegex(ValueError, "Reservation no longer exists."):
+            view.date
+        self.assertEqual(view.reservation_number, 1)
+
+    def test_booked(self):
+        self.store.add(1, 1, 1, "user1", "2026-03-01", 1)
+        self.store.add(1, 2, 1, "user1", "2026-03-03", 1)
+        self.assertTrue(self.store.booked([1, 2], "user1", parse_date("2026-03-03")))
+        self.assertFalse(self.store.booked([1, 2], "user1", parse_date("2026-03-02")))
+        self.assertFalse(self.store.booked([1, 2], "user2", parse_date("2026-03-01")))
+        self.assertFalse(self.store.booked([1], "user1", parse_date("2026-03-03")))
+
+    def test_ending_by(self):
+        self.store.add(1, 1, 1, "user1", "2026-03-01", 3)
+        self.store.add(2, 2, 1, "user2", "2026-03-02", 1)
+        self.store.add(3, 3, 1, "user3", "2026-03-05", 1)
+        ending = self.store.ending_by(parse_date("2026-03-04"))
+        self.assertEqual([view.reservation_number for view in ending], [1, 2])
+
+    def test_invalid_calendar_date(self):
+        with self.assertRaisesRegex(ValueError, "Date must be a valid string in 'YYYY-MM-DD' format."):
+            self.store.add(1, 1, 1, "user1", "2026-02-30", 1)
+        self.assertEqual(len(self.store), 0)
+
+
+class TestColumnarManagement(unittest.TestCase):
+    """
+    Testy systemu rezerwacji korzystającego z magazynu kolumnowego.
+
+    Sprawdza, że istniejące API działa bez zmian.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.manager = ReservationManagement(total_beds=10, columnar=True)
+
+    def test_booking_and_queries(self):
+        self.manager.booking(1, "user1", "2026-03-01", 2)
+        self.manager.booking(1, "user1", "2026-03-02", 3, nights=2)
+        reservations = self.manager.userReservation(1)
+        self.assertEqual([r.beds for r in reservations], [2, 3])
+        self.assertEqual(self.manager.reservations[1].date, "2026-03-02")
+
+        self.assertEqual(self.manager.freeBeds("2026-03-02", "2026-03-04"), 7)
+
+    def test_cancel_booking(self):
+        self.manager.booking(1, "user1", "2026-03-01", 2)
+        self.manager.booking(2, "user2", "2026-03-01", 2)
+        self.assertTrue(self.manager.cancelBooking(1))
+        self.assertEqual([r.id for r in self.manager.reservations], [2])
+        self.assertEqual(self.manager.freeBeds("2026-03-01", "2026-03-02"), 8)
+
+    def test_indexes_are_arrays(self):
+        self.manager.booking(1, "user1", "2026-03-01", 1)
+        self.manager.booking(1, "user1", "2026-03-02", 1)
+        self.manager.booking(1, "other", "2026-03-02", 1)
+        self.assertEqual(self.manager.by_date, {})
+        self.assertEqual(list(self.manager.registry.links[1]), [1, 2, 3])
+        self.assertEqual(self.manager.booked_keys, {
+            (1, "user1", parse_date("2026-03-01")), (1, "user1", parse_date("2026-03-02")),
+            (1, "other", parse_date("2026-03-02")),
+        })
+        with self.assertRaisesRegex(ValueError, "User already booked room\\(s\\) on this date."):
+            self.manager.booking(1, "user1", "2026-03-02", 1)
+        self.assertTrue(self.manager.cancelBooking(1))
+        self.manager.booking(1, "user1", "2026-03-02", 1)
+
+    def test_value_out_of_column_range(self):
+        manager = ReservationManagement(total_beds=2 ** 64, columnar=True)
+        with self.assertRaisesRegex(ValueError, "Number of beds must be a valid integer."):
+            manager.booking(1, "a", "2026-01-02", 2 ** 63)
+        with self.assertRaisesRegex(ValueError, "User ID must be a valid integer."):
+            manager.booking(2 ** 63, "a", "2026-01-02", 1)
+        self.assertEqual(len(manager.reservations), 0)
+        self.assertEqual(manager.freeBeds("2026-01-02", "2026-01-03"), 2 ** 64)
+        manager.booking(1, "a", "2026-01-02", 2)
+        self.assertEqual([r.beds for r in manager.reservations], [2])
+
+    def test_invalid_date_does_not_leak_capacity(self):
+        manager = ReservationManagement(columnar=True)
+        with self.assertRaisesRegex(ValueError, "Date must be a valid string in 'YYYY-MM-DD' format."):
+            manager.booking(1, "user1", "2026-02-30", 1)
+        self.assertEqual(manager.reservations, [])
+        self.assertEqual(manager.booked_keys, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -229,6 +229,45 @@ class TestReservationIntegration(unittest.TestCase):
         self.assertIsNone(self.manager.getUser(user_id))
 
 
+class TestEmailIndex(unittest.TestCase):
+    """
+    Klasa testująca indeks adresów email.
+
+    Sprawdza spójność indeksu po dodaniu, aktualizacji i usunięciu użytkownika
+    oraz wyszukiwanie użytkownika po adresie email.
+    """
+
+    def setUp(self):
+        self.manager = UserManagement()
+
+    def test_getUserByEmail(self):
+        user_id = self.manager.addUser("User@Mail.com", "password123")
+        self.assertEqual(self.manager.getUserByEmail("user@mail.com").id, user_id)
+        self.assertEqual(self.manager.getUserByEmail(" USER@MAIL.COM ").id, user_id)
+        self.assertIsNone(self.manager.getUserByEmail("other@mail.com"))
+        self.assertIsNone(self.manager.getUserByEmail(None))
+
+    def test_addUser_duplicate_differs_in_case(self):
+        self.manager.addUser("user@mail.com", "password123")
+        with self.assertRaisesRegex(ValueError, "User already exists."):
+            self.manager.addUser("USER@mail.com", "password123")
+
+    def test_index_follows_update(self):
+        user_id = self.manager.addUser("old@mail.com", "password123")
+        self.manager.updateUser(user_id, "new@mail.com", "password123")
+        self.assertIsNone(self.manager.getUserByEmail("old@mail.com"))
+        self.assertEqual(self.manager.getUserByEmail("new@mail.com").id, user_id)
+        other_id = self.manager.addUser("old@mail.com", "password123")
+        with self.assertRaisesRegex(ValueError, "Email already exists."):
+            self.manager.updateUser(other_id, "NEW@mail.com", "password123")
+
+    def test_index_follows_delete(self):
+        user_id = self.manager.addUser("user@mail.com", "password123")
+        self.manager.deleteUser(user_id)
+        self.assertEqual(self.manager.email_index, {})
+        self.assertIsNone(self.manager.getUserByEmail("user@mail.com"))
+
+
 class TestParameterized(unittest.TestCase):
     """
     Klasa zawierająca parametryzowane testy dla systemu zarządzania użytkownikami.
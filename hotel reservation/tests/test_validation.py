@@ -0,0 +1,84 @@
+"""
+Moduł testów dla walidacji danych rezerwacji.
+
+Ten moduł zawiera testy zamiany dat na numery dni, pamięci podręcznej
+przetworzonych dat oraz walidacji danych rezerwacji.
+"""
+
+import unittest
+from datetime import date as Date
+from src.reservation import ReservationManagement
+from src.validation import MAX_NIGHTS, _parse_date, format_date, parse_date, validate_booking
+from parameterized import parameterized
+
+
+class TestDates(unittest.TestCase):
+    """
+    Testy zamiany dat na numery dni i z powrotem.
+    """
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        _parse_date.cache_clear()
+
+    def test_round_trip(self):
+        ordinal = parse_date("2024-02-29")
+        self.assertEqual(ordinal, Date(2024, 2, 29).toordinal())
+        self.assertEqual(format_date(ordinal), "2024-02-29")
+
+    def test_parsed_dates_are_cached(self):
+        parse_date("2026-03-01")
+        parse_date("2026-03-01")
+        self.assertEqual(_parse_date.cache_info().hits, 1)
+
+    @parameterized.expand([
+        ("none", None),
+        ("empty", ""),
+        ("day_first", "01-03-2026"),
+        ("trailing_text", "2026-03-01x"),
+        ("trailing_newline", "2026-03-01\n"),
+        ("no_such_day", "2026-02-30"),
+        ("no_such_month", "2026-13-01"),
+        ("not_leap_year", "2025-02-29"),
+    ])
+    def test_invalid_dates(self, name, date):
+        with self.assertRaisesRegex(ValueError, "Date must be a valid string in 'YYYY-MM-DD' format."):
+            parse_date(date)
+
+
+class TestValidateBooking(unittest.TestCase):
+    """
+    Testy walidacji danych rezerwacji.
+    """
+
+    def test_returns_ordinal(self):
+        self.assertEqual(validate_booking(1, "user1", "2026-03-01", 1, 2), parse_date("2026-03-01"))
+
+    @parameterized.expand([
+        ("user_with_space", 1, "user 1", "2026-03-01", 1, 1,
+         "User name must contain only letters and numbers."),
+        ("user_with_newline", 1, "user1\n", "2026-03-01", 1, 1,
+         "User name must contain only letters and numbers."),
+        ("nights_zero", 1, "user1", "2026-03-01", 1, 0, "Number of nights must be a valid integer."),
+        ("nights_too_many", 1, "user1", "2026-03-01", 1, MAX_NIGHTS + 1,
+         "Number of nights must be a valid integer."),
+        ("check_out_out_of_range", 1, "user1", "9999-12-30", 1, 2,
+         "Check-out date must not be later than 9999-12-31."),
+    ])
+    def test_invalid_booking(self, name, user_id, user, date, beds, nights, expected_error):
+        with self.assertRaisesRegex(ValueError, expected_error):
+            validate_booking(user_id, user, date, beds, nights)
+
+    def test_longest_stay(self):
+        self.assertEqual(validate_booking(1, "user1", "2026-03-01", 1, MAX_NIGHTS), parse_date("2026-03-01"))
+        self.assertEqual(validate_booking(1, "user1", "9999-12-30", 1, 1), parse_date("9999-12-30"))
+
+    def test_manager_rejects_nonexistent_date(self):
+        manager = ReservationManagement()
+        with self.assertRaisesRegex(ValueError, "Date must be a valid string in 'YYYY-MM-DD' format."):
+            manager.booking(1, "user1", "2026-02-30", 1)
+        self.assertEqual(manager.reservations, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
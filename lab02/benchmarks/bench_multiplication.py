@@ -0,0 +1,74 @@
+"""
+Benchmark progów przełączania algorytmów mnożenia wielomianów.
+
+Dla kolejnych długości czynników mierzy mnożenie szkolne, algorytm
+Karatsuby i podstawienie Kroneckera na współczynnikach całkowitych,
+mnożenie szkolne i algorytm Karatsuby na ułamkach (Fraction) oraz, gdy
+NumPy jest zainstalowany, splot wprost i przez FFT. Wyniki pozwalają
+dobrać progi KARATSUBA_THRESHOLD, KRONECKER_THRESHOLD i FFT_THRESHOLD.
+Algorytmy kwadratowe są pomijane dla długości większych niż --max-quadratic.
+
+Uruchomienie (z katalogu lab02):
+    python -m benchmarks.bench_multiplication --lengths 16 32 64 256 1024 4096 50001
+"""
+
+import argparse
+import random
+import time
+from fractions import Fraction
+
+from src import multiplication, polynomial
+
+
+def measure(function, repeat: int):
+    """Zwraca najlepszy czas wykonania funkcji w sekundach."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def candidates(length: int, args):
+    """Zwraca mierzone algorytmy dla czynników podanej długości."""
+    generator = random.Random(args.seed)
+    a = [generator.randint(-args.bound, args.bound) for _ in range(length)]
+    b = [generator.randint(-args.bound, args.bound) for _ in range(length)]
+    fractions_a = [Fraction(c, 7) for c in a[:args.max_fraction]]
+    fractions_b = [Fraction(c, 3) for c in b[:args.max_fraction]]
+    quadratic = length <= args.max_quadratic
+    yield "int_schoolbook", quadratic, lambda: multiplication.schoolbook(a, b)
+    yield "int_karatsuba", True, lambda: multiplication.karatsuba(a, b)
+    yield "int_kronecker", True, lambda: multiplication.kronecker(a, b)
+    fraction_sizes = length <= args.max_fraction
+    yield "fraction_schoolbook", quadratic and fraction_sizes, \
+        lambda: multiplication.schoolbook(fractions_a, fractions_b)
+    yield "fraction_karatsuba", fraction_sizes, lambda: multiplication.karatsuba(fractions_a, fractions_b)
+    numpy = polynomial.numpy
+    if numpy is not None:
+        left, right = numpy.array(a, dtype=numpy.int64), numpy.array(b, dtype=numpy.int64)
+        yield "numpy_convolve", True, lambda: numpy.convolve(left, right)
+        yield "numpy_fft", True, lambda: polynomial._fft_convolve(left, right)
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[16, 32, 64, 128, 256, 1024, 4096])
+    parser.add_argument("--bound", type=int, default=1000)
+    parser.add_argument("--max-quadratic", type=int, default=4096)
+    parser.add_argument("--max-fraction", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for length in args.lengths:
+        for name, enabled, function in candidates(length, args):
+            if enabled:
+                seconds = measure(function, args.repeat)
+                print(f"length={length:<7} {name:<20} {seconds * 1e3:12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark działań na wielomianach dużych stopni.
+
+Porównuje reprezentację listową (czysty Python) z tablicami NumPy dla
+dodawania, mnożenia przez liczbę i mnożenia wielomianów. Reprezentacja
+listowa jest wymuszana przez ustawienie progu VECTOR_THRESHOLD na
+nieskończoność; bez zainstalowanego NumPy mierzona jest tylko ona.
+
+Uruchomienie (z katalogu lab02):
+    python -m benchmarks.bench_polynomial --degrees 1000 10000 100000
+"""
+
+import argparse
+import random
+import time
+
+from src import polynomial
+from src.polynomial import Polynomial
+
+
+def measure(function, repeat: int):
+    """Zwraca najlepszy czas wykonania funkcji w sekundach."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_backend(name: str, threshold, degree: int, args):
+    """Mierzy działania dla jednej reprezentacji i wypisuje wyniki."""
+    generator = random.Random(args.seed)
+    polynomial.VECTOR_THRESHOLD = threshold
+    first = Polynomial([generator.randint(-1000, 1000) for _ in range(degree + 1)])
+    second = Polynomial([generator.randint(-1000, 1000) for _ in range(degree + 1)])
+    operations = {
+        "add": lambda: first + second,
+        "scalar_mul": lambda: first * 3,
+        "mul": lambda: first * second,
+    }
+    for operation, function in operations.items():
+        seconds = measure(function, args.repeat)
+        print(f"{name:>6} degree={degree:<7} {operation:<11} {seconds * 1e3:10.3f} ms")
+
+
+def main():
+    """Parsuje argumenty wiersza poleceń i wypisuje wyniki."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--degrees", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    threshold = polynomial.VECTOR_THRESHOLD
+    for degree in args.degrees:
+        bench_backend("list", float("inf"), degree, args)
+        if polynomial.numpy is not None:
+            bench_backend("numpy", threshold, degree, args)
+    polynomial.VECTOR_THRESHOLD = threshold
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+from numbers import Rational
+
+# poniżej tej długości krótszego czynnika mnożenie szkolne jest najszybsze dla ułamków
+KARATSUBA_THRESHOLD = 32
+# od tej długości krótszego czynnika wielomiany całkowite są mnożone przez podstawienie
+# Kroneckera, które od tego miejsca wyprzedza także algorytm Karatsuby
+KRONECKER_THRESHOLD = 24
+
+
+def schoolbook(a, b):
+    """Mnoży metodą szkolną, O(n*m)."""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return result
+
+
+def karatsuba(a, b):
+    """Mnoży algorytmem Karatsuby, O(n^1.59).
+
+    Wynik jest dokładny dla współczynników wymiernych (int, Fraction); dla
+    liczb zmiennoprzecinkowych zaokrąglenia różnią się od mnożenia szkolnego.
+    """
+    return _karatsuba(a[::-1], b[::-1])[::-1]
+
+
+def _karatsuba(a, b):
+    """Mnoży listy uporządkowane od najniższej potęgi."""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) < KARATSUBA_THRESHOLD:
+        return schoolbook(a, b)
+    result = [0] * (len(a) + len(b) - 1)
+    if len(a) >= 2 * len(b):
+        # niezrównoważone czynniki: dłuższy jest mnożony blokami długości krótszego
+        for start in range(0, len(a), len(b)):
+            for i, c in enumerate(_karatsuba(a[start:start + len(b)], b), start):
+                result[i] += c
+        return result
+
+    middle = len(a) // 2
+    a0, a1 = a[:middle], a[middle:]
+    b0, b1 = b[:middle], b[middle:]
+    low = _karatsuba(a0, b0)
+    high = _karatsuba(a1, b1)
+    mixed = _karatsuba(_sum(a0, a1), _sum(b0, b1))
+    for i, c in enumerate(low):
+        result[i] += c
+        mixed[i] -= c
+    for i, c in enumerate(high):
+        result[i + 2 * middle] += c
+        mixed[i] -= c
+    for i, c in enumerate(mixed, middle):
+        result[i] += c
+    return result
+
+
+def _sum(a, b):
+    """Dodaje listy uporządkowane od najniższej potęgi."""
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b):]
+
+
+def kronecker(a, b):
+    """Mnoży wielomiany całkowite przez podstawienie Kroneckera.
+
+    Współczynniki są pakowane w dwie duże liczby całkowite (wartości
+    wielomianów w punkcie 2^k), które mnoży arytmetyka liczb całkowitych
+    Pythona, a współczynniki iloczynu są odczytywane z bajtów wyniku. Szerokość
+    k jest dobierana z ograniczenia modułu współczynników iloczynu, więc
+    wynik jest zawsze dokładny.
+    """
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    # bit znaku i bit zapasu, zaokrąglone do pełnych bajtów
+    width = (bound.bit_length() + 9) // 8
+    length = len(a) + len(b) - 1
+    product = _pack(a, width) * _pack(b, width)
+    # przesunięcie o 2^(8*width - 1) czyni każdą cyfrę nieujemną, więc nie ma pożyczek
+    half = 1 << (8 * width - 1)
+    offset = int.from_bytes((bytes(width - 1) + b"\x80") * length, "little")
+    data = (product + offset).to_bytes(width * length, "little")
+    return [
+        int.from_bytes(data[start:start + width], "little") - half
+        for start in range(width * (length - 1), -1, -width)
+    ]
+
+
+def _pack(coefficients, width: int):
+    """Zwraca wartość wielomianu w punkcie 2^(8*width)."""
+    reversed_coefficients = coefficients[::-1]
+    data = b"".join(c.to_bytes(width, "little", signed=True) for c in reversed_coefficients)
+    # bajty ujemnej cyfry c oznaczają c + 2^(8*width); nadmiar jest odejmowany jednym działaniem
+    borrow = bytearray(len(data) + width)
+    for position, c in enumerate(reversed_coefficients, 1):
+        if c < 0:
+            borrow[width * position] = 1
+    return int.from_bytes(data, "little") - int.from_bytes(borrow, "little")
+
+
+def multiply(a, b):
+    """Mnoży listy współczynników algorytmem dobranym do rozmiaru i typu.
+
+    Listy (niepuste) są uporządkowane od najwyższej potęgi, jak
+    Polynomial.coeff; wynik ma ten sam porządek. Mnożenie szkolne jest
+    używane dla krótkich czynników i współczynników niewymiernych (np. float,
+    dla których kolejność działań wpływa na wynik), podstawienie Kroneckera
+    dla długich wielomianów całkowitych, a algorytm Karatsuby dla pozostałych
+    współczynników wymiernych (np. Fraction).
+    """
+    shorter = min(len(a), len(b))
+    if shorter >= KRONECKER_THRESHOLD and all(isinstance(c, int) for c in a) \
+            and all(isinstance(c, int) for c in b):
+        return kronecker(a, b)
+    if shorter < KARATSUBA_THRESHOLD:
+        return schoolbook(a, b)
+    if all(isinstance(c, Rational) for c in a) and all(isinstance(c, Rational) for c in b):
+        return karatsuba(a, b)
+    return schoolbook(a, b)
@@ -1,31 +1,121 @@
+try:
+    import numpy
+except ImportError:  # NumPy jest opcjonalny - bez niego działa implementacja na listach
+    numpy = None
+
+from src.multiplication import multiply
+
+# od tej liczby współczynników opłaca się przechowywać je w tablicy NumPy
+VECTOR_THRESHOLD = 64
+# ograniczenie modułu współczynników int64, przy którym suma dwóch z nich się mieści
+INT64_SAFE = 1 << 62
+INT64_LIMIT = 1 << 63
+# od tej długości krótszego czynnika tablice całkowite są mnożone przez FFT zamiast
+# splotu wprost; tablice zmiennoprzecinkowe zawsze są splatane wprost, bo FFT
+# wprowadza błędy zaokrągleń, których mnożenie list nie ma
+FFT_THRESHOLD = 192
+# ograniczenie iloczynu największych modułów współczynników i długości dłuższego
+# czynnika, przy którym błąd FFT w float64 pozostaje dużo mniejszy niż 1/2
+FFT_EXACT_LIMIT = 1 << 36
+
+
+def _as_vector(coefficients):
+    """Zwraca tablicę NumPy z dokładnie tymi samymi współczynnikami albo None.
+
+    Tablica jest tworzona tylko wtedy, gdy wszystkie współczynniki są liczbami
+    całkowitymi mieszczącymi się w int64 albo wszystkie są liczbami
+    zmiennoprzecinkowymi. Duże liczby całkowite, ułamki (Fraction), listy
+    mieszane i inne typy zostają na liście Pythona, więc wyniki i ich zapis
+    tekstowy są takie same jak bez NumPy.
+    """
+    if numpy is None or len(coefficients) < VECTOR_THRESHOLD:
+        return None
+    if isinstance(coefficients, numpy.ndarray):
+        if coefficients.ndim != 1 or coefficients.dtype.kind not in "iuf":
+            return None
+        if coefficients.dtype.kind == "f":
+            return coefficients.astype(numpy.float64)
+        if not -INT64_SAFE < int(coefficients.min()) <= int(coefficients.max()) < INT64_SAFE:
+            return None
+        return coefficients.astype(numpy.int64)
+    kinds = set(map(type, coefficients))
+    if kinds == {int}:
+        if -INT64_SAFE < min(coefficients) and max(coefficients) < INT64_SAFE:
+            return numpy.array(coefficients, dtype=numpy.int64)
+    elif kinds == {float}:
+        return numpy.array(coefficients, dtype=numpy.float64)
+    return None
+
+
+def _bound(vector):
+    """Zwraca największy moduł współczynnika tablicy całkowitej."""
+    return max(-int(vector.min()), int(vector.max()))
+
+
 class Polynomial:
     def __init__(self, coefficients):
-        self.coeff = list(coefficients)
+        self.coeff = coefficients
+
+    @property
+    def coeff(self):
+        """Kopia listy współczynników od najwyższej potęgi.
+
+        Zmiana zwróconej listy nie zmienia wielomianu; nowe współczynniki
+        ustawia się przypisaniem do coeff.
+        """
+        return list(self._values())
+
+    @coeff.setter
+    def coeff(self, coefficients):
+        vector = _as_vector(coefficients)
+        if vector is not None:
+            nonzero = numpy.flatnonzero(vector)
+            if len(nonzero):
+                self._vector, self._coeff = vector[nonzero[0]:], None
+                return
+        self._vector = None
+        if numpy is not None and isinstance(coefficients, numpy.ndarray):
+            coefficients = coefficients.tolist()
+        self._coeff = list(coefficients)
         self._remove_leading_zeros()
-        if not self.coeff:
-            self.coeff = [0]
+        if not self._coeff:
+            self._coeff = [0]
+
+    def _values(self):
+        """Zwraca współczynniki jako listę bez kopiowania (tylko do odczytu)."""
+        if self._coeff is None:
+            self._coeff = self._vector.tolist()
+        return self._coeff
 
     def _remove_leading_zeros(self):
-        while len(self.coeff) > 1 and self.coeff[0] == 0:
-            self.coeff.pop(0)
+        leading = 0
+        while leading < len(self._coeff) - 1 and self._coeff[leading] == 0:
+            leading += 1
+        del self._coeff[:leading]
+
+    def _vectors(self, other):
+        """Zwraca tablice obu wielomianów, jeśli oba są przechowywane w NumPy."""
+        if self._vector is not None and isinstance(other, Polynomial) and other._vector is not None:
+            return self._vector, other._vector
+        return None
 
     def degree(self):
-        return len(self.coeff) -1
+        return len(self._vector if self._vector is not None else self._coeff) - 1
 
     def evaluate(self, x):
         wyn = 0
-        for coefficient in self.coeff:
+        for coefficient in self._values():
             wyn = wyn * x + coefficient
         return wyn
-        
+
 
     def __str__(self):
-        if all(coeff == 0 for coeff in self.coeff):
+        if all(coeff == 0 for coeff in self._values()):
             return "0"
-        
+
         tab = []
-        for i, coeff in enumerate(self.coeff):
-            silnia = len(self.coeff) - i - 1
+        for i, coeff in enumerate(self._values()):
+            silnia = len(self._values()) - i - 1
             if coeff == 0:
                 continue
             if silnia == 0:
@@ -45,28 +135,43 @@ class Polynomial:
                 else:
                     tab.append(f"{coeff}x^{silnia}")
         return " + ".join(tab).replace("+ -", "- ")
-            
+
 
     def __repr__(self):
-        return f"Polynomial({self.coeff})"
+        return f"Polynomial({self._values()})"
 
     def __eq__(self, other):
         if isinstance(other, Polynomial):
-            return self.coeff == other.coeff
+            vectors = self._vectors(other)
+            if vectors is not None:
+                return bool(numpy.array_equal(*vectors))
+            return self._values() == other._values()
         elif isinstance(other, (int, float)):
-            return self.degree() == 0 and self.coeff[0] == other
+            return self.degree() == 0 and self._values()[0] == other
         return False
 
     def __add__(self, other):
+        vectors = self._vectors(other)
+        if vectors is not None:
+            return Polynomial(_padded(*vectors, numpy.add))
         if isinstance(other, Polynomial):
-            max_length = max(len(self.coeff), len(other.coeff))
-            self_coeff = [0] * (max_length - len(self.coeff)) + self.coeff
-            other_coeff = [0] * (max_length - len(other.coeff)) + other.coeff
-            
+            max_length = max(len(self._values()), len(other._values()))
+            self_coeff = [0] * (max_length - len(self._values())) + self._values()
+            other_coeff = [0] * (max_length - len(other._values())) + other._values()
+
             new_coeff = [a + b for a, b in zip(self_coeff, other_coeff)]
             return Polynomial(new_coeff)
         elif isinstance(other, (int, float)):
-            new_coeff = self.coeff[:]
+            # liczba zmiennoprzecinkowa zmienia typ tylko wyrazu wolnego, więc
+            # wielomian całkowity przechodzi wtedy na listę
+            if self._vector is not None and (
+                    self._vector.dtype.kind == "f" if isinstance(other, float)
+                    else -INT64_SAFE < other < INT64_SAFE
+            ):
+                new_vector = self._vector.copy()
+                new_vector[-1] += other
+                return Polynomial(new_vector)
+            new_coeff = self._values()[:]
             new_coeff[-1] += other
             return Polynomial(new_coeff)
         return NotImplemented
@@ -75,37 +180,130 @@ class Polynomial:
         return self.__add__(other)
 
     def __sub__(self, other):
+        vectors = self._vectors(other)
+        if vectors is not None:
+            return Polynomial(_padded(*vectors, numpy.subtract))
         if isinstance(other, Polynomial):
-            max_length = max(len(self.coeff), len(other.coeff))
-            self_coeff = [0] * (max_length - len(self.coeff)) + self.coeff
-            other_coeff = [0] * (max_length - len(other.coeff)) + other.coeff
-            
+            max_length = max(len(self._values()), len(other._values()))
+            self_coeff = [0] * (max_length - len(self._values())) + self._values()
+            other_coeff = [0] * (max_length - len(other._values())) + other._values()
+
             new_coeff = [a - b for a, b in zip(self_coeff, other_coeff)]
             return Polynomial(new_coeff)
         elif isinstance(other, (int, float)):
-            new_coeff = self.coeff[:]
-            new_coeff[-1] -= other
-            return Polynomial(new_coeff)
+            return self.__add__(-other)
         return NotImplemented
 
     def __rsub__(self, other):
         if isinstance(other, (int, float)):
-            nowy_coeff = [-c for c in self.coeff]
+            if self._vector is not None:
+                return Polynomial(-self._vector) + other
+            nowy_coeff = [-c for c in self._values()]
             nowy_coeff[-1] += other
             return Polynomial(nowy_coeff)
         return NotImplemented
 
     def __mul__(self, other):
+        vectors = self._vectors(other)
+        if vectors is not None:
+            product = _vector_product(*vectors)
+            if product is not None:
+                return Polynomial(product)
         if isinstance(other, Polynomial):
-            new_coeff = [0] * (len(self.coeff) + len(other.coeff) - 1)
-            for self_i, self_c in enumerate(self.coeff):
-                for other_i, other_c in enumerate(other.coeff):
-                    new_coeff[self_i + other_i] += self_c * other_c
-            return Polynomial(new_coeff)
+            return Polynomial(multiply(self._values(), other._values()))
         elif isinstance(other, (int, float)):
-            new_coeff = [c * other for c in self.coeff]
+            if self._vector is not None and (
+                    isinstance(other, float) or self._vector.dtype.kind == "f"
+                    or abs(other) * _bound(self._vector) < INT64_LIMIT
+            ):
+                return Polynomial(self._vector * other)
+            new_coeff = [c * other for c in self._values()]
             return Polynomial(new_coeff)
         return NotImplemented
-    
+
     def __rmul__(self, other):
-        return self.__mul__(other)
\ No newline at end of file
+        return self.__mul__(other)
+
+
+def _padded(left, right, operation):
+    """Wykonuje działanie na tablicach współczynników wyrównanych do najwyższej potęgi."""
+    length = max(len(left), len(right))
+    if len(left) < length:
+        left = numpy.concatenate((numpy.zeros(length - len(left), left.dtype), left))
+    if len(right) < length:
+        right = numpy.concatenate((numpy.zeros(length - len(right), right.dtype), right))
+    return operation(left, right)
+
+
+def _fft_convolve(left, right):
+    """Splata tablice przez szybką transformatę Fouriera (wynik float64)."""
+    length = len(left) + len(right) - 1
+    size = 1 << (length - 1).bit_length()
+    spectrum = numpy.fft.rfft(left, size) * numpy.fft.rfft(right, size)
+    return numpy.fft.irfft(spectrum, size)[:length]
+
+
+def _limbs(vector, bits: int, count: int):
+    """Dzieli współczynniki całkowite na count części po bits bitów (od najmłodszej).
+
+    Wszystkie części poza najstarszą są nieujemne; najstarsza zachowuje znak.
+    """
+    limbs = []
+    for _ in range(count - 1):
+        limbs.append(vector & ((1 << bits) - 1))
+        vector = vector >> bits
+    limbs.append(vector)
+    return limbs
+
+
+def _split_fft_product(left, right, bound: int):
+    """Mnoży dokładnie tablice int64 przez FFT, dzieląc współczynniki na części.
+
+    Współczynniki są dzielone na count części o module co najwyżej 2^bits,
+    a iloczyny części są sumowane w dziedzinie częstotliwości. Liczba części
+    jest najmniejsza, przy której każdy splot części mieści się w granicy
+    dokładności FFT, a częściowe sumy - w int64. Zwraca None, gdy takiej
+    liczby części nie ma.
+    """
+    longer, shorter = max(len(left), len(right)), min(len(left), len(right))
+    width = bound.bit_length()
+    for count in range(2, 5):
+        bits = -(-width // count)
+        if (count * longer) << (2 * bits) >= FFT_EXACT_LIMIT:
+            continue
+        if (count * shorter) << (2 * bits * count + 1) >= INT64_LIMIT:
+            continue
+        length = len(left) + len(right) - 1
+        size = 1 << (length - 1).bit_length()
+        left_spectra = [numpy.fft.rfft(limb, size) for limb in _limbs(left, bits, count)]
+        right_spectra = [numpy.fft.rfft(limb, size) for limb in _limbs(right, bits, count)]
+        result = numpy.zeros(length, numpy.int64)
+        for degree in range(2 * count - 1):
+            spectrum = sum(
+                left_spectra[part] * right_spectra[degree - part]
+                for part in range(max(0, degree - count + 1), min(degree, count - 1) + 1)
+            )
+            part = numpy.rint(numpy.fft.irfft(spectrum, size)[:length]).astype(numpy.int64)
+            result += part << (bits * degree)
+        return result
+    return None
+
+
+def _vector_product(left, right):
+    """Mnoży wielomiany przechowywane w tablicach NumPy.
+
+    Zwraca None, gdy iloczynu całkowitego nie da się dokładnie policzyć
+    w int64 ani przez FFT - wtedy mnożone są listy współczynników.
+    """
+    if left.dtype.kind == "f" or right.dtype.kind == "f":
+        return numpy.convolve(left, right)
+    large = min(len(left), len(right)) >= FFT_THRESHOLD
+    bound = _bound(left) * _bound(right)
+    if bound * min(len(left), len(right)) >= INT64_LIMIT:
+        return None
+    if not large:
+        return numpy.convolve(left, right)
+    if bound * max(len(left), len(right)) < FFT_EXACT_LIMIT:
+        # błąd FFT jest wtedy dużo mniejszy niż 1/2, więc zaokrąglenie daje dokładny wynik
+        return numpy.rint(_fft_convolve(left, right)).astype(numpy.int64)
+    return _split_fft_product(left, right, max(_bound(left), _bound(right)))
@@ -0,0 +1,120 @@
+import random
+import unittest
+from fractions import Fraction
+from math import comb
+from src import multiplication, polynomial
+from src.multiplication import karatsuba, kronecker, multiply, schoolbook
+from src.polynomial import Polynomial
+
+
+class TestMultiplicationAlgorithms(unittest.TestCase):
+    """Klasa testów jednostkowych dla algorytmów mnożenia list współczynników."""
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        self.generator = random.Random(0)
+
+    def random_list(self, length, bound=1000):
+        """Zwraca losową listę współczynników całkowitych."""
+        return [self.generator.randint(-bound, bound) for _ in range(length)]
+
+    def test_schoolbook(self):
+        """Test mnożenia szkolnego na małym przykładzie."""
+        # (3x^2 + 2x + 1) * (x^2 - 1)
+        self.assertEqual(schoolbook([3, 2, 1], [1, 0, -1]), [3, 2, -2, -2, -1])
+
+    def test_karatsuba_matches_schoolbook(self):
+        """Test zgodności algorytmu Karatsuby z mnożeniem szkolnym."""
+        for length_a, length_b in [(1, 1), (31, 32), (33, 33), (100, 70), (257, 40), (40, 257), (500, 499)]:
+            a, b = self.random_list(length_a), self.random_list(length_b)
+            self.assertEqual(karatsuba(a, b), schoolbook(a, b), (length_a, length_b))
+
+    def test_karatsuba_fractions(self):
+        """Test algorytmu Karatsuby na ułamkach."""
+        a = [Fraction(c, 7) for c in self.random_list(90)]
+        b = [Fraction(c, 3) for c in self.random_list(60)]
+        self.assertEqual(karatsuba(a, b), schoolbook(a, b))
+
+    def test_kronecker_matches_schoolbook(self):
+        """Test zgodności podstawienia Kroneckera z mnożeniem szkolnym."""
+        for length_a, length_b, bound in [(1, 1, 5), (50, 20, 1), (200, 300, 1000), (64, 64, 2 ** 100)]:
+            a, b = self.random_list(length_a, bound), self.random_list(length_b, bound)
+            self.assertEqual(kronecker(a, b), schoolbook(a, b), (length_a, length_b, bound))
+
+    def test_kronecker_extreme_coefficients(self):
+        """Test podstawienia Kroneckera dla współczynników o największym module i zerach."""
+        a = [-(2 ** 63)] * 40 + [0] * 10 + [2 ** 63 - 1] * 40
+        self.assertEqual(kronecker(a, a), schoolbook(a, a))
+        self.assertEqual(kronecker([0, 0], [5, -3]), [0, 0, 0])
+
+    def test_multiply_dispatch(self):
+        """Test wyboru algorytmu według typu i rozmiaru współczynników."""
+        a, b = self.random_list(100), self.random_list(100)
+        self.assertEqual(multiply(a, b), schoolbook(a, b))
+        floats = [c / 3 for c in a]
+        # liczby zmiennoprzecinkowe są mnożone szkolnie, więc wynik jest identyczny
+        self.assertEqual(multiply(floats, b), schoolbook(floats, b))
+        mixed = a[:-1] + [Fraction(1, 2)]
+        self.assertEqual(multiply(mixed, b), schoolbook(mixed, b))
+        self.assertTrue(all(type(c) is int for c in multiply(a, b)))
+
+
+class TestPolynomialProducts(unittest.TestCase):
+    """Klasa testów mnożenia wielomianów dużych stopni."""
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        generator = random.Random(1)
+        self.a = [generator.randint(-1000, 1000) for _ in range(3000)]
+        self.b = [generator.randint(-1000, 1000) for _ in range(2000)]
+
+    def test_high_degree_product(self):
+        """Test mnożenia wielomianów stopnia kilku tysięcy."""
+        expected = kronecker(self.a, self.b)
+        self.assertEqual((Polynomial(self.a) * Polynomial(self.b)).coeff, expected)
+        self.assertEqual(expected[:3], schoolbook(self.a[:3], self.b[:3])[:3])
+
+    def test_generating_function_power(self):
+        """Test potęgowania funkcji tworzącej z rosnącymi współczynnikami."""
+        # (1 + x)^200 ma współczynniki dwumianowe przekraczające zakres int64
+        power = Polynomial([1])
+        for _ in range(200):
+            power = power * Polynomial([1] * 2)
+        square = power * power
+        self.assertEqual(square.coeff, [comb(400, k) for k in range(401)])
+
+    @unittest.skipIf(polynomial.numpy is None, "NumPy nie jest zainstalowany")
+    def test_numpy_fft_products(self):
+        """Test mnożenia tablic NumPy przez FFT."""
+        product = Polynomial(self.a) * Polynomial(self.b)
+        self.assertIsNotNone(product._vector)
+        self.assertEqual(product.coeff, kronecker(self.a, self.b))
+
+    @unittest.skipIf(polynomial.numpy is None, "NumPy nie jest zainstalowany")
+    def test_numpy_float_products_are_not_rounded_by_fft(self):
+        """Test mnożenia dużych tablic zmiennoprzecinkowych bez błędów FFT."""
+        floats = Polynomial([c / 8 for c in self.a]) * Polynomial([c / 4 for c in self.b])
+        self.assertEqual(floats.coeff, [exact / 32 for exact in kronecker(self.a, self.b)])
+        ones = Polynomial([1.0] * 300)
+        self.assertEqual((ones * ones).coeff, [float(min(k + 1, 599 - k)) for k in range(599)])
+        spread = Polynomial([1e6] + [0.0] * 198 + [1e-6])
+        self.assertEqual((spread * spread).coeff[-1], 1e-12)
+
+    @unittest.skipIf(polynomial.numpy is None, "NumPy nie jest zainstalowany")
+    def test_numpy_split_fft_product(self):
+        """Test mnożenia przez FFT z podziałem współczynników na części."""
+        a = [c * 60 for c in self.a]
+        product = Polynomial(a) * Polynomial(self.b)
+        self.assertIsNotNone(product._vector)
+        self.assertEqual(product.coeff, kronecker(a, self.b))
+
+    @unittest.skipIf(polynomial.numpy is None, "NumPy nie jest zainstalowany")
+    def test_numpy_falls_back_to_exact_product(self):
+        """Test mnożenia tablic, których iloczyn nie może być policzony dokładnie w float64."""
+        a = [c * 2 ** 40 for c in self.a]
+        product = Polynomial(a) * Polynomial(self.b)
+        self.assertEqual(product.coeff, multiplication.kronecker(a, self.b))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,19 @@
+import random
 import unittest
+from fractions import Fraction
+from src import polynomial
 from src.polynomial import Polynomial
 
 
+def schoolbook(a, b):
+    """Mnoży listy współczynników metodą szkolną (wynik wzorcowy)."""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return result
+
+
 class TestPolynomial(unittest.TestCase):
     """Klasa testów jednostkowych dla klasy Polynomial."""
 
@@ -224,5 +236,84 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(repr(p), "Polynomial([3, 2, 1])")
 
 
+class TestPolynomialBackends(unittest.TestCase):
+    """Testy zgodności wyników dla dużych wielomianów niezależnie od reprezentacji."""
+
+    def setUp(self):
+        """Przygotowuje środowisko testowe przed każdym testem."""
+        generator = random.Random(0)
+        self.a = [generator.randint(-1000, 1000) for _ in range(300)]
+        self.b = [generator.randint(-1000, 1000) for _ in range(200)]
+
+    def test_large_integer_operations(self):
+        """Test dodawania, odejmowania i mnożenia dużych wielomianów całkowitych."""
+        p1, p2 = Polynomial(self.a), Polynomial(self.b)
+        padded = [0] * 100 + self.b
+        self.assertEqual((p1 + p2).coeff, [x + y for x, y in zip(self.a, padded)])
+        self.assertEqual((p1 - p2).coeff, [x - y for x, y in zip(self.a, padded)])
+        self.assertEqual((p1 * p2).coeff, schoolbook(self.a, self.b))
+        self.assertEqual((p1 * 3).coeff, [3 * x for x in self.a])
+        self.assertEqual((7 - p1).coeff, [-x for x in self.a[:-1]] + [7 - self.a[-1]])
+        self.assertTrue(all(type(c) is int for c in (p1 * p2).coeff))
+
+    def test_big_integers_stay_exact(self):
+        """Test dokładności dla współczynników przekraczających zakres int64."""
+        a = [x * 2 ** 70 + 1 for x in self.a]
+        p = Polynomial(a) * Polynomial(self.b)
+        self.assertEqual(p.coeff, schoolbook(a, self.b))
+        self.assertEqual((Polynomial(self.a) * 2 ** 80).coeff, [x * 2 ** 80 for x in self.a])
+
+    def test_overflowing_product_stays_exact(self):
+        """Test mnożenia, którego wynik nie mieści się w int64, choć współczynniki tak."""
+        a = [2 ** 40 + x for x in self.a]
+        self.assertEqual((Polynomial(a) * Polynomial(a)).coeff, schoolbook(a, a))
+        self.assertEqual((Polynomial(a) * 2 ** 30).coeff, [x * 2 ** 30 for x in a])
+
+    def test_fractions(self):
+        """Test wielomianów o współczynnikach wymiernych."""
+        a = [Fraction(x, 7) for x in self.a]
+        p = Polynomial(a) * Polynomial(self.b) + Polynomial(self.b)
+        expected = schoolbook(a, self.b)
+        expected[-len(self.b):] = [x + y for x, y in zip(expected[-len(self.b):], self.b)]
+        self.assertEqual(p.coeff, expected)
+
+    def test_float_constant_keeps_integer_coefficients(self):
+        """Test dodania liczby zmiennoprzecinkowej do dużego wielomianu całkowitego."""
+        p = Polynomial(self.a) + 0.5
+        self.assertEqual(p.coeff[:-1], self.a[:-1])
+        self.assertTrue(all(type(c) is int for c in p.coeff[:-1]))
+        self.assertEqual(str(p), str(Polynomial(self.a[:-1] + [self.a[-1] + 0.5])))
+
+    def test_coefficient_assignment(self):
+        """Test przypisania współczynników i niezależności zwracanej listy."""
+        p = Polynomial(self.a)
+        p.coeff[0] = 1000
+        self.assertEqual(p, Polynomial(self.a))
+        p.coeff = [1000] + self.a[1:]
+        self.assertEqual(p, Polynomial([1000] + self.a[1:]))
+        self.assertEqual((p - Polynomial(self.a)).coeff, [1000 - self.a[0]] + [0] * (len(self.a) - 1))
+        self.assertTrue(str(p).startswith(f"1000x^{len(self.a) - 1}"))
+        p.coeff = [0, 0, 2, 1]
+        self.assertEqual(p.coeff, [2, 1])
+        self.assertEqual(p + 1, Polynomial([2, 2]))
+
+    def test_cancellation_to_zero(self):
+        """Test odejmowania dużego wielomianu od samego siebie."""
+        p = Polynomial(self.a)
+        self.assertEqual(p - p, Polynomial([0]))
+        self.assertEqual((p * 0).coeff, [0])
+
+    @unittest.skipIf(polynomial.numpy is None, "NumPy nie jest zainstalowany")
+    def test_numpy_representation(self):
+        """Test wyboru tablicy NumPy dla dużych wielomianów o prostych typach."""
+        self.assertIsNotNone(Polynomial(self.a)._vector)
+        self.assertIsNotNone(Polynomial([float(x) for x in self.a])._vector)
+        self.assertIsNone(Polynomial(self.a[:10])._vector)
+        self.assertIsNone(Polynomial([2 ** 70] + self.a)._vector)
+        self.assertIsNone(Polynomial([Fraction(1, 2)] + self.a)._vector)
+        self.assertIsNone(Polynomial([0.5] + self.a)._vector)
+        self.assertEqual(repr(Polynomial(polynomial.numpy.array([0, 0, 1, 2]))), "Polynomial([1, 2])")
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file